@@ -17,6 +17,22 @@ const nextConfig = {
     },
 
 
+    // Data files requested with a content-hash version (?v=<hash> from public/data/manifest.json) never change,
+    // so they can be cached indefinitely; the manifest itself must always be revalidated.
+    async headers() {
+        return [
+            {
+                source: '/data/:path*',
+                has: [{ type: 'query', key: 'v' }],
+                headers: [{ key: 'Cache-Control', value: 'public, max-age=31536000, immutable' }],
+            },
+            {
+                source: '/data/manifest.json',
+                headers: [{ key: 'Cache-Control', value: 'no-cache' }],
+            },
+        ];
+    },
+
     webpack: (config) => {
         config.module.rules.push({
             test: /\.html$/, use: 'raw-loader',
@@ -1,11 +1,89 @@
 import pandas as pd
 import numpy as np
+import argparse
+import colorsys
+import functools
+import hashlib
 import json
+import os
+import shutil
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import timedelta
 
+# orjson is optional: it serializes NumPy types natively and is much faster on large season files.
+# Without it we fall back to the standard library encoder.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import new auxiliary data processing functions
 from process_auxiliary_data import process_locations, process_thresholds, process_historical_ground_truth  # pyright: ignore[reportImplicitRelativeImport]
+from prediction_cube import HUB_QUANTILE_IDS, build_prediction_cube  # pyright: ignore[reportImplicitRelativeImport]
+from output_formats import (  # pyright: ignore[reportImplicitRelativeImport]
+    ACTIVITY_LEVELS,
+    ACTIVITY_LEVELS_FORMAT,
+    GROUND_TRUTH_COLUMNS_FORMAT,
+    LATEST_SNAPSHOT_FORMAT,
+    PAIRWISE_SKILL_FORMAT,
+    RAW_SCORES_INDEX_FILE,
+    RAW_SCORES_SHARD_PATH,
+    RAW_SCORES_SHARDS_DIR,
+    RAW_SCORES_SHARDS_FORMAT,
+    SPARSE_PREDICTION_FIELDS,
+    SPARSE_PREDICTIONS_FORMAT,
+)
+from scoring import (  # pyright: ignore[reportImplicitRelativeImport]
+    load_ground_truth_snapshots,
+    pairwise_relative_wis,
+    score_predictions,
+    score_revisions,
+    summarize_revision_scores,
+)
+
+
+# ==========================
+# === PATHOGEN PROFILES ====
+# ==========================
+# Everything that differs between the hubs we publish. Paths are relative to data_processing_dir
+# (raw data, thresholds), the project root (model config) and public/data (outputs).
+# A rateChangeTarget of None means the hub publishes no nowcast trend target; baselineModel is the
+# reference model for WIS ratios when scores are computed in the pipeline (--compute-scores).
+PATHOGEN_PROFILES = {
+    "flu": {
+        "displayName": "Influenza",
+        "hospTarget": "wk inc flu hosp",
+        "rateChangeTarget": "wk flu hosp rate change",
+        "baselineModel": "FluSight-baseline",
+        "modelConfig": "model_config.json",
+        "rawDataDir": "raw",
+        "thresholds": "thresholds.csv",
+        "outputSubdir": "",
+    },
+    "covid": {
+        "displayName": "COVID-19",
+        "hospTarget": "wk inc covid hosp",
+        "rateChangeTarget": None,
+        "baselineModel": "CovidHub-baseline",
+        "modelConfig": "model_config_covid.json",
+        "rawDataDir": "raw-covid",
+        "thresholds": "thresholds-covid.csv",
+        "outputSubdir": "covid",
+    },
+    "rsv": {
+        "displayName": "RSV",
+        "hospTarget": "wk inc rsv hosp",
+        "rateChangeTarget": None,
+        "baselineModel": "RSVHub-baseline",
+        "modelConfig": "model_config_rsv.json",
+        "rawDataDir": "raw-rsv",
+        "thresholds": "thresholds-rsv.csv",
+        "outputSubdir": "rsv",
+    },
+}
 
 
 # ========================
@@ -19,28 +97,623 @@ def get_project_root():
     return Path(__file__).resolve().parent.parent
 
 
-class NpEncoder(json.JSONEncoder):
+def _orjson_default(obj):
+    """Fallback for the few types orjson does not serialize natively (e.g. pd.Timestamp)."""
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _format_json_float(value):
+    """
+    Formats a float the way orjson does: the shortest round-trip digits, positional for decimal exponents
+    from -5 to 15 (-6 to 12 for float32) and scientific without "+" or leading zeros beyond; NaN and inf are null.
+    """
+    if not np.isfinite(value):
+        return "null"
+    if not isinstance(value, np.float32):
+        text = repr(float(value))
+        # repr is positional for [1e-4, 1e16), a range orjson also writes positionally
+        if "e" not in text:
+            return text
+        low, high = -5, 15
+    else:
+        low, high = -6, 12
+
+    mantissa, exponent = np.format_float_scientific(value, unique=True, trim="-").split("e")
+    sign = "-" if mantissa.startswith("-") else ""
+    digits = mantissa.lstrip("-").replace(".", "")
+    exponent = int(exponent)
+    if exponent < low or exponent > high:
+        fraction = f".{digits[1:]}" if len(digits) > 1 else ""
+        return f"{sign}{digits[0]}{fraction}e{exponent}"
+    if exponent < 0:
+        return f"{sign}0.{'0' * (-exponent - 1)}{digits}"
+    digits = digits.ljust(exponent + 1, "0")
+    return f"{sign}{digits[: exponent + 1]}.{digits[exponent + 1 :] or '0'}"
+
+
+def _encode_json_key(key):
+    """Formats a dict key as orjson does with OPT_NON_STR_KEYS."""
+    if isinstance(key, str):
+        return json.dumps(key, ensure_ascii=False)
+    if key is None or isinstance(key, (bool, int, float)):
+        return f'"{_encode_json(key)}"'
+    raise TypeError(f"Dict key must be a type serializable with OPT_NON_STR_KEYS: {type(key).__name__}")
+
+
+def _encode_json(obj):
+    """Standard library fallback of dumps_json, producing the same text as orjson for the types our outputs use."""
+    if isinstance(obj, str):
+        return json.dumps(obj, ensure_ascii=False)
+    if obj is None:
+        return "null"
+    if isinstance(obj, (bool, np.bool_)):
+        return "true" if obj else "false"
+    if isinstance(obj, (int, np.integer)):
+        return str(int(obj))
+    if isinstance(obj, (float, np.floating)):
+        return _format_json_float(obj)
+    if isinstance(obj, dict):
+        return "{" + ",".join(f"{_encode_json_key(key)}:{_encode_json(value)}" for key, value in obj.items()) + "}"
+    if isinstance(obj, (list, tuple)):
+        return "[" + ",".join(_encode_json(item) for item in obj) + "]"
+    if isinstance(obj, np.ndarray):
+        # Float32 elements stay NumPy scalars (tolist would widen them), so they get the float32 digits orjson writes
+        if obj.dtype == np.float32:
+            return "[" + ",".join(_encode_json(item) for item in obj) + "]"
+        return _encode_json(obj.tolist())
+    if isinstance(obj, pd.Timestamp):
+        return json.dumps(obj.isoformat())
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps_json(obj):
+    """
+    Serializes an object to compact JSON bytes, using orjson when available. The fallback writes the same bytes
+    (NaN as null, orjson's float notation), so content hashes do not depend on which library is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return _encode_json(obj).encode("utf-8")
+
+
+def write_bytes_if_changed(path, data):
+    """
+    Writes bytes to a file unless it already holds exactly the same content, and returns whether
+    it was written. The file is written to a temporary sibling first and then moved into place,
+    so readers never see a half-written file.
+    """
+    path = Path(path)
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_json(path, obj):
+    """Writes an object as compact JSON (skipped when the file content would not change)."""
+    return write_bytes_if_changed(path, dumps_json(obj))
+
+
+def content_hash(data):
+    """Returns the short content hash that versions a published file (in manifest.json and the raw-score indexes)."""
+    return hashlib.sha256(data).hexdigest()[: OutputManifest.HASH_LENGTH]
+
+
+class OutputManifest:
+    """
+    Content hashes of every file written under public/data, published as manifest.json.
+    The frontend uses the hashes to version its requests (so files can be cached as immutable)
+    and to validate its IndexedDB copies; unchanged files are not rewritten at all.
+    """
+
+    FILE_NAME = "manifest.json"
+    HASH_LENGTH = 16
+
+    def __init__(self, public_data_dir, keep_existing=False):
+        self.public_data_dir = Path(public_data_dir)
+        self.files = {}
+        self.written_count = 0
+        self.unchanged_count = 0
+
+        # Partial runs (--seasons) only rewrite some outputs: carry over the entries of the others
+        manifest_path = self.public_data_dir / self.FILE_NAME
+        if keep_existing and manifest_path.exists():
+            with open(manifest_path, "r") as f:
+                previous_files = json.load(f).get("files", {})
+            self.files = {path: entry for path, entry in previous_files.items() if (self.public_data_dir / path).exists()}
+
+    def write(self, path, obj):
+        """Writes a JSON output file and records its content hash."""
+        self.write_bytes(path, dumps_json(obj))
+
+    def write_bytes(self, path, data, listed=True):
+        """
+        Writes a binary output file and records its content hash.
+        Unlisted files are written the same way but left out of manifest.json: they are versioned by an
+        index of their own (see build_raw_score_shards), so thousands of them do not bloat the manifest.
+        """
+        if write_bytes_if_changed(path, data):
+            self.written_count += 1
+        else:
+            self.unchanged_count += 1
+
+        if listed:
+            relative_path = Path(path).relative_to(self.public_data_dir).as_posix()
+            self.files[relative_path] = {
+                "hash": content_hash(data),
+                "size": len(data),
+            }
+
+    def remove(self, path):
+        """Deletes an output file this run no longer publishes, and its manifest entry."""
+        Path(path).unlink(missing_ok=True)
+        self.files.pop(Path(path).relative_to(self.public_data_dir).as_posix(), None)
+
+    def save(self):
+        """Writes manifest.json (sorted by path, so it only changes when an output does)."""
+        manifest = {"version": 1, "files": dict(sorted(self.files.items()))}
+        write_json(self.public_data_dir / self.FILE_NAME, manifest)
+
+
+class BackgroundWriter:
+    """
+    Writes batches of outputs (e.g. one season's files) through an OutputManifest on a background thread, in the
+    order they were queued, while the caller builds the next batch. Outputs are serialized by the caller; the writer
+    compares, writes and hashes them, which releases the GIL. At most `max_pending` batches wait to be written
+    (queue() blocks when the writer falls behind), so only a few seasons of serialized outputs are held in memory.
+    The manifest must not be used by the caller until close() has returned.
+    """
+
+    def __init__(self, output_manifest, max_pending=2):
+        self.output_manifest = output_manifest
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="output-writer")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = []
+
+    def queue(self, outputs, unlisted=(), cleanup=None):
+        """
+        Serializes a batch of JSON outputs, given as (path, obj) pairs, and queues it for writing after `unlisted`
+        (path, bytes) files (see OutputManifest.write_bytes). `cleanup`, if given, runs on the writer once the batch
+        is written, e.g. to delete the files of an earlier run that the batch replaces.
+        """
+        batch = [(path, data, False) for path, data in unlisted] + [(path, dumps_json(obj), True) for path, obj in outputs]
+        self._slots.acquire()
+        future = self._executor.submit(self._write_batch, batch, cleanup)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending.append(future)
+
+    def _write_batch(self, batch, cleanup):
+        for path, data, listed in batch:
+            self.output_manifest.write_bytes(path, data, listed=listed)
+        if cleanup is not None:
+            cleanup()
+
+    def close(self):
+        """Waits for every queued batch, and raises the first write error."""
+        try:
+            for future in self._pending:
+                future.result()
+        finally:
+            self._executor.shutdown(wait=True)
+            self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # Already failing: let the queued batches finish, without masking the caller's error
+            self._executor.shutdown(wait=True)
+
+
+class DateSortedFrame:
+    """
+    A DataFrame kept sorted by one date column, so that date-range filters become
+    two binary searches (searchsorted) plus a positional slice, instead of a full
+    boolean-mask scan and copy of the whole frame for every season/period.
+    """
+
+    def __init__(self, df, date_col):
+        self.date_col = date_col
+        self.df = df.sort_values(date_col, kind="stable").reset_index(drop=True)
+        self._dates = self.df[date_col].to_numpy(dtype="datetime64[ns]")
+
+    def slice(self, start, end):
+        """Returns the rows whose date falls within [start, end] (both inclusive), without copying."""
+        lo = np.searchsorted(self._dates, np.datetime64(start, "ns"), side="left")
+        hi = np.searchsorted(self._dates, np.datetime64(end, "ns"), side="right")
+        return self.df.iloc[lo:hi]
+
+
+class DateAxis:
+    """
+    Interned ISO strings for the dates of a run: every date is formatted once, and emitters look up
+    whole date columns (iso) instead of calling strftime per row or cell. Each date keeps its integer
+    position on the axis; dates the axis was not built with are appended on first use.
+    """
+
+    def __init__(self, dates):
+        self.dates = pd.DatetimeIndex(np.unique(np.asarray(dates, dtype="datetime64[ns]")))
+        self.iso_strings = np.asarray(self.dates.strftime("%Y-%m-%d"), dtype=object)
+
+    def positions(self, dates):
+        """Returns the positions of the dates on the axis, interning the ones it does not hold yet."""
+        dates = pd.DatetimeIndex(dates)
+        positions = self.dates.get_indexer(dates)
+        if (positions < 0).any():
+            new_dates = dates[positions < 0].unique()
+            self.dates = self.dates.append(new_dates)
+            self.iso_strings = np.concatenate([self.iso_strings, np.asarray(new_dates.strftime("%Y-%m-%d"), dtype=object)])
+            positions = self.dates.get_indexer(dates)
+        return positions
+
+    def iso(self, dates):
+        """Returns the ISO strings (YYYY-MM-DD) of a column of dates, as a list."""
+        positions = self.positions(dates)
+        return self.iso_strings[positions].tolist()
+
+
+def season_date_range(season_id):
+    """
+    Returns the (start, end) reference dates of a full-range season, given as "2024-2025" or
+    "season-2024-2025". Seasons run from August 1st to July 31st.
+    """
+    years = season_id.removeprefix("season-").split("-")
+    if len(years) != 2 or not all(y.isdigit() for y in years) or int(years[1]) != int(years[0]) + 1:
+        raise ValueError(f"Invalid season '{season_id}', expected e.g. 2024-2025")
+    return pd.Timestamp(year=int(years[0]), month=8, day=1), pd.Timestamp(year=int(years[1]), month=7, day=31)
+
+
+def season_id_of(date):
+    """Returns the id ("season-YYYY-YYYY") of the full-range season a date falls in."""
+    end_year = date.year + 1 if date.month > 7 else date.year
+    return f"season-{end_year - 1}-{end_year}"
+
+
+def shard_seasons(earliest_date, newest_file_date, shard_index, shard_count):
+    """
+    Returns the seasons processed by shard `shard_index` (1-based) of `shard_count`, for --shard.
+    The seasons from `earliest_date` to `newest_file_date` are dealt out round-robin, oldest first, so every
+    shard gets a mix of old (few models) and recent (many models) seasons. The shard of the newest season
+    also takes the season after it, which a full run creates when the newest forecasts target dates past July 31st.
+    """
+    season_ids = [season_id_of(date) for date in pd.date_range(earliest_date, newest_file_date, freq="YS-AUG")]
+    if not season_ids or season_ids[0] != season_id_of(earliest_date):
+        season_ids.insert(0, season_id_of(earliest_date))
+    selected = season_ids[shard_index - 1 :: shard_count]
+    if season_ids[-1] in selected:
+        selected.append(season_id_of(newest_file_date + pd.DateOffset(years=1)))
+    return selected
+
+
+# Written by each --shard run next to its partial outputs, see merge_shard_outputs
+SHARD_INFO_FILE = "shard.json"
+
+
+def shard_output_dir(intermediate_dir, shard_index, shard_count):
+    """Returns where shard `shard_index` of `shard_count` writes its partial public/data tree."""
+    return Path(intermediate_dir) / "shards" / f"{shard_index}-of-{shard_count}"
+
+
+def prediction_file_date(csv_file):
+    """Returns the reference date in a hub file name (`YYYY-MM-DD-<model>.csv`), or None if there is none."""
+    try:
+        return pd.Timestamp(csv_file.name[:10])
+    except ValueError:
+        return None
+
+
+def select_prediction_files(model_dir, date_ranges=None):
+    """
+    Lists a model's prediction files, keeping only those whose file name date falls within one of
+    `date_ranges` ((start, end) pairs, inclusive), so unneeded files are never opened.
+    All files are kept when date_ranges is None, and so are files without a date in their name.
+    """
+    csv_files = sorted(Path(model_dir).glob("*.csv"))
+    if date_ranges is None:
+        return csv_files
+
+    selected = []
+    for csv_file in csv_files:
+        file_date = prediction_file_date(csv_file)
+        if file_date is None or any(start <= file_date <= end for start, end in date_ranges):
+            selected.append(csv_file)
+    return selected
+
+
+def discover_hub_models(model_output_dir, configured_models, baseline_model=None):
+    """
+    Lists every team with prediction files under a hub's model-output tree (one directory per team),
+    for --all-models: the configured models first, in config order, then the other teams sorted by name.
+    The baseline model is left out: it is loaded separately and only used to score the others.
+    """
+    excluded = set(configured_models) | {baseline_model}
+    model_dirs = sorted(Path(model_output_dir).iterdir()) if Path(model_output_dir).is_dir() else []
+    discovered = [d.name for d in model_dirs if d.is_dir() and d.name not in excluded and next(d.glob("*.csv"), None) is not None]
+    return list(configured_models) + discovered
+
+
+def assign_model_colors(model_names, model_color_map):
+    """
+    Returns a color for every model: its configured color, or else one from a golden-angle hue sequence,
+    so consecutive unconfigured models get well-separated hues however many there are.
+    """
+    colors = {}
+    unconfigured_count = 0
+    for model in model_names:
+        if model in model_color_map:
+            colors[model] = model_color_map[model]
+            continue
+        hue = (unconfigured_count * 0.381966) % 1.0  # golden angle, as a fraction of the color wheel
+        red, green, blue = colorsys.hls_to_rgb(hue, 0.45, 0.65)
+        colors[model] = f"#{round(red * 255):02x}{round(green * 255):02x}{round(blue * 255):02x}"
+        unconfigured_count += 1
+    return colors
+
+
+# Columns identifying one forecast in the pivoted predictions (one column per hub quantile next to them)
+PREDICTION_KEY_COLUMNS = ["reference_date", "target_end_date", "location", "model"]
+
+
+def pivot_hosp_predictions(hosp_df):
+    """
+    Pivots long hospitalization rows to one row per forecast (reference date, target date, location, model)
+    and one column per hub quantile (every hub quantile, not just the ones the charts use).
+    """
+    hosp_df = hosp_df.assign(output_type_id=hosp_df["output_type_id"].astype(str))
+    hosp_df = hosp_df[hosp_df["output_type_id"].isin(HUB_QUANTILE_IDS)]
+    if hosp_df.empty:
+        return pd.DataFrame()
+
+    preds_df = hosp_df.pivot_table(index=PREDICTION_KEY_COLUMNS, columns="output_type_id", values="value").reset_index()
+    preds_df.columns = [str(c) for c in preds_df.columns]
+    return preds_df
+
+
+def reduce_model_predictions(model_df, hosp_target, rate_change_target):
+    """
+    Reduces the raw hub rows of one model to what the pipeline keeps: its nowcast rows (rate change target,
+    for the reference date itself; None if the model never forecasts the rate change target) and its
+    hospitalization forecasts pivoted by pivot_hosp_predictions.
+    """
+    nowcast_rows = None
+    if rate_change_target is not None:
+        rate_change_rows = model_df[model_df["target"] == rate_change_target]
+        if not rate_change_rows.empty:
+            reference_dates = pd.to_datetime(rate_change_rows["reference_date"])
+            target_end_dates = pd.to_datetime(rate_change_rows["target_end_date"])
+            nowcast_rows = rate_change_rows.assign(reference_date=reference_dates, target_end_date=target_end_dates)[
+                (target_end_dates == reference_dates).to_numpy()
+            ]
+    return nowcast_rows, pivot_hosp_predictions(model_df[model_df["target"] == hosp_target])
+
+
+def combine_model_predictions(preds_dfs):
+    """
+    Concatenates per-model pivots into the frame a single pivot over every model gives:
+    rows sorted by reference date, target date, location and model, quantile columns sorted by name.
+    """
+    preds_dfs = [df for df in preds_dfs if not df.empty]
+    if not preds_dfs:
+        return pd.DataFrame()
+
+    combined = pd.concat(preds_dfs, ignore_index=True)
+    quantile_columns = sorted(c for c in combined.columns if c not in PREDICTION_KEY_COLUMNS)
+    return combined[PREDICTION_KEY_COLUMNS + quantile_columns].sort_values(PREDICTION_KEY_COLUMNS, kind="stable", ignore_index=True)
+
+
+def fill_ground_truth_gaps(gt_df, locations, start, end, freq="W-SAT"):
+    """
+    Places ground truth on a complete date x location grid with the given cadence (weekly Saturdays
+    by default), by reindexing a sorted date-indexed pivot instead of merging against a materialized grid.
+
+    Returns a dict of date-indexed frames with one column per location:
+    "admissions" and "weeklyRate" (NaN where nothing was reported) and "missing", the boolean
+    missing-value mask for admissions. Duplicate reports for a date/location keep the first one.
+    """
+    dates = pd.date_range(start=start, end=end, freq=freq, name="date")
+    reported = gt_df.drop_duplicates(subset=["date", "stateNum"], keep="first")
+    wide = reported.pivot(index="date", columns="stateNum", values=["admissions", "weeklyRate"]).sort_index()
+
+    admissions = wide["admissions"].reindex(index=dates, columns=locations)
+    weekly_rate = wide["weeklyRate"].reindex(index=dates, columns=locations)
+    return {
+        "admissions": admissions,
+        "weeklyRate": weekly_rate,
+        "missing": admissions.isna(),
+    }
+
+
+# Decimals of the published pairwise relative WIS values and ranks (see PAIRWISE_SKILL_FORMAT)
+PAIRWISE_SKILL_DECIMALS = 4
+
+
+def prediction_interval_values(preds_df):
+    """
+    Returns the median and interval bounds of wide prediction rows (one column per quantile) as a float array
+    with one column per field of SPARSE_PREDICTION_FIELDS[4:]. Bounds are 0.0 where the quantile is missing
+    (PI90 low and PI95 high are gated on the 0.025 and 0.95 quantiles, as in the nested format this replaces).
+    """
+
+    def bound(level, present_level=None):
+        present = preds_df[present_level or level].notna().to_numpy()
+        return np.where(present, preds_df[level].to_numpy(dtype=float), 0.0)
+
+    bounds = [bound("0.5"), bound("0.25"), bound("0.75"), bound("0.05", "0.025"), bound("0.95"), bound("0.025"), bound("0.975", "0.95")]
+    return np.column_stack(bounds) if len(preds_df) else np.empty((0, len(bounds)))
+
+
+def encode_prediction_rows(preds_df, date_axis):
+    """
+    Encodes wide prediction rows (one column per quantile) as sparse predictionsData rows laid out as
+    SPARSE_PREDICTION_FIELDS, with the reference and target dates as offsets into the season's date axis.
+    """
+    columns = [
+        date_axis.get_indexer(preds_df["reference_date"]).tolist(),
+        preds_df["location"].tolist(),
+        date_axis.get_indexer(preds_df["target_end_date"]).tolist(),
+        preds_df["horizon"].astype(int).tolist(),
+    ]
+    columns += prediction_interval_values(preds_df).T.tolist()
+    return [list(row) for row in zip(*columns)]
+
+
+def classify_activity_levels(rates, medium, high):
+    """
+    Classifies weekly rates (per 100k) into ACTIVITY_LEVELS codes, against thresholds that broadcast with them,
+    as the nowcast thermometer does: High from the high threshold on, then Medium, then Low for any positive
+    rate. Missing or non-positive rates, and locations without a medium or high threshold (NaN), are No Data.
+    """
+    rates = np.asarray(rates, dtype=float)
+    with np.errstate(invalid="ignore"):
+        levels = np.select([rates >= high, rates >= medium, rates > 0], [3, 2, 1], 0)
+    return np.where(np.isnan(medium) | np.isnan(high), 0, levels).astype(np.uint8)
+
+
+def encode_level_strings(levels):
+    """Encodes a 2-D array of ACTIVITY_LEVELS codes as one string of digits per row."""
+    digits = np.ascontiguousarray(levels, dtype=np.uint8) + ord("0")
+    return [row.tobytes().decode("ascii") for row in digits]
+
+
+def build_latest_snapshot(season_id, selected_date, season_predictions, season_ground_truth, season_nowcasts):
+    """
+    Builds latest.json, what the forecasts page draws first: for every model, its forecasts from its latest
+    reference date and its nowcasts on its latest date (both up to the default selected date, an ISO string),
+    next to the season's ground truth columns. Forecasts keep the predictionsData layout and date axis, so
+    the file stays small however long the season runs, and decodes like a season file.
+    """
+    predictions = {key: value for key, value in season_predictions.items() if key != "models"}
+    predictions["models"] = {}
+    dates = season_predictions.get("dates", [])
+    for model_name, model_data in season_predictions.get("models", {}).items():
+        partitions = model_data["partitions"]
+        ref_indices = [row[0] for rows in partitions.values() for row in rows if dates[row[0]] <= selected_date]
+        latest_ref_index = max(ref_indices, default=None)
+        predictions["models"][model_name] = {
+            **model_data,
+            "partitions": {name: [row for row in rows if row[0] == latest_ref_index] for name, rows in partitions.items()},
+        }
+
+    nowcasts = {}
+    for model_name, model_nowcasts in season_nowcasts.items():
+        latest_date = max((date for date in model_nowcasts if date <= selected_date), default=None)
+        if latest_date is not None:
+            nowcasts[model_name] = {latest_date: model_nowcasts[latest_date]}
+
+    return {
+        "format": LATEST_SNAPSHOT_FORMAT,
+        "seasonId": season_id,
+        "selectedDate": selected_date,
+        "predictionsData": predictions,
+        "groundTruthData": season_ground_truth,
+        "nowcastTrendsData": nowcasts,
+    }
+
+
+def build_raw_score_shards(season_raw_scores):
+    """
+    Splits a season's raw scores (metric -> model -> location -> horizon -> entries) into one file per model and
+    location, holding {"rawScores": metric -> horizon -> entries}: what the Single Model view shows at a time.
+    Returns the index (content hash of every shard, by model and location) and the serialized shards by path.
+    """
+    shards = {}
+    for metric, metric_scores in season_raw_scores.items():
+        for model, model_scores in metric_scores.items():
+            for location, location_scores in model_scores.items():
+                shards.setdefault((model, location), {})[metric] = location_scores
+
+    index = {"format": RAW_SCORES_SHARDS_FORMAT, "path": RAW_SCORES_SHARD_PATH, "models": {}}
+    payloads = {}
+    for (model, location), shard in shards.items():
+        data = dumps_json({"rawScores": shard})
+        index["models"].setdefault(model, {})[location] = content_hash(data)
+        payloads[RAW_SCORES_SHARD_PATH.format(model=model, location=location)] = data
+    return index, payloads
+
+
+def remove_stale_raw_score_shards(season_dir, output_manifest, shard_paths=None):
+    """
+    Deletes the split raw score files of a season folder that the current run did not write: the index and the whole
+    shard tree when raw scores were not split (shard_paths is None), else the shards of models or states without scores.
+    """
+    season_dir = Path(season_dir)
+    shards_dir = season_dir / RAW_SCORES_SHARDS_DIR
+    if shard_paths is None:
+        output_manifest.remove(season_dir / RAW_SCORES_INDEX_FILE)
+        shutil.rmtree(shards_dir, ignore_errors=True)
+        return
+    if not shards_dir.is_dir():
+        return
+
+    kept_paths = {season_dir / shard_path for shard_path in shard_paths}
+    for path in shards_dir.rglob("*.json"):
+        if path not in kept_paths:
+            path.unlink()
+    for model_dir in shards_dir.iterdir():
+        if model_dir.is_dir() and not any(model_dir.iterdir()):
+            model_dir.rmdir()
+
+
+def _rounded_or_none(values):
+    """Rounds an array of floats for publishing, with None where it holds NaN (as nested lists)."""
+    values = np.round(values, PAIRWISE_SKILL_DECIMALS)
+    return np.where(np.isfinite(values), values, None).tolist()
+
+
+def build_pairwise_skill_tables(period_wis_df, model_names, state_order, baseline_model):
     """
-    A custom JSON encoder to handle special data types from Numpy and Pandas
-    that the default JSON library cannot serialize.
+    Computes pairwise relative WIS and model ranks for one season or dynamic period, per state and horizon,
+    from its WIS/Baseline scores (see pairwise_relative_wis). The scores are laid out once as an aligned
+    (state x horizon, reference date, model) array, so every comparison comes from the same batched products.
+    Lists are in the order of "models" (the models with scores in the period, in config order).
     """
+    scores = period_wis_df.drop_duplicates(subset=["model", "stateNum", "horizon", "reference_date"], keep="last")
+    present_models = set(scores["model"].unique())
+    models = [m for m in model_names if m in present_models]
+    present_states = set(scores["stateNum"].unique())
+    states = [s for s in state_order if s in present_states]
+    horizons = sorted(scores["horizon"].unique().tolist())
+    scores = scores[scores["stateNum"].isin(states)]
+
+    state_index = pd.Index(states).get_indexer(scores["stateNum"])
+    horizon_index = pd.Index(horizons).get_indexer(scores["horizon"])
+    date_index, reference_dates = pd.factorize(scores["reference_date"])
+    model_index = pd.Index(models).get_indexer(scores["model"])
+
+    wis_ratios = np.full((len(states) * len(horizons), len(reference_dates), len(models)), np.nan)
+    wis_ratios[state_index * len(horizons) + horizon_index, date_index, model_index] = scores["score"].to_numpy(dtype=float)
+    pairwise, shared, relative, ranks = pairwise_relative_wis(wis_ratios)
+
+    tables = {"relativeWis": {}, "ranks": {}, "pairwise": {}, "sharedTargets": {}}
+    pairwise, relative = _rounded_or_none(pairwise), _rounded_or_none(relative)
+    shared, ranks = shared.tolist(), ranks.tolist()
+    for group, (state, horizon) in enumerate((state, horizon) for state in states for horizon in horizons):
+        if not any(ranks[group]):
+            continue
+        tables["relativeWis"].setdefault(state, {})[horizon] = relative[group]
+        tables["ranks"].setdefault(state, {})[horizon] = ranks[group]
+        tables["pairwise"].setdefault(state, {})[horizon] = pairwise[group]
+        tables["sharedTargets"].setdefault(state, {})[horizon] = shared[group]
 
-    def default(self, obj):
-        if isinstance(obj, np.integer):
-            return int(obj)
-        if isinstance(obj, np.floating):
-            return float(obj)
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        if isinstance(obj, pd.Timestamp):
-            return obj.isoformat()
-        return super(NpEncoder, self).default(obj)
+    return {"format": PAIRWISE_SKILL_FORMAT, "baselineModel": baseline_model, "models": models, **tables}
 
 
 def calculate_boxplot_stats(series):
     """
     Calculates all required statistics for a box plot from a pandas Series.
     Returns None if the series is empty or contains only NaN values.
+    The source values are not included (see the iqrStateAverages table written in Step 7).
     """
     if series.empty:
         return None
@@ -50,21 +723,24 @@ def calculate_boxplot_stats(series):
     if clean_series.empty:
         return None
 
-    q = np.percentile(clean_series, [5, 25, 50, 75, 95])
+    q = np.percentile(clean_series, [5, 25, 50, 75, 95]).tolist()
     return {
         "q05": q[0],
         "q25": q[1],
         "median": q[2],
         "q75": q[3],
         "q95": q[4],
-        "min": clean_series.min(),
-        "max": clean_series.max(),
-        "mean": clean_series.mean(),
+        "min": float(clean_series.min()),
+        "max": float(clean_series.max()),
+        "mean": float(clean_series.mean()),
         "count": len(clean_series),
-        "source_scores": clean_series.tolist(),
     }
 
 
+# Decimals kept for the per-state averages behind each IQR box (charts display 3)
+STATE_AVERAGE_DECIMALS = 4
+
+
 # Generate all possible horizon combinations
 def generate_horizon_combinations(horizons):
     """Generate all possible combinations of horizons"""
@@ -77,22 +753,64 @@ def generate_horizon_combinations(horizons):
     return all_combinations
 
 
+def load_shared_inputs(data_processing_dir, profiles):
+    """
+    Loads and processes the inputs shared by every pathogen run: locations, and thresholds
+    (once per distinct thresholds file). Missing threshold files are left out; the pathogen
+    run that needs one reports it.
+    """
+    locations_df = pd.read_csv(data_processing_dir / "locations.csv", dtype={"location": str})
+    locations_df = locations_df.loc[:, ~locations_df.columns.str.contains("^Unnamed")]  # Remove empty columns
+
+    thresholds_by_file = {}
+    for profile in profiles.values():
+        thresholds_file = profile["thresholds"]
+        thresholds_path = data_processing_dir / thresholds_file
+        if thresholds_file not in thresholds_by_file and thresholds_path.exists():
+            thresholds_df = pd.read_csv(thresholds_path, dtype={"Location": str})
+            thresholds_by_file[thresholds_file] = process_thresholds(thresholds_df)
+
+    return {
+        "locations_df": locations_df,
+        "locations_list": process_locations(locations_df),
+        "thresholds_by_file": thresholds_by_file,
+    }
+
+
 # ==================================
-# ======== MAIN PROCESSING =========
+# ======== PIPELINE STAGES =========
 # ==================================
-def main():
-    project_root = get_project_root()
-    data_processing_dir = project_root / "data_processing_dir"
-    raw_data_dir = data_processing_dir / "raw"
-    public_data_dir = project_root / "public" / "data"
-    print("----- Starting Full Data Pre-Processing -----")
+# The pipeline runs as named stages (see PIPELINE_STAGES). Each stage reads what it needs from the
+# pipeline state and returns its outputs, which run_pathogen_pipeline adds to the state and caches in
+# intermediate/<pathogen>/stages, so later runs can rerun only some stages (--only / --from).
+
+
+def run_ingest_stage(state):
+    """
+    Steps 1-2: loads the hub's ground truth, evaluation scores, model config and prediction files, then
+    extracts nowcasts and pivots the hospitalization predictions. Returns None on fatal input errors.
+    """
+    profile = state["profile"]
+    shared_inputs = state["shared_inputs"]
+    project_root = state["project_root"]
+    compute_scores = state["compute_scores"]
+    score_revisions_mode = state["score_revisions_mode"]
+    seasons = state["seasons"]
+    season_ranges = state["season_ranges"]
+    data_processing_dir = state["data_processing_dir"]
+    raw_data_dir = state["raw_data_dir"]
+    intermediate_dir = state["intermediate_dir"]
+    hosp_target = state["hosp_target"]
+    rate_change_target = state["rate_change_target"]
+    all_models = state["all_models"]
+    shard = state["shard"]
+
+    # Scores are only read here when they are not computed from the predictions (Step 3b)
+    wis_df = mape_df = coverage_df = None
 
     # ===== 1. Get All Data From Sources =====
     print("Step 1: Ingesting all data from sources...")
     try:
-        # Load static data files from the new raw data directory
-        locations_df = pd.read_csv(data_processing_dir / "locations.csv", dtype={"location": str})
-        locations_df = locations_df.loc[:, ~locations_df.columns.str.contains("^Unnamed")]  # Remove empty columns
 
         gt_df = pd.read_csv(
             raw_data_dir / "ground-truth/target-hospital-admissions.csv",
@@ -100,21 +818,24 @@ def main():
             dtype={"location": str},
         )
 
-        thresholds_df = pd.read_csv(data_processing_dir / "thresholds.csv", dtype={"Location": str})
+        thresholds_dict = shared_inputs["thresholds_by_file"].get(profile["thresholds"])
+        if thresholds_dict is None:
+            raise FileNotFoundError(data_processing_dir / profile["thresholds"])
 
         # Load historical ground truth data
         historical_gt_path = raw_data_dir / "ground-truth" / "historical-data"
         historical_data_map = process_historical_ground_truth(historical_gt_path)
         print(f"   - Processed {len(historical_data_map)} historical ground truth snapshots")
 
-        # Load evaluation score data
-        eval_score_dir = raw_data_dir / "evaluations-score"
-        wis_df = pd.read_csv(eval_score_dir / "WIS_ratio.csv", dtype={"location": str, "horizon": int})
-        mape_df = pd.read_csv(eval_score_dir / "MAPE.csv", dtype={"Location": str, "horizon": int})
-        coverage_df = pd.read_csv(eval_score_dir / "coverage.csv", dtype={"location": str, "horizon": int})
+        # Load evaluation score data (unless it is computed from the predictions in Step 3b)
+        if not compute_scores:
+            eval_score_dir = raw_data_dir / "evaluations-score"
+            wis_df = pd.read_csv(eval_score_dir / "WIS_ratio.csv", dtype={"location": str, "horizon": int})
+            mape_df = pd.read_csv(eval_score_dir / "MAPE.csv", dtype={"Location": str, "horizon": int})
+            coverage_df = pd.read_csv(eval_score_dir / "coverage.csv", dtype={"location": str, "horizon": int})
 
         # Load model configuration from centralized config file (at project root)
-        config_path = get_project_root() / "model_config.json"
+        config_path = project_root / profile["modelConfig"]
         with open(config_path, "r") as f:
             model_config = json.load(f)
 
@@ -125,15 +846,44 @@ def main():
 
         print(f"   - Loaded {len(model_names)} models from config: {', '.join(model_names)}")
 
+        # Hub-scale mode: every team in the model-output tree, the ones missing from the config get a default color
+        if all_models:
+            configured_count = len(model_names)
+            model_names = discover_hub_models(raw_data_dir / "unprocessed", model_names, profile["baselineModel"])
+            model_color_map = assign_model_colors(model_names, model_color_map)
+            print(f"   - Discovered {len(model_names) - configured_count} more teams in the hub ({len(model_names)} models in total)")
+
         # ====== Load Prediction Data =====
         # Note: New format (unprocessed) vs Archive format have different headers
         # We need to process them separately then combine
 
+        # Prediction files are selected by the reference date in their names (all of them unless --seasons is given)
+        model_dirs = [raw_data_dir / f"unprocessed/{model}" for model in model_names]
+        model_dirs += [raw_data_dir / f"archive/{model}" for model in archive_models]
+        newest_file_date = None
+        if season_ranges is not None or shard is not None:
+            file_dates = [prediction_file_date(f) for model_dir in model_dirs for f in model_dir.glob("*.csv")]
+            newest_file_date = max((d for d in file_dates if d is not None), default=None)
+            if shard is not None:
+                # A shard runs like --seasons, on the seasons dealt to it from the whole range of the hub
+                seasons = shard_seasons(gt_df.loc[gt_df["value"].notna(), "date"].min(), newest_file_date, *shard)
+                if not seasons:
+                    print(f"FATAL ERROR: Shard {shard[0]}/{shard[1]} has no seasons to process, use fewer shards")
+                    return None
+                season_ranges = [season_date_range(season) for season in seasons]
+            selected_count = sum(len(select_prediction_files(model_dir, season_ranges)) for model_dir in model_dirs)
+            print(f"   - Season filter {', '.join(seasons)}: reading {selected_count} of {len(file_dates)} prediction files")
+
         # Load "unprocessed" (new format) prediction files
-        unprocessed_dfs = []
+        # Each model is reduced to its nowcast rows and pivoted hospitalization forecasts as soon as it is read
+        # (see reduce_model_predictions), so memory grows with the forecasts we keep, not with every raw row of every team
+        unprocessed_row_count = 0
+        nowcast_source_dfs = []
+        models_with_nowcast = []
+        unprocessed_preds_dfs = []
         for model in model_names:
             model_path = raw_data_dir / f"unprocessed/{model}"
-            csv_files = list(model_path.glob("*.csv"))
+            csv_files = select_prediction_files(model_path, season_ranges)
             if not csv_files:
                 print(f"   - No unprocessed files found for {model}")
                 continue
@@ -144,15 +894,20 @@ def main():
                 ignore_index=True,
             )
             model_df["model"] = model
-            unprocessed_dfs.append(model_df)
+            unprocessed_row_count += len(model_df)
 
-        unprocessed_df = pd.concat(unprocessed_dfs, ignore_index=True) if unprocessed_dfs else pd.DataFrame()
+            nowcast_rows, model_preds_df = reduce_model_predictions(model_df, hosp_target, rate_change_target)
+            if nowcast_rows is not None:
+                models_with_nowcast.append(model)
+                nowcast_source_dfs.append(nowcast_rows)
+            unprocessed_preds_dfs.append(model_preds_df)
 
         # Load "archive" (old format) prediction files
-        archive_dfs = []
+        archive_row_count = 0
+        archive_preds_dfs = []
         for model in archive_models:
             archive_path = raw_data_dir / f"archive/{model}"
-            csv_files = list(archive_path.glob("*.csv"))
+            csv_files = select_prediction_files(archive_path, season_ranges)
             if not csv_files:
                 print(f"   - No archive files found for {model}")
                 continue
@@ -167,20 +922,32 @@ def main():
             # But add it if missing for safety
             if "model" not in model_df.columns:
                 model_df["model"] = model
-
-            archive_dfs.append(model_df)
-
-        archive_df = pd.concat(archive_dfs, ignore_index=True) if archive_dfs else pd.DataFrame()
-
-        print(f"   - Loaded {len(unprocessed_df)} rows from 'unprocessed' files")
-        print(f"   - Loaded {len(archive_df)} rows from 'archive' files")
+            archive_row_count += len(model_df)
+
+            # Archive files hold no nowcast trends, only hospitalization forecasts
+            archive_preds_dfs.append(pivot_hosp_predictions(model_df[model_df["target"] == hosp_target]))
+
+        print(f"   - Loaded {unprocessed_row_count} rows from 'unprocessed' files")
+        print(f"   - Loaded {archive_row_count} rows from 'archive' files")
+
+        # Baseline model predictions are only needed to compute WIS ratios, and are kept apart from the published models
+        baseline_df = pd.DataFrame()
+        if compute_scores or score_revisions_mode:
+            baseline_files = select_prediction_files(raw_data_dir / f"unprocessed/{profile['baselineModel']}", season_ranges)
+            if baseline_files:
+                baseline_df = pd.concat(
+                    (pd.read_csv(f, low_memory=False, dtype={"location": str}) for f in baseline_files),
+                    ignore_index=True,
+                )
+                baseline_df["model"] = profile["baselineModel"]
+            print(f"   - Loaded {len(baseline_df)} rows of baseline ({profile['baselineModel']}) predictions for scoring")
 
     except FileNotFoundError as e:
         print(f"FATAL ERROR: A required data file was not found: {e}")
-        return
+        return None
     except Exception as e:
         print(f"FATAL ERROR: Error loading data files: {e}")
-        return
+        return None
 
     # ===== 2. Extract Nowcasts & Process Predictions =====
     print("Step 2: Processing data by source type...")
@@ -192,26 +959,16 @@ def main():
     print("   - Extracting and processing nowcast trends...")
     all_nowcasts_df = pd.DataFrame()
 
-    if not unprocessed_df.empty:
-        # Dynamically discover which models have nowcast data (rate change predictions)
-        # by scanning the actual data for "wk flu hosp rate change" target
-        if "target" in unprocessed_df.columns and "model" in unprocessed_df.columns:
-            models_with_nowcast = unprocessed_df[unprocessed_df["target"] == "wk flu hosp rate change"]["model"].unique().tolist()
-            nowcast_models = [m for m in models_with_nowcast if m in model_names]
-            nowcast_models.sort()  # Sort for consistency
-            print(f"INFO: Discovered {len(nowcast_models)} models with nowcast capability: {', '.join(nowcast_models)}")
-        else:
-            print("Warning: No Nowcast models found.")
+    if rate_change_target is not None:
+        # Models with nowcast data are discovered from the actual data: the ones that forecast the
+        # rate change target (e.g. "wk flu hosp rate change") at all
+        nowcast_models = sorted(models_with_nowcast)  # Sort for consistency
+        print(f"INFO: Discovered {len(nowcast_models)} models with nowcast capability: {', '.join(nowcast_models)}")
 
-        # Filter for nowcast data: rate change target where target_end_date == reference_date
-        nowcast_trends_df = unprocessed_df[(unprocessed_df["target"] == "wk flu hosp rate change") & (unprocessed_df["model"].isin(nowcast_models))].copy()
+        # Nowcast data: rate change target where target_end_date == reference_date (filtered per model while loading)
+        nowcast_trends_df = pd.concat(nowcast_source_dfs, ignore_index=True) if nowcast_source_dfs else pd.DataFrame()
 
         if not nowcast_trends_df.empty:
-            # Convert dates and filter for nowcast (same date predictions)
-            nowcast_trends_df["reference_date"] = pd.to_datetime(nowcast_trends_df["reference_date"])
-            nowcast_trends_df["target_end_date"] = pd.to_datetime(nowcast_trends_df["target_end_date"])
-            nowcast_trends_df = nowcast_trends_df[nowcast_trends_df["target_end_date"] == nowcast_trends_df["reference_date"]].copy()
-
             # Clean up output type IDs (remove "large_" prefix if present)
             nowcast_trends_df["output_type_id"] = nowcast_trends_df["output_type_id"].str.removeprefix("large_")
 
@@ -230,61 +987,21 @@ def main():
             all_nowcasts_df = all_nowcasts_df.fillna(0)
             print(f"   - Processed nowcast trends. Shape: {all_nowcasts_df.shape}")
         else:
-            print("   - No nowcast data ('wk flu hosp rate change') found in source files")
+            print(f"   - No nowcast data ('{rate_change_target}') found in source files")
+    del nowcast_source_dfs
 
-    # --- B) Process UNPROCESSED Hospitalization Predictions ---
+    # --- B) Combine UNPROCESSED Hospitalization Predictions (pivoted per model while loading) ---
     print("   - Processing unprocessed hospitalization predictions...")
-    processed_unprocessed_preds_df = pd.DataFrame()
-
-    if not unprocessed_df.empty:
-        # Filter for hospitalization predictions
-        hosp_preds_df = unprocessed_df[unprocessed_df["target"] == "wk inc flu hosp"].copy()
-        hosp_preds_df["output_type_id"] = hosp_preds_df["output_type_id"].astype(str)
+    processed_unprocessed_preds_df = combine_model_predictions(unprocessed_preds_dfs)
+    if not processed_unprocessed_preds_df.empty:
+        print(f"   - Processed unprocessed predictions. Shape: {processed_unprocessed_preds_df.shape}")
 
-        # Keep only desired quantiles
-        desired_quantiles = ["0.025", "0.05", "0.25", "0.5", "0.75", "0.95", "0.975"]
-        hosp_preds_df = hosp_preds_df[hosp_preds_df["output_type_id"].isin(desired_quantiles)]
-
-        if not hosp_preds_df.empty:
-            # Pivot to get quantile columns
-            processed_unprocessed_preds_df = hosp_preds_df.pivot_table(
-                index=["reference_date", "target_end_date", "location", "model"],
-                columns="output_type_id",
-                values="value",
-            ).reset_index()
-
-            # Ensure column names are strings
-            processed_unprocessed_preds_df.columns = [str(c) for c in processed_unprocessed_preds_df.columns]
-            print(f"   - Processed unprocessed predictions. Shape: {processed_unprocessed_preds_df.shape}")
-
-    # --- C) Process ARCHIVE Hospitalization Predictions ---
+    # --- C) Combine ARCHIVE Hospitalization Predictions ---
     print("   - Processing archive hospitalization predictions...")
-    processed_archive_preds_df = pd.DataFrame()
-
-    if not archive_df.empty:
-        # Archive data should already be in the correct format after pre-processing
-
-        # Filter for hospitalization predictions
-        hosp_archive_df = archive_df[archive_df["target"] == "wk inc flu hosp"].copy()
-
-        # Ensure output_type_id is string
-        hosp_archive_df["output_type_id"] = hosp_archive_df["output_type_id"].astype(str)
-
-        # Keep only desired quantiles
-        desired_quantiles = ["0.025", "0.05", "0.25", "0.5", "0.75", "0.95", "0.975"]
-        hosp_archive_df = hosp_archive_df[hosp_archive_df["output_type_id"].isin(desired_quantiles)]
-
-        if not hosp_archive_df.empty:
-            # Pivot to get quantile columns
-            processed_archive_preds_df = hosp_archive_df.pivot_table(
-                index=["reference_date", "target_end_date", "location", "model"],
-                columns="output_type_id",
-                values="value",
-            ).reset_index()
-
-            # Ensure column names are strings
-            processed_archive_preds_df.columns = [str(c) for c in processed_archive_preds_df.columns]
-            print(f"   - Processed archive predictions. Shape: {processed_archive_preds_df.shape}")
+    processed_archive_preds_df = combine_model_predictions(archive_preds_dfs)
+    if not processed_archive_preds_df.empty:
+        print(f"   - Processed archive predictions. Shape: {processed_archive_preds_df.shape}")
+    del unprocessed_preds_dfs, archive_preds_dfs
 
     # --- D) Combine All Prediction DataFrames ---
     print("   - Combining prediction data...")
@@ -292,7 +1009,18 @@ def main():
 
     if all_preds_df.empty:
         print("FATAL ERROR: No valid hospitalization prediction data found after processing")
-        return
+        return None
+
+    # --- D2) Write Memory-Mapped Prediction Cube ---
+    # Canonical store of every hub quantile: reference date x horizon x location x model x quantile.
+    # Season-filtered runs (--seasons, --shard) only read part of the files, so they leave the cube of the last full run
+    prediction_cube_dir = intermediate_dir / "prediction-cube"
+    if season_ranges is None:
+        print("   - Writing memory-mapped prediction cube...")
+        cube_shape = build_prediction_cube(all_preds_df, prediction_cube_dir, model_names)
+        print(f"   - Prediction cube written to {prediction_cube_dir}. Shape: {cube_shape}")
+    else:
+        print(f"   - Season filter: keeping the prediction cube of the last full run in {prediction_cube_dir}")
 
     # --- E) Final Processing for Predictions ---
     print("   - Final prediction data processing...")
@@ -326,6 +1054,44 @@ def main():
     gt_df = gt_df[["date", "stateNum", "admissions", "weeklyRate"]].copy()
     gt_df.dropna(subset=["admissions"], inplace=True)
 
+    return {
+        "gt_df": gt_df,
+        "thresholds_dict": thresholds_dict,
+        "historical_data_map": historical_data_map,
+        "historical_gt_path": historical_gt_path,
+        "wis_df": wis_df,
+        "mape_df": mape_df,
+        "coverage_df": coverage_df,
+        "model_names": model_names,
+        "model_color_map": model_color_map,
+        "newest_file_date": newest_file_date,
+        "seasons": seasons,
+        "season_ranges": season_ranges,
+        "baseline_df": baseline_df,
+        "nowcast_models": nowcast_models,
+        "all_nowcasts_df": all_nowcasts_df,
+        "all_preds_df": all_preds_df,
+    }
+
+
+def run_ground_truth_stage(state):
+    """Step 3: puts the ground truth on the complete date x location grid, and scores predictions against it (3b, optional)."""
+    profile = state["profile"]
+    compute_scores = state["compute_scores"]
+    score_revisions_mode = state["score_revisions_mode"]
+    season_ranges = state["season_ranges"]
+    locations_df = state["locations_df"]
+    hosp_target = state["hosp_target"]
+    gt_df = state["gt_df"]
+    historical_gt_path = state["historical_gt_path"]
+    wis_df = state["wis_df"]
+    mape_df = state["mape_df"]
+    coverage_df = state["coverage_df"]
+    newest_file_date = state["newest_file_date"]
+    baseline_df = state["baseline_df"]
+    all_nowcasts_df = state["all_nowcasts_df"]
+    all_preds_df = state["all_preds_df"]
+
     # ===== 3. Fix Ground Truth Data (Add Missing Saturdays) =====
     print("Step 3: Fixing ground truth data (adding missing Saturdays)...")
 
@@ -335,24 +1101,83 @@ def main():
 
     earliest_date = all_gt_dates.min()
     latest_date = all_pred_dates.max()
+    if newest_file_date is not None:
+        # Season filter: keep the season layout of a full run even when the newest files were not read
+        latest_date = max(latest_date, newest_file_date)
+    writes_shared_outputs = season_ranges is None or any(start <= latest_date <= end for start, end in season_ranges)
 
     print(f"   - Overall date range: {earliest_date.strftime('%Y-%m-%d')} to {latest_date.strftime('%Y-%m-%d')}")
 
-    # Generate complete Saturday sequence
-    full_date_range = pd.date_range(start=earliest_date, end=latest_date, freq="W-SAT")
+    # Put ground truth on the complete Saturday x location grid; gaps are tracked by the missing mask
     all_locations = locations_df["location"].unique()
+    gt_grid = fill_ground_truth_gaps(gt_df, all_locations, earliest_date, latest_date, freq="W-SAT")
+    gt_grid_dates = gt_grid["admissions"].index
+
+    print(f"   - Ground truth fixed. Grid: {gt_grid['admissions'].shape}, missing values: {int(gt_grid['missing'].to_numpy().sum())}")
+
+    # Every date the later steps emit, formatted once for all of them
+    nowcast_dates = all_nowcasts_df["reference_date"] if not all_nowcasts_df.empty else []
+    date_axis = DateAxis(np.concatenate([np.asarray(dates, dtype="datetime64[ns]") for dates in (gt_grid_dates, all_pred_dates, nowcast_dates)]))
+
+    # ===== 3b. Score Predictions (optional) =====
+    if compute_scores or score_revisions_mode:
+        print("Step 3b: Scoring predictions against ground truth...")
+        baseline_preds_df = pd.DataFrame()
+        if not baseline_df.empty:
+            baseline_hosp_df = baseline_df[baseline_df["target"] == hosp_target].copy()
+            baseline_hosp_df["output_type_id"] = baseline_hosp_df["output_type_id"].astype(str)
+            baseline_hosp_df = baseline_hosp_df[baseline_hosp_df["output_type_id"].isin(HUB_QUANTILE_IDS)]
+            if not baseline_hosp_df.empty:
+                baseline_preds_df = baseline_hosp_df.pivot_table(
+                    index=["reference_date", "target_end_date", "location", "model"],
+                    columns="output_type_id",
+                    values="value",
+                ).reset_index()
+                baseline_preds_df["reference_date"] = pd.to_datetime(baseline_preds_df["reference_date"])
+                baseline_preds_df["target_end_date"] = pd.to_datetime(baseline_preds_df["target_end_date"])
+                baseline_preds_df["horizon"] = (baseline_preds_df["target_end_date"] - baseline_preds_df["reference_date"]).dt.days // 7
+        else:
+            print(f"   - WARNING: No baseline ({profile['baselineModel']}) predictions found, WIS ratios cannot be computed")
+
+    if compute_scores:
+        wis_df, mape_df, coverage_df = score_predictions(all_preds_df, gt_grid, baseline_preds_df)
+        print(f"   - Scored predictions: {len(wis_df)} WIS ratios, {len(mape_df)} MAPE, {len(coverage_df)} coverage rows")
+
+    # Revision-aware scores: every forecast against the ground truth as first reported, a week later, and in the latest snapshot
+    revision_scores = None
+    if score_revisions_mode:
+        gt_snapshots = load_ground_truth_snapshots(historical_gt_path, sorted(all_locations))
+        if gt_snapshots is None:
+            print("   - WARNING: No ground truth snapshots found, revision-aware scores are skipped")
+        else:
+            revision_scores = score_revisions(all_preds_df, gt_snapshots, baseline_preds_df)
+            print(
+                f"   - Scored predictions against {len(revision_scores)} ground truth vintages "
+                f"from {len(gt_snapshots['snapshots'])} snapshots: {len(next(iter(revision_scores.values()))[2])} forecasts per vintage"
+            )
 
-    # Create complete grid of dates x locations
-    complete_grid = pd.MultiIndex.from_product([full_date_range, all_locations], names=["date", "stateNum"])
-    complete_gt_df = pd.DataFrame(index=complete_grid).reset_index()
-
-    # Merge with existing ground truth data
-    gt_df_fixed = pd.merge(complete_gt_df, gt_df, on=["date", "stateNum"], how="left")
+    return {
+        "all_gt_dates": all_gt_dates,
+        "earliest_date": earliest_date,
+        "latest_date": latest_date,
+        "writes_shared_outputs": writes_shared_outputs,
+        "all_locations": all_locations,
+        "gt_grid": gt_grid,
+        "gt_grid_dates": gt_grid_dates,
+        "date_axis": date_axis,
+        "wis_df": wis_df,
+        "mape_df": mape_df,
+        "coverage_df": coverage_df,
+        "revision_scores": revision_scores,
+    }
 
-    # Fill missing values with placeholder values (-1 for admissions, 0 for rate)
-    gt_df_fixed = gt_df_fixed.fillna({"admissions": -1, "weeklyRate": 0})
 
-    print(f"   - Ground truth fixed. Shape: {gt_df_fixed.shape}")
+def run_seasons_stage(state):
+    """Step 4: defines the full range seasons and the dynamic time periods."""
+    all_gt_dates = state["all_gt_dates"]
+    earliest_date = state["earliest_date"]
+    latest_date = state["latest_date"]
+    all_preds_df = state["all_preds_df"]
 
     # ===== 4. Generate Season Definitions =====
     print("Step 4: Generating season definitions...")
@@ -496,20 +1321,42 @@ def main():
 
     print(f"   - Generated {len(dynamic_season_options)} dynamic time periods")
 
+    return {
+        "full_range_season_options": full_range_season_options,
+        "full_range_seasons_info_for_processing": full_range_seasons_info_for_processing,
+        "default_season_tv": default_season_tv,
+        "default_selected_date": default_selected_date,
+        "dynamic_season_options": dynamic_season_options,
+        "dynamic_periods": dynamic_periods,
+    }
+
+
+def run_partition_stage(state):
+    """Step 5: partitions nowcasts, predictions (5) and ground truth (5b) by season, with their activity levels (5c)."""
+    locations_df = state["locations_df"]
+    thresholds_dict = state["thresholds_dict"]
+    model_names = state["model_names"]
+    all_nowcasts_df = state["all_nowcasts_df"]
+    all_preds_df = state["all_preds_df"]
+    gt_grid = state["gt_grid"]
+    gt_grid_dates = state["gt_grid_dates"]
+    date_axis = state["date_axis"]
+    full_range_seasons_info_for_processing = state["full_range_seasons_info_for_processing"]
+
     # ===== 5. Partition Time-Series Data by Season =====
 
     # Process Nowcast Trends by season
     print("     - Partitioning Nowcast trends by season...")
     nowcast_trends_by_season = {}
     if not all_nowcasts_df.empty:
+        nowcasts_by_date = DateSortedFrame(all_nowcasts_df, "reference_date")
+
         # Process each full range season for nowcast trends
         for season_id, dates in full_range_seasons_info_for_processing.items():
             print(f"   - Processing nowcast trends for season: {season_id}")
 
             # Filter nowcast data for this season
-            season_nowcast_df = all_nowcasts_df[
-                (all_nowcasts_df["reference_date"] >= dates["start"]) & (all_nowcasts_df["reference_date"] <= dates["end"])
-            ].copy()
+            season_nowcast_df = nowcasts_by_date.slice(dates["start"], dates["end"])
 
             if season_nowcast_df.empty:
                 nowcast_trends_by_season[season_id] = {}
@@ -517,15 +1364,18 @@ def main():
 
             # Convert to nested dictionary structure for this season
             season_nowcast_dict = {}
-            for _, row in season_nowcast_df.iterrows():
-                model = row["model"]
-                date_iso = row["reference_date"].strftime("%Y-%m-%d")
-                location = row["location"]
-
+            for model, date_iso, location, decrease, increase, stable in zip(
+                season_nowcast_df["model"].tolist(),
+                date_axis.iso(season_nowcast_df["reference_date"]),
+                season_nowcast_df["location"].tolist(),
+                season_nowcast_df["decrease"].astype(float).tolist(),
+                season_nowcast_df["increase"].astype(float).tolist(),
+                season_nowcast_df["stable"].astype(float).tolist(),
+            ):
                 season_nowcast_dict.setdefault(model, {}).setdefault(date_iso, {})[location] = {
-                    "decrease": float(row["decrease"]),
-                    "increase": float(row["increase"]),
-                    "stable": float(row["stable"]),
+                    "decrease": decrease,
+                    "increase": increase,
+                    "stable": stable,
                 }
 
             nowcast_trends_by_season[season_id] = season_nowcast_dict
@@ -535,10 +1385,19 @@ def main():
     print("Step 5: Partitioning time-series data by season...")
     time_series_data = {}
 
-    print("   - Creating fast lookup indexes for dataframes...")
-    # Create indexed dataframes for efficient lookups
-    preds_df_indexed = all_preds_df.set_index(["reference_date", "location", "model"]).sort_index()
     all_locations = locations_df["location"].unique()
+    location_order = pd.Index(all_locations)
+
+    # Activity level thresholds (weekly rate per 100k) and populations, in location order;
+    # locations without thresholds are classified as No Data
+    location_thresholds = [thresholds_dict.get(location, {}) for location in all_locations]
+    medium_thresholds = np.array([t.get("medium", np.nan) for t in location_thresholds])
+    high_thresholds = np.array([t.get("high", np.nan) for t in location_thresholds])
+    location_populations = locations_df.groupby("location")["population"].first().reindex(location_order).to_numpy(dtype=float)
+    activity_levels_data = {}
+
+    # Sorted-by-date view, so every season/partition filter below is a binary search instead of a full scan
+    preds_by_date = DateSortedFrame(all_preds_df, "reference_date")
 
     # IMPORTANT: Only process full range seasons for time series partitioning
     # Dynamic periods are NOT included here as per requirements
@@ -546,10 +1405,7 @@ def main():
         print(f"   - Processing time series for season: {season_id}")
 
         # Filter predictions for this season
-        season_preds = all_preds_df[(all_preds_df["reference_date"] >= dates["start"]) & (all_preds_df["reference_date"] <= dates["end"])]
-
-        # Initialize structure according to DataContract.md
-        time_series_data[season_id] = {}
+        season_preds = preds_by_date.slice(dates["start"], dates["end"])
 
         # Calculate season-level aggregated dates across all models
         if season_preds.empty:
@@ -561,16 +1417,61 @@ def main():
             season_last_pred_ref_date = season_preds["reference_date"].max()
             season_last_pred_target_date = season_preds["target_end_date"].max()
 
-        # Store season-level dates for quick reference
-        time_series_data[season_id]["firstPredRefDate"] = season_first_pred_ref_date.strftime("%Y-%m-%d") if pd.notna(season_first_pred_ref_date) else None
-        time_series_data[season_id]["lastPredRefDate"] = season_last_pred_ref_date.strftime("%Y-%m-%d") if pd.notna(season_last_pred_ref_date) else None
-        time_series_data[season_id]["lastPredTargetDate"] = (
-            season_last_pred_target_date.strftime("%Y-%m-%d") if pd.notna(season_last_pred_target_date) else None
+        # Only the forecasts of the app's models and locations are published, one per target date
+        # (the last one wins on duplicates), ordered by reference date, location and target date
+        published_preds = season_preds[season_preds["model"].isin(model_names) & season_preds["location"].isin(location_order)]
+        published_preds = published_preds.assign(location_rank=location_order.get_indexer(published_preds["location"]))
+        published_preds = published_preds.drop_duplicates(subset=["reference_date", "location", "model", "target_end_date"], keep="last")
+        published_preds = published_preds.sort_values(["reference_date", "location_rank", "target_end_date"], kind="stable")
+
+        # Per-season date axis: every reference/target date of the published forecasts, referenced by offset
+        season_date_axis = pd.DatetimeIndex(np.union1d(published_preds["reference_date"].unique(), published_preds["target_end_date"].unique()))
+
+        # Sparse encoding: only reference dates/locations with forecasts get rows (see SPARSE_PREDICTION_FIELDS)
+        time_series_data[season_id] = {
+            "format": SPARSE_PREDICTIONS_FORMAT,
+            "fields": SPARSE_PREDICTION_FIELDS,
+            "dates": date_axis.iso(season_date_axis),
+            "firstPredRefDate": season_first_pred_ref_date.strftime("%Y-%m-%d") if pd.notna(season_first_pred_ref_date) else None,
+            "lastPredRefDate": season_last_pred_ref_date.strftime("%Y-%m-%d") if pd.notna(season_last_pred_ref_date) else None,
+            "lastPredTargetDate": season_last_pred_target_date.strftime("%Y-%m-%d") if pd.notna(season_last_pred_target_date) else None,
+            "models": {},
+        }
+
+        # Activity levels (5c) of the median and interval bounds of every published forecast,
+        # as weekly rates against its location's thresholds
+        location_ranks = published_preds["location_rank"].to_numpy()
+        forecast_rates = prediction_interval_values(published_preds) / location_populations[location_ranks, None] * 100000
+        forecast_levels = encode_level_strings(
+            classify_activity_levels(forecast_rates, medium_thresholds[location_ranks, None], high_thresholds[location_ranks, None])
         )
+        forecast_level_rows = list(
+            zip(
+                season_date_axis.get_indexer(published_preds["reference_date"]).tolist(),
+                published_preds["location"].tolist(),
+                season_date_axis.get_indexer(published_preds["target_end_date"]).tolist(),
+                forecast_levels,
+            )
+        )
+        activity_levels_data[season_id] = {
+            "format": ACTIVITY_LEVELS_FORMAT,
+            "levels": ACTIVITY_LEVELS,
+            "forecasts": {"fields": SPARSE_PREDICTION_FIELDS[4:], "dates": time_series_data[season_id]["dates"], "models": {}},
+        }
+
+        # Each model's rows, grouped once per season (a mask per model would rescan the season for every model);
+        # the positions are ascending, so the rows keep the reference date order of season_preds/published_preds
+        season_rows_by_model = season_preds.groupby("model", sort=False).indices
+        published_rows_by_model = published_preds.groupby("model", sort=False).indices
+        no_rows = np.empty(0, dtype=np.intp)
 
         # Process each model separately within this season
         for model_name in model_names:
-            model_preds = season_preds[season_preds["model"] == model_name]
+            model_preds = season_preds.iloc[season_rows_by_model.get(model_name, no_rows)]
+            model_published_preds = published_preds.iloc[published_rows_by_model.get(model_name, no_rows)]
+            model_published_dates = model_published_preds["reference_date"].to_numpy(dtype="datetime64[ns]")
+            model_level_rows = published_rows_by_model.get(model_name, no_rows)
+            activity_levels_data[season_id]["forecasts"]["models"][model_name] = [list(forecast_level_rows[i]) for i in model_level_rows]
 
             # Calculate model-specific dates within this season
             if model_preds.empty:
@@ -583,15 +1484,15 @@ def main():
                 last_pred_target_date = model_preds["target_end_date"].max()
 
             # Initialize model structure
-            time_series_data[season_id][model_name] = {
+            model_data = time_series_data[season_id]["models"][model_name] = {
                 "firstPredRefDate": (first_pred_ref_date.strftime("%Y-%m-%d") if pd.notna(first_pred_ref_date) else None),
                 "lastPredRefDate": (last_pred_ref_date.strftime("%Y-%m-%d") if pd.notna(last_pred_ref_date) else None),
                 "lastPredTargetDate": (last_pred_target_date.strftime("%Y-%m-%d") if pd.notna(last_pred_target_date) else None),
                 "partitions": {
-                    "pre-forecast": {},
-                    "full-forecast": {},
-                    "forecast-tail": {},
-                    "post-forecast": {},
+                    "pre-forecast": [],
+                    "full-forecast": [],
+                    "forecast-tail": [],
+                    "post-forecast": [],
                 },
             }
 
@@ -609,75 +1510,13 @@ def main():
                 if pd.isna(start_date) or pd.isna(end_date) or start_date > end_date:
                     continue
 
-                partition_data = {}
-
-                # Get all dates that fall within this partition
-                gt_dates_in_partition = gt_df_fixed.loc[
-                    (gt_df_fixed["date"] >= start_date) & (gt_df_fixed["date"] <= end_date),
-                    "date",
-                ]
-                pred_dates_in_partition = model_preds.loc[
-                    (model_preds["reference_date"] >= start_date) & (model_preds["reference_date"] <= end_date),
-                    "reference_date",
+                # The forecasts whose reference date falls within this partition
+                partition_preds = model_published_preds.iloc[
+                    np.searchsorted(model_published_dates, np.datetime64(start_date, "ns"), side="left") : np.searchsorted(
+                        model_published_dates, np.datetime64(end_date, "ns"), side="right"
+                    )
                 ]
-
-                # Combine and get unique dates
-                all_unique_dates = pd.concat([gt_dates_in_partition, pred_dates_in_partition]).unique()
-
-                # Process each date in this partition
-                for ref_date in all_unique_dates:
-                    if not (start_date <= pd.to_datetime(ref_date) <= end_date):
-                        continue
-
-                    ref_date_iso = pd.to_datetime(ref_date).strftime("%Y-%m-%d")
-
-                    if ref_date_iso not in partition_data:
-                        partition_data[ref_date_iso] = {}
-
-                    # Process each location for this date
-                    for state_num in all_locations:
-                        if state_num not in partition_data[ref_date_iso]:
-                            partition_data[ref_date_iso][state_num] = {}
-
-                        entry = partition_data[ref_date_iso][state_num]
-
-                        # Add prediction data for this specific model
-                        try:
-                            preds_on_date = preds_df_indexed.loc[(ref_date, state_num, model_name)]
-                            if not preds_on_date.empty:
-                                predictions_dict = {}
-
-                                # Handle both Series and DataFrame cases
-                                if isinstance(preds_on_date, pd.Series):
-                                    preds_on_date = preds_on_date.to_frame().T
-
-                                # Process each prediction row (different horizons)
-                                for _, pred_row in preds_on_date.iterrows():
-                                    target_date_iso = pred_row["target_end_date"].strftime("%Y-%m-%d")
-                                    predictions_dict[target_date_iso] = {
-                                        "horizon": int(pred_row["horizon"]),
-                                        "median": float(pred_row["0.5"]) if pd.notna(pred_row["0.5"]) else 0.0,
-                                        "PI50": {
-                                            "low": float(pred_row["0.25"]) if pd.notna(pred_row["0.25"]) else 0.0,
-                                            "high": float(pred_row["0.75"]) if pd.notna(pred_row["0.75"]) else 0.0,
-                                        },
-                                        "PI90": {
-                                            "low": float(pred_row["0.05"]) if pd.notna(pred_row["0.025"]) else 0.0,
-                                            "high": float(pred_row["0.95"]) if pd.notna(pred_row["0.95"]) else 0.0,
-                                        },
-                                        "PI95": {
-                                            "low": float(pred_row["0.025"]) if pd.notna(pred_row["0.025"]) else 0.0,
-                                            "high": float(pred_row["0.975"]) if pd.notna(pred_row["0.95"]) else 0.0,
-                                        },
-                                    }
-
-                                if predictions_dict:
-                                    entry["predictions"] = predictions_dict
-                        except KeyError:
-                            pass  # No prediction data for this date/location/model
-
-                # Store the partition data
-                time_series_data[season_id][model_name]["partitions"][partition_name] = partition_data
+                model_data["partitions"][partition_name] = encode_prediction_rows(partition_preds, season_date_axis)
 
     print("   - Time series partitioning complete (full range seasons only)")
 
@@ -685,33 +1524,65 @@ def main():
     print("Step 5b: Processing centralized ground truth data...")
     ground_truth_data = {}
 
+    # The published arrays keep the placeholder contract the frontend expects for gaps
+    # (admissions -1 and weeklyRate 0), next to the missing mask itself
+    gt_missing = gt_grid["missing"].to_numpy()
+    gt_admissions_out = np.where(gt_missing, -1.0, gt_grid["admissions"].to_numpy(dtype=float))
+    gt_weekly_rates_out = np.where(gt_missing, 0.0, np.nan_to_num(gt_grid["weeklyRate"].to_numpy(dtype=float), nan=0.0))
+    gt_grid_date_values = gt_grid_dates.to_numpy(dtype="datetime64[ns]")
+
+    # Activity level of every reported weekly rate (gaps are No Data), one digit per date and location
+    gt_levels = classify_activity_levels(gt_weekly_rates_out, medium_thresholds, high_thresholds)
+
     # Process each full range season for ground truth
     for season_id, dates in full_range_seasons_info_for_processing.items():
         print(f"   - Processing ground truth for season: {season_id}")
 
-        ground_truth_data[season_id] = {}
+        # The season's weekly axis: the grid dates within the season
+        lo = np.searchsorted(gt_grid_date_values, np.datetime64(dates["start"], "ns"), side="left")
+        hi = np.searchsorted(gt_grid_date_values, np.datetime64(dates["end"], "ns"), side="right")
+
+        # Columnar layout: one dense array per location, aligned with the date axis
+        ground_truth_data[season_id] = {
+            "format": GROUND_TRUTH_COLUMNS_FORMAT,
+            "dates": date_axis.iso(gt_grid_dates[lo:hi]),
+            "admissions": dict(zip(all_locations, gt_admissions_out[lo:hi].T.tolist())),
+            "weeklyRate": dict(zip(all_locations, gt_weekly_rates_out[lo:hi].T.tolist())),
+            "missing": dict(zip(all_locations, gt_missing[lo:hi].T.astype(int).tolist())),
+        }
 
-        # Get all dates in this season
-        season_dates = pd.date_range(start=dates["start"], end=dates["end"], freq="W-SAT")
+        # Ground truth activity levels (5c), on the same date axis
+        activity_levels_data[season_id]["groundTruth"] = {
+            "dates": ground_truth_data[season_id]["dates"],
+            "levels": dict(zip(all_locations, encode_level_strings(gt_levels[lo:hi].T))),
+        }
 
-        for ref_date in season_dates:
-            ref_date_iso = ref_date.strftime("%Y-%m-%d")
-            ground_truth_data[season_id][ref_date_iso] = {}
+    print(f"   - Ground truth data processed for {len(ground_truth_data)} seasons")
 
-            # Get ground truth for all states on this date
-            for state_num in all_locations:
-                try:
-                    gt_row = gt_df_fixed[(gt_df_fixed["date"] == ref_date) & (gt_df_fixed["stateNum"] == state_num)]
-                    if not gt_row.empty and pd.notna(gt_row.iloc[0]["admissions"]) and gt_row.iloc[0]["admissions"] >= -1:
-                        ground_truth_data[season_id][ref_date_iso][state_num] = {
-                            "admissions": float(gt_row.iloc[0]["admissions"]),
-                            "weeklyRate": float(gt_row.iloc[0]["weeklyRate"]),
-                        }
-                except (KeyError, IndexError):
-                    # No ground truth data for this date/location
-                    pass
+    return {
+        "all_locations": all_locations,
+        "nowcast_trends_by_season": nowcast_trends_by_season,
+        "time_series_data": time_series_data,
+        "ground_truth_data": ground_truth_data,
+        "activity_levels_data": activity_levels_data,
+    }
 
-    print(f"   - Ground truth data processed for {len(ground_truth_data)} seasons")
+
+def run_evaluations_stage(state):
+    """
+    Step 6: pre-aggregates the evaluation scores of every season and dynamic period, stores raw scores (6b),
+    and computes pairwise relative WIS and model ranks (6c).
+    """
+    profile = state["profile"]
+    locations_df = state["locations_df"]
+    model_names = state["model_names"]
+    wis_df = state["wis_df"]
+    mape_df = state["mape_df"]
+    coverage_df = state["coverage_df"]
+    date_axis = state["date_axis"]
+    full_range_seasons_info_for_processing = state["full_range_seasons_info_for_processing"]
+    dynamic_season_options = state["dynamic_season_options"]
+    dynamic_periods = state["dynamic_periods"]
 
     # ===== 6. Aggregate Evaluation Data =====
     print("Step 6: Pre-aggregating evaluation data...")
@@ -740,15 +1611,12 @@ def main():
     coverage_df.rename(columns={"Model": "model", "location": "stateNum"}, inplace=True)
 
     # Create coverage data for different purposes:
-    # 1. Long format for PI Chart aggregation
-    coverage_long_df = coverage_df.melt(
-        id_vars=["reference_date", "model", "stateNum", "horizon"],
-        value_vars=[f"{cov}_cov" for cov in [10, 20, 30, 40, 50, 60, 70, 80, 90, 95, 98]],
-        var_name="coverage_level",
-        value_name="score",
-    )
-    coverage_long_df["coverage_level"] = coverage_long_df["coverage_level"].str.replace("_cov", "").astype(int)
-    coverage_long_df["score"] *= 100
+    # 1. Wide format (one column per coverage level, in percent) for PI Chart aggregation;
+    #    all levels are aggregated at once, so there is no need to melt into one row per level
+    coverage_levels = [10, 20, 30, 40, 50, 60, 70, 80, 90, 95, 98]
+    coverage_level_cols = [f"{cov}_cov" for cov in coverage_levels]
+    coverage_pi_df = coverage_df[["reference_date", "model", "horizon"] + coverage_level_cols].copy()
+    coverage_pi_df[coverage_level_cols] *= 100
 
     # 2. Standard format for State Map (using 95% coverage)
     coverage_scores_df = coverage_df[["reference_date", "model", "stateNum", "horizon"]].copy()
@@ -759,17 +1627,21 @@ def main():
     eval_scores_df = pd.concat([wis_df, mape_df, coverage_scores_df], ignore_index=True)
 
     # Standardize date and location formats
-    for df in [eval_scores_df, coverage_long_df]:
-        df["reference_date"] = pd.to_datetime(df["reference_date"])
-        df["stateNum"] = df["stateNum"].astype(str).str.zfill(2)
+    eval_scores_df["reference_date"] = pd.to_datetime(eval_scores_df["reference_date"])
+    eval_scores_df["stateNum"] = eval_scores_df["stateNum"].astype(str).str.zfill(2)
+    coverage_pi_df["reference_date"] = pd.to_datetime(coverage_pi_df["reference_date"])
 
     # Calculate target_end_date for proper filtering against time ranges generated using referenceDate's perspective
     print("   - Calculating target end dates for evaluation filtering...")
     eval_scores_df["target_end_date"] = eval_scores_df["reference_date"] + pd.to_timedelta(eval_scores_df["horizon"] * 7, unit="D")
-    coverage_long_df["target_end_date"] = coverage_long_df["reference_date"] + pd.to_timedelta(coverage_long_df["horizon"] * 7, unit="D")
+    coverage_pi_df["target_end_date"] = coverage_pi_df["reference_date"] + pd.to_timedelta(coverage_pi_df["horizon"] * 7, unit="D")
 
     print("   - Evaluation score files cleaned and standardized")
 
+    # Sorted-by-reference-date views for the per-season/period filters below
+    eval_scores_by_date = DateSortedFrame(eval_scores_df, "reference_date")
+    coverage_pi_by_date = DateSortedFrame(coverage_pi_df, "reference_date")
+
     # Validate dynamic time periods using actual evaluation data from the ongoing season
     # Dynamic periods should only look back within the ongoing season, not across all seasons
     if not eval_scores_df.empty:
@@ -788,9 +1660,7 @@ def main():
             )
 
             # Filter evaluation data to ONLY the ongoing season
-            ongoing_season_eval = eval_scores_df[
-                (eval_scores_df["reference_date"] >= ongoing_season_dates["start"]) & (eval_scores_df["reference_date"] <= ongoing_season_dates["end"])
-            ]
+            ongoing_season_eval = eval_scores_by_date.slice(ongoing_season_dates["start"], ongoing_season_dates["end"])
 
             if not ongoing_season_eval.empty:
                 # Get the earliest reference date in the ONGOING SEASON's evaluation data
@@ -830,9 +1700,13 @@ def main():
     # Create season-specific evaluation datasets
     print("\n   - Creating season-specific evaluation datasets...")
     iqr_data = {}
+    iqr_state_averages = {}
     state_map_data = {}
     coverage_data = {}
 
+    # The per-state averages behind every IQR box are stored once, as rows over this fixed state order
+    iqr_state_order = locations_df["location"].tolist()
+
     # Track model availability for each time period (for frontend to disable unavailable models)
     model_availability_by_period = {}
 
@@ -842,16 +1716,15 @@ def main():
         print(f"     Date range: {season_dates['start'].strftime('%Y-%m-%d')} to {season_dates['end'].strftime('%Y-%m-%d')}")
 
         # Filter evaluation data for this specific season
-        season_eval_df = eval_scores_df[
-            (eval_scores_df["reference_date"] >= season_dates["start"]) & (eval_scores_df["target_end_date"] <= season_dates["end"])
-        ].copy()
+        # (target_end_date >= reference_date, so the reference-date slice already bounds the target filter)
+        season_eval_df = eval_scores_by_date.slice(season_dates["start"], season_dates["end"])
+        season_eval_df = season_eval_df[season_eval_df["target_end_date"] <= season_dates["end"]]
 
-        season_coverage_df = coverage_long_df[
-            (coverage_long_df["reference_date"] >= season_dates["start"]) & (coverage_long_df["target_end_date"] <= season_dates["end"])
-        ].copy()
+        season_coverage_df = coverage_pi_by_date.slice(season_dates["start"], season_dates["end"])
+        season_coverage_df = season_coverage_df[season_coverage_df["target_end_date"] <= season_dates["end"]]
 
         print(f"     Evaluation entries: {len(season_eval_df)}")
-        print(f"     Coverage entries: {len(season_coverage_df)}")
+        print(f"     Coverage entries: {len(season_coverage_df)} (x{len(coverage_levels)} levels)")
 
         # Track model availability for this period
         models_with_data = set()
@@ -873,7 +1746,7 @@ def main():
         # Initialize availability tracking for this period
         model_availability_by_period[season_id] = {
             "unavailableModels": unavailable_models,
-            "availableModels": list(models_with_data),
+            "availableModels": [m for m in model_names if m in models_with_data],  # Config order, so the output is deterministic
             "unavailableHorizons": [],  # Will be populated later when we know available horizons
             "availableHorizons": [],
         }
@@ -920,15 +1793,15 @@ def main():
                         horizon_int
                     ] = {"sum": float(row["sum"]), "count": int(row["count"])}
 
-        # PI chart aggregations
+        # PI chart aggregations: grouped sums/counts of every coverage level column in one pass
         if len(season_coverage_df) > 0:
-            coverage_agg = season_coverage_df.groupby(["model", "horizon", "coverage_level"])["score"].agg(["sum", "count"]).reset_index()
-            for _, row in coverage_agg.iterrows():
-                horizon_int = int(row["horizon"])
-                coverage_data.setdefault(season_id, {}).setdefault(row["model"], {}).setdefault(horizon_int, {})[int(row["coverage_level"])] = {
-                    "sum": float(row["sum"]),
-                    "count": int(row["count"]),
-                }
+            coverage_grouped = season_coverage_df.groupby(["model", "horizon"])[coverage_level_cols]
+            coverage_sums = coverage_grouped.sum()
+            coverage_counts = coverage_grouped.count()
+            for (model, horizon), level_sums, level_counts in zip(coverage_sums.index, coverage_sums.to_numpy(), coverage_counts.to_numpy()):
+                horizon_data = coverage_data.setdefault(season_id, {}).setdefault(model, {}).setdefault(int(horizon), {})
+                for level, level_sum, level_count in zip(coverage_levels, level_sums.tolist(), level_counts.tolist()):
+                    horizon_data[level] = {"sum": level_sum, "count": level_count}
 
         # Process horizon availability and IQR calculations
         if season_id in state_map_data:
@@ -956,15 +1829,23 @@ def main():
 
             print(f"     Calculating IQR for {len(horizon_combinations)} horizon combinations: {horizon_combinations}")
 
+            horizon_keys = [",".join(map(str, sorted(horizon_combo))) for horizon_combo in horizon_combinations]
+            state_average_rows = {}
+
+            # Fixed locations.csv order, followed by any scored location missing from it
+            scored_states = {state_num for metric_data in state_map_data[season_id].values() for model_data in metric_data.values() for state_num in model_data}
+            period_state_order = iqr_state_order + sorted(scored_states.difference(iqr_state_order))
+
             for metric, metric_data in state_map_data[season_id].items():
                 for model, model_data in metric_data.items():
-                    # Calculate IQR for each horizon combination
-                    for horizon_combo in horizon_combinations:
-                        # Create horizon key (e.g., "0", "1,2", "0,1,2,3")
-                        horizon_key = ",".join(map(str, sorted(horizon_combo)))
+                    # One row of per-state averages for each horizon combination, None where a state has no data
+                    model_rows = state_average_rows.setdefault(metric, {})[model] = []
 
+                    # Calculate IQR for each horizon combination
+                    for horizon_combo, horizon_key in zip(horizon_combinations, horizon_keys):
                         # Calculate state averages for this combination
                         state_averages = []
+                        averages_by_state = {}
 
                         # Get all states that have data for any horizon in this combination
                         all_states = set()
@@ -975,7 +1856,7 @@ def main():
                                     all_states.add(state_num)
 
                         # Calculate combined average for each state (method depends on metric)
-                        for state_num in all_states:
+                        for state_num in sorted(all_states):
                             if metric == "Coverage":
                                 # Coverage: Arithmetic mean
                                 total_sum = 0
@@ -989,6 +1870,7 @@ def main():
                                 if total_count > 0:
                                     arithmetic_mean = total_sum / total_count
                                     state_averages.append(arithmetic_mean)
+                                    averages_by_state[state_num] = arithmetic_mean
                             else:
                                 # WIS/Baseline and MAPE: Geometric mean
                                 combined_product = 1
@@ -1003,6 +1885,7 @@ def main():
                                     # Geometric mean = (product of all values)^(1/count)
                                     geometric_mean = combined_product ** (1 / total_count)
                                     state_averages.append(geometric_mean)
+                                    averages_by_state[state_num] = geometric_mean
 
                         # Calculate IQR stats if we have at least 1 state
                         if len(state_averages) >= 1:
@@ -1013,6 +1896,12 @@ def main():
 
                                 # Store using horizon key
                                 iqr_data.setdefault(season_id, {}).setdefault(metric, {}).setdefault(model, {})[horizon_key] = stats
+
+                        model_rows.append(
+                            [round(averages_by_state[state_num], STATE_AVERAGE_DECIMALS) if state_num in averages_by_state else None for state_num in period_state_order]
+                        )
+
+            iqr_state_averages[season_id] = {"states": period_state_order, "horizonKeys": horizon_keys, "values": state_average_rows}
         else:
             # No evaluation data for this period - all horizons are unavailable
             if season_id in model_availability_by_period:
@@ -1029,32 +1918,28 @@ def main():
     # Process each season for raw scores
     for season_id, season_dates in full_range_seasons_info_for_processing.items():
         # Filter evaluation data for this specific season
-        season_eval_df = eval_scores_df[
-            (eval_scores_df["reference_date"] >= season_dates["start"]) & (eval_scores_df["target_end_date"] <= season_dates["end"])
-        ].copy()
-
-        season_eval_df = season_eval_df[season_eval_df["metric"] != "Coverage"].copy()
+        season_eval_df = eval_scores_by_date.slice(season_dates["start"], season_dates["end"])
+        season_eval_df = season_eval_df[(season_eval_df["target_end_date"] <= season_dates["end"]) & (season_eval_df["metric"] != "Coverage")]
 
         if len(season_eval_df) == 0:
             continue
 
+        # Score entries for every row of the season, with the dates looked up on the shared date axis
+        season_entries = [
+            {"referenceDate": reference_date_iso, "targetEndDate": target_date_iso, "score": score}
+            for reference_date_iso, target_date_iso, score in zip(
+                date_axis.iso(season_eval_df["reference_date"]),
+                date_axis.iso(season_eval_df["target_end_date"]),
+                season_eval_df["score"].astype(float).tolist(),
+            )
+        ]
+
         # Group by metric, model, state, and horizon
-        grouped = season_eval_df.groupby(["metric", "model", "stateNum", "horizon"])
-
-        for (metric, model, state_num, horizon), group_df in grouped:
-            # Convert dates to ISO strings and create score entries
-            score_entries = []
-            for _, row in group_df.iterrows():
-                score_entries.append(
-                    {
-                        "referenceDate": row["reference_date"].strftime("%Y-%m-%d"),
-                        "targetEndDate": row["target_end_date"].strftime("%Y-%m-%d"),
-                        "score": float(row["score"]),
-                    }
-                )
+        grouped = season_eval_df.reset_index(drop=True).groupby(["metric", "model", "stateNum", "horizon"])
 
+        for (metric, model, state_num, horizon), row_positions in grouped.indices.items():
             # Sort by reference date
-            score_entries.sort(key=lambda x: x["referenceDate"])
+            score_entries = sorted((season_entries[i] for i in row_positions), key=lambda x: x["referenceDate"])
 
             # Store in nested structure
             horizon_int = int(horizon)
@@ -1062,6 +1947,64 @@ def main():
 
     print(f"   - Raw scores stored for {len(raw_scores_data)} seasons")
 
+    # ===== 6c. Pairwise Relative WIS and Model Ranks =====
+    print("   - Computing pairwise relative WIS and model ranks...")
+    pairwise_skill_data = {}
+    wis_scores_by_date = DateSortedFrame(eval_scores_df[eval_scores_df["metric"] == "WIS/Baseline"], "reference_date")
+
+    for period_id, period_dates in all_seasons_combined.items():
+        period_wis_df = wis_scores_by_date.slice(period_dates["start"], period_dates["end"])
+        period_wis_df = period_wis_df[period_wis_df["target_end_date"] <= period_dates["end"]]
+        if period_wis_df.empty:
+            continue
+        pairwise_skill_data[period_id] = build_pairwise_skill_tables(period_wis_df, model_names, iqr_state_order, profile["baselineModel"])
+
+    print(f"   - Pairwise relative WIS computed for {len(pairwise_skill_data)} seasons and periods")
+
+    return {
+        "model_availability_by_period": model_availability_by_period,
+        "iqr_data": iqr_data,
+        "iqr_state_averages": iqr_state_averages,
+        "state_map_data": state_map_data,
+        "coverage_data": coverage_data,
+        "raw_scores_data": raw_scores_data,
+        "pairwise_skill_data": pairwise_skill_data,
+    }
+
+
+def run_write_stage(state):
+    """Step 7: writes the split JSON files and the output manifest."""
+    shared_inputs = state["shared_inputs"]
+    public_data_dir = state["public_data_dir"]
+    seasons = state["seasons"]
+    season_ranges = state["season_ranges"]
+    shard = state["shard"]
+    split_raw_scores = state["split_raw_scores"]
+    writes_shared_outputs = state["writes_shared_outputs"]
+    thresholds_dict = state["thresholds_dict"]
+    historical_data_map = state["historical_data_map"]
+    model_names = state["model_names"]
+    model_color_map = state["model_color_map"]
+    nowcast_models = state["nowcast_models"]
+    revision_scores = state["revision_scores"]
+    full_range_season_options = state["full_range_season_options"]
+    full_range_seasons_info_for_processing = state["full_range_seasons_info_for_processing"]
+    default_season_tv = state["default_season_tv"]
+    default_selected_date = state["default_selected_date"]
+    dynamic_season_options = state["dynamic_season_options"]
+    dynamic_periods = state["dynamic_periods"]
+    nowcast_trends_by_season = state["nowcast_trends_by_season"]
+    time_series_data = state["time_series_data"]
+    ground_truth_data = state["ground_truth_data"]
+    activity_levels_data = state["activity_levels_data"]
+    model_availability_by_period = state["model_availability_by_period"]
+    iqr_data = state["iqr_data"]
+    iqr_state_averages = state["iqr_state_averages"]
+    state_map_data = state["state_map_data"]
+    coverage_data = state["coverage_data"]
+    raw_scores_data = state["raw_scores_data"]
+    pairwise_skill_data = state["pairwise_skill_data"]
+
     # ===== 7. Write Split JSON Files =====
     print("Step 7: Writing split JSON files...")
 
@@ -1075,122 +2018,586 @@ def main():
     historical_dir = public_data_dir / "historical-ground-truth-data"
     historical_dir.mkdir(exist_ok=True, parents=True)
 
-    # ===== 7A. Process & Write Auxiliary Data =====
-    # Process thresholds data using imported function
-    print("   - Processing thresholds data...")
-    thresholds_dict = process_thresholds(thresholds_df)
+    # Every output goes through the manifest, which skips unchanged files and records content hashes
+    output_manifest = OutputManifest(public_data_dir, keep_existing=season_ranges is not None)
+
+    # ===== 7A. Write Auxiliary Data =====
+    # With --seasons, files shared by every season (7A, 7B, 7D) are only rewritten when the newest season was rebuilt
+    if writes_shared_outputs:
+        # Locations and thresholds were processed once for all pathogen runs (see load_shared_inputs)
+        locations_list = shared_inputs["locations_list"]
+
+        print("   - Writing auxiliary data files...")
+
+        # Write locations data
+        output_manifest.write(auxiliary_dir / "locationsData.json", locations_list)
+
+        # Write thresholds data
+        output_manifest.write(auxiliary_dir / "thresholdsData.json", thresholds_dict)
+
+        # Write season metadata
+        season_metadata_path = auxiliary_dir / "seasonMetadata.json"
+        if season_ranges is not None and season_metadata_path.exists():
+            with open(season_metadata_path, "r") as f:
+                previous_metadata = json.load(f)
+            # Nowcast models are discovered from the files that were read: keep those found by earlier runs
+            previous_nowcast_models = previous_metadata.get("nowcastModelNames", [])
+            nowcast_models = sorted(set(nowcast_models) | {m for m in previous_nowcast_models if m in model_names})
+            # Availability of the seasons that were not rebuilt was computed by earlier runs, from files not read here
+            previous_availability = previous_metadata.get("modelAvailabilityByPeriod", {})
+            model_availability_by_period = {
+                period_id: (
+                    previous_availability[period_id]
+                    if period_id in full_range_seasons_info_for_processing
+                    and season_date_range(period_id) not in season_ranges
+                    and period_id in previous_availability
+                    else availability
+                )
+                for period_id, availability in model_availability_by_period.items()
+            }
 
-    # Process locations data using imported function
-    print("   - Processing locations data...")
-    locations_list = process_locations(locations_df)
+        # Build model metadata dictionary with color and nowcast capability
+        model_metadata = {
+            model: {
+                "hasNowcast": model in nowcast_models,
+                "color": model_color_map.get(model, "#808080"),  # Default gray if not found
+            }
+            for model in model_names
+        }
 
-    print("   - Writing auxiliary data files...")
+        season_metadata = {
+            "fullRangeSeasons": full_range_season_options,
+            "dynamicTimePeriod": dynamic_season_options,
+            "modelNames": model_names,
+            "nowcastModelNames": nowcast_models,
+            "modelMetadata": model_metadata,
+            "defaultSeasonTimeValue": default_season_tv,
+            "defaultSelectedDate": default_selected_date,  # This will go into settings and decide which day is selected by default
+            "modelAvailabilityByPeriod": model_availability_by_period,  # Track which models are unavailable for each time period
+        }
+        output_manifest.write(season_metadata_path, season_metadata)
+
+        print(f"   - Written auxiliary data: locations ({len(locations_list)} entries), thresholds ({len(thresholds_dict)} entries), metadata")
+
+        # Write the latest snapshot: the first paint of the forecasts page, before the default season's files are loaded
+        default_season_id = next((s["seasonId"] for s in full_range_season_options if s["timeValue"] == default_season_tv), None)
+        if default_season_id is not None:
+            latest_snapshot = build_latest_snapshot(
+                default_season_id,
+                default_selected_date.strftime("%Y-%m-%d"),
+                time_series_data.get(default_season_id, {}),
+                ground_truth_data.get(default_season_id, {}),
+                nowcast_trends_by_season.get(default_season_id, {}),
+            )
+            output_manifest.write(public_data_dir / "latest.json", latest_snapshot)
+            print(f"   - Written latest.json: {default_season_id} as of {latest_snapshot['selectedDate']}")
 
-    # Write locations data
-    with open(auxiliary_dir / "locationsData.json", "w") as f:
-        json.dump(locations_list, f, cls=NpEncoder, separators=(",", ":"))
+    # ===== 7B. Write Historical Ground Truth Data =====
+    if writes_shared_outputs:
+        print("   - Writing historical ground truth data...")
+        output_manifest.write(historical_dir / "historical-ground-truth-data.json", historical_data_map)
 
-    # Write thresholds data
-    with open(auxiliary_dir / "thresholdsData.json", "w") as f:
-        json.dump(thresholds_dict, f, cls=NpEncoder, separators=(",", ":"))
+        print(f"   - Written historical data: {len(historical_data_map)} snapshots")
 
-    # Write season metadata
-    # Build model metadata dictionary with color and nowcast capability
-    model_metadata = {
-        model: {
-            "hasNowcast": model in nowcast_models,
-            "color": model_color_map.get(model, "#808080"),  # Default gray if not found
-        }
-        for model in model_names
-    }
+    # ===== 7C. Write Full Range Season Data =====
+    print("   - Writing full range season data...")
 
-    season_metadata = {
-        "fullRangeSeasons": full_range_season_options,
-        "dynamicTimePeriod": dynamic_season_options,
-        "modelNames": model_names,
-        "nowcastModelNames": nowcast_models,
-        "modelMetadata": model_metadata,
-        "defaultSeasonTimeValue": default_season_tv,
-        "defaultSelectedDate": default_selected_date,  # This will go into settings and decide which day is selected by default
-        "modelAvailabilityByPeriod": model_availability_by_period,  # Track which models are unavailable for each time period
-    }
-    with open(auxiliary_dir / "seasonMetadata.json", "w") as f:
-        json.dump(season_metadata, f, cls=NpEncoder, separators=(",", ":"))
+    # Each season's files are serialized here and handed to a background writer, which writes them
+    # while the next season is built (see BackgroundWriter)
+    with BackgroundWriter(output_manifest) as writer:
+        for season_id, season_info in full_range_seasons_info_for_processing.items():
+            if season_ranges is not None and season_date_range(season_id) not in season_ranges:
+                continue
 
-    print(f"   - Written auxiliary data: locations ({len(locations_list)} entries), thresholds ({len(thresholds_dict)} entries), metadata")
+            folder_name = season_id
 
-    # ===== 7B. Write Historical Ground Truth Data =====
-    print("   - Writing historical ground truth data...")
-    with open(historical_dir / "historical-ground-truth-data.json", "w") as f:
-        json.dump(historical_data_map, f, cls=NpEncoder, separators=(",", ":"))
+            season_dir = public_data_dir / folder_name
+            season_dir.mkdir(exist_ok=True, parents=True)
 
-    print(f"   - Written historical data: {len(historical_data_map)} snapshots")
+            print(f"   - Writing data for {season_id} -> {folder_name}/")
 
-    # ===== 7C. Write Full Range Season Data =====
-    print("   - Writing full range season data...")
+            season_outputs = [
+                # Ground truth and prediction data for this season
+                (season_dir / "groundTruthData.json", ground_truth_data.get(season_id, {})),
+                (season_dir / "predictionsData.json", time_series_data.get(season_id, {})),
+                # Activity levels (ground truth and forecasts classified against the thresholds) for this season
+                (season_dir / "activityLevelsData.json", activity_levels_data.get(season_id, {})),
+                # Nowcast trends data for this season
+                (season_dir / "nowcastTrendsData.json", nowcast_trends_by_season.get(season_id, {})),
+            ]
 
-    for season_id, season_info in full_range_seasons_info_for_processing.items():
-        folder_name = season_id
+            # Evaluations data for this season (precalculated + raw scores)
+            season_evaluations_precalculated = {
+                "precalculated": {
+                    "iqr": iqr_data.get(season_id, {}),
+                    "iqrStateAverages": iqr_state_averages.get(season_id, {}),
+                    "stateMap_aggregates": state_map_data.get(season_id, {}),
+                    "detailedCoverage_aggregates": coverage_data.get(season_id, {}),
+                },
+            }
+            season_evaluations_raw_scores = {
+                "rawScores": raw_scores_data.get(season_id, {}),
+            }
+            season_outputs.append((season_dir / "evaluationsPrecalculatedData.json", season_evaluations_precalculated))
+            season_outputs.append((season_dir / "evaluationsRawScoresData.json", season_evaluations_raw_scores))
+
+            # Pairwise relative WIS and model ranks for this season
+            if season_id in pairwise_skill_data:
+                season_outputs.append((season_dir / "evaluationsPairwiseData.json", pairwise_skill_data[season_id]))
+
+            # Optionally also one raw score file per model and state, so the Single Model view only loads what it shows
+            if split_raw_scores:
+                raw_scores_index, raw_score_shards = build_raw_score_shards(raw_scores_data.get(season_id, {}))
+                for shard_path in raw_score_shards:
+                    (season_dir / shard_path).parent.mkdir(exist_ok=True, parents=True)
+                season_shards = [(season_dir / shard_path, shard_data) for shard_path, shard_data in raw_score_shards.items()]
+                season_outputs.append((season_dir / RAW_SCORES_INDEX_FILE, raw_scores_index))
+                cleanup = functools.partial(remove_stale_raw_score_shards, season_dir, output_manifest, raw_score_shards)
+            else:
+                # A previous run may have split them: do not leave an index the client could still find
+                season_shards = []
+                cleanup = functools.partial(remove_stale_raw_score_shards, season_dir, output_manifest)
+
+            # How model scores and rankings change across ground truth vintages (revision-aware mode only)
+            if revision_scores is not None:
+                season_revision_summary = summarize_revision_scores(
+                    revision_scores, model_names, season_info["start"].strftime("%Y-%m-%d"), season_info["end"].strftime("%Y-%m-%d")
+                )
+                season_outputs.append((season_dir / "evaluationsRevisionData.json", season_revision_summary))
 
-        season_dir = public_data_dir / folder_name
-        season_dir.mkdir(exist_ok=True, parents=True)
+            # The shards are written before the index that lists them
+            writer.queue(season_outputs, unlisted=season_shards, cleanup=cleanup)
 
-        print(f"   - Writing data for {season_id} -> {folder_name}/")
+            print(f"     - Written 4 files for {season_id}")
 
-        # Write ground truth data for this season
-        season_ground_truth = ground_truth_data.get(season_id, {})
-        with open(season_dir / "groundTruthData.json", "w") as f:
-            json.dump(season_ground_truth, f, cls=NpEncoder, separators=(",", ":"))
+        # ===== 7D. Write Dynamic Time Period Data =====
+        if writes_shared_outputs:
+            print("   - Writing dynamic time period data...")
 
-        # Write prediction data for this season
-        season_predictions = time_series_data.get(season_id, {})
-        with open(season_dir / "predictionsData.json", "w") as f:
-            json.dump(season_predictions, f, cls=NpEncoder, separators=(",", ":"))
+            for period_id in dynamic_periods.keys():
+                # Each dynamic period gets its own JSON file containing only evaluation data
+                period_evaluations = {
+                    "precalculated": {
+                        "iqr": iqr_data.get(period_id, {}),
+                        "iqrStateAverages": iqr_state_averages.get(period_id, {}),
+                        "stateMap_aggregates": state_map_data.get(period_id, {}),
+                        "detailedCoverage_aggregates": coverage_data.get(period_id, {}),
+                    }
+                    # Note: No raw scores for dynamic periods as per documentation
+                }
 
-        # Write nowcast trends data for this season
-        season_nowcast = nowcast_trends_by_season.get(season_id, {})
-        with open(season_dir / "nowcastTrendsData.json", "w") as f:
-            json.dump(season_nowcast, f, cls=NpEncoder, separators=(",", ":"))
+                period_outputs = [(dynamic_dir / f"{period_id}.json", period_evaluations)]
+                if period_id in pairwise_skill_data:
+                    period_outputs.append((dynamic_dir / f"{period_id}-pairwise.json", pairwise_skill_data[period_id]))
+                writer.queue(period_outputs)
 
-        # Write evaluations data for this season (precalculated + raw scores)
-        season_evaluations_precalculated = {
-            "precalculated": {
-                "iqr": iqr_data.get(season_id, {}),
-                "stateMap_aggregates": state_map_data.get(season_id, {}),
-                "detailedCoverage_aggregates": coverage_data.get(season_id, {}),
-            },
-        }
-        season_evaluations_raw_scores = {
-            "rawScores": raw_scores_data.get(season_id, {}),
+                print(f"   - Written {period_id}.json")
+
+    # ===== 7E. Write Output Manifest =====
+    output_manifest.save()
+    print(
+        f"   - Written {OutputManifest.FILE_NAME}: {len(output_manifest.files)} files "
+        f"({output_manifest.written_count} updated, {output_manifest.unchanged_count} unchanged)"
+    )
+
+    # ===== 7F. Record the Shard =====
+    if shard is not None:
+        # Read by merge_shard_outputs (not listed in the manifest), which combines the nowcast models found by every
+        # shard, and takes each season's model availability from the shard that read its files
+        computed_availability = state["model_availability_by_period"]
+        shard_info = {
+            "shard": shard[0],
+            "shardCount": shard[1],
+            "seasons": seasons,
+            "nowcastModelNames": state["nowcast_models"],
+            "modelAvailabilityByPeriod": {season: computed_availability[season] for season in seasons if season in computed_availability},
         }
-        with open(season_dir / "evaluationsPrecalculatedData.json", "w") as f:
-            json.dump(season_evaluations_precalculated, f, cls=NpEncoder, separators=(",", ":"))
+        write_json(public_data_dir / SHARD_INFO_FILE, shard_info)
+        print(f"   - Written {SHARD_INFO_FILE}: shard {shard[0]}/{shard[1]} ({', '.join(seasons)})")
+
+    print("Step 7: All JSON files written successfully!")
+
+    return {}
+
+
+# ==================================
+# ======== MAIN PROCESSING =========
+# ==================================
+# Pipeline stages in run order; each stage needs the outputs of all the stages before it
+PIPELINE_STAGES = {
+    "ingest": run_ingest_stage,
+    "groundtruth": run_ground_truth_stage,
+    "seasons": run_seasons_stage,
+    "partition": run_partition_stage,
+    "evaluations": run_evaluations_stage,
+    "write": run_write_stage,
+}
+
+# Options that change stage outputs: cached outputs are only reused by runs with the same options
+STAGE_CACHE_OPTIONS = ("compute_scores", "score_revisions_mode", "seasons", "all_models", "shard")
+
 
-        with open(season_dir / "evaluationsRawScoresData.json", "w") as f:
-            json.dump(season_evaluations_raw_scores, f, cls=NpEncoder, separators=(",", ":"))
+def stage_input_fingerprint(project_root, data_processing_dir, profile):
+    """
+    Fingerprints the files a pathogen run reads (its raw hub data, model config, locations and thresholds) by path,
+    size and modification time, so cached stage outputs built from other inputs are not reused.
+    """
+    input_paths = [project_root / profile["modelConfig"], data_processing_dir / "locations.csv", data_processing_dir / profile["thresholds"]]
+    # os.walk can follow symlinked folders (the perf harness links its fixture data in), unlike Path.rglob
+    raw_walk = os.walk(data_processing_dir / profile["rawDataDir"], followlinks=True)
+    input_paths += sorted(Path(folder) / file_name for folder, _, file_names in raw_walk for file_name in file_names)
+
+    digest = hashlib.sha256()
+    for path in input_paths:
+        if path.exists():
+            stat = path.stat()
+            digest.update(f"{path.relative_to(project_root).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def run_pathogen_pipeline(
+    pathogen,
+    profile,
+    shared_inputs,
+    compute_scores=False,
+    score_revisions_mode=False,
+    seasons=None,
+    all_models=False,
+    shard=None,
+    split_raw_scores=False,
+    stages=None,
+    project_root=None,
+):
+    """
+    Runs the full pipeline for one pathogen hub, writing its outputs under public/data/<outputSubdir>.
+    With compute_scores, evaluation scores are computed from the predictions (see scoring.py) instead of
+    read from the epistorm-evaluations CSVs. With score_revisions_mode, forecasts are also scored against
+    several vintages of the historical ground truth snapshots, and a per-season summary is written.
+    With seasons (e.g. ["2025-2026"]), only the prediction files of those seasons are read and only their
+    season folders are rewritten; files shared by all seasons are rewritten only if the newest season is included.
+    With all_models, every team found in the raw model-output tree is processed, not only the configured models
+    (see discover_hub_models), and the teams missing from the config get default colors.
+    With shard (k, n), the run processes the k-th of n interleaved slices of the seasons (see shard_seasons), like
+    a --seasons run, and writes its outputs to a partial directory under intermediate/<pathogen>/shards instead of
+    public/data; merge_shard_outputs combines the n partial trees once every shard has run.
+    With split_raw_scores, each season's raw scores are also written as one file per model and state, listed in
+    an index (see build_raw_score_shards).
+    With stages (names from PIPELINE_STAGES), only those stages run: the outputs of the stages before them
+    are loaded from the cache written by an earlier run, and the stages after them are skipped. A cached output is
+    only reused when it was built with the same options from the same input files (see stage_input_fingerprint);
+    otherwise it is discarded and its stage runs again.
+    project_root defaults to the repository; the perf harness points it at a copy of its fixture.
+    Returns whether the run completed (fatal input errors are reported and return False).
+    """
+    project_root = Path(project_root) if project_root is not None else get_project_root()
+    data_processing_dir = project_root / "data_processing_dir"
+    intermediate_dir = data_processing_dir / "intermediate" / pathogen
+    public_data_dir = project_root / "public" / "data" / profile["outputSubdir"]
+    if shard is not None:
+        # Shards keep their own caches, so several of them can run from one checkout
+        public_data_dir = shard_output_dir(intermediate_dir, *shard)
+        intermediate_dir = intermediate_dir / "shards" / f"{shard[0]}-of-{shard[1]}-work"
+    stage_cache_dir = intermediate_dir / "stages"
+    state = {
+        "pathogen": pathogen,
+        "profile": profile,
+        "shared_inputs": shared_inputs,
+        "project_root": project_root,
+        "compute_scores": compute_scores,
+        "score_revisions_mode": score_revisions_mode,
+        "seasons": seasons,
+        "all_models": all_models,
+        "shard": shard,
+        "split_raw_scores": split_raw_scores,
+        "season_ranges": [season_date_range(season) for season in seasons] if seasons else None,
+        "data_processing_dir": data_processing_dir,
+        "raw_data_dir": data_processing_dir / profile["rawDataDir"],
+        "intermediate_dir": intermediate_dir,
+        "public_data_dir": public_data_dir,
+        "hosp_target": profile["hospTarget"],
+        "rate_change_target": profile["rateChangeTarget"],
+        "locations_df": shared_inputs["locations_df"],
+    }
+    cache_key = {
+        "options": {option: state[option] for option in STAGE_CACHE_OPTIONS},
+        "inputs": stage_input_fingerprint(project_root, data_processing_dir, profile),
+    }
+    stage_names = list(PIPELINE_STAGES)
+    stages = stage_names if stages is None else stages
+    last_stage_index = max(stage_names.index(stage) for stage in stages)
+    print(f"----- Starting Full Data Pre-Processing ({profile['displayName']}) -----")
+
+    for stage in stage_names[: last_stage_index + 1]:
+        cache_path = stage_cache_dir / f"{stage}.pkl"
+        cached = None
+        if stage not in stages:
+            if not cache_path.exists():
+                print(f"Stage '{stage}': no cached output at {cache_path}, running it")
+            else:
+                cached = pd.read_pickle(cache_path)
+                if cached.get("key") != cache_key:
+                    changed = "options" if cached.get("key", {}).get("options") != cache_key["options"] else "input files"
+                    print(f"Stage '{stage}': cached output was built from other {changed}, discarding it and running the stage")
+                    cache_path.unlink()
+                    cached = None
+
+        if cached is None:
+            outputs = PIPELINE_STAGES[stage](state)
+            if outputs is None:
+                return False
+            if outputs:
+                stage_cache_dir.mkdir(exist_ok=True, parents=True)
+                pd.to_pickle({"key": cache_key, "outputs": outputs}, cache_path)
+        else:
+            outputs = cached["outputs"]
+            print(f"Stage '{stage}': loaded cached output from {cache_path}")
+        state.update(outputs)
 
-        print(f"     - Written 4 files for {season_id}")
+    return True
 
-    # ===== 7D. Write Dynamic Time Period Data =====
-    print("   - Writing dynamic time period data...")
 
-    for period_id in dynamic_periods.keys():
-        # Each dynamic period gets its own JSON file containing only evaluation data
-        period_evaluations = {
-            "precalculated": {
-                "iqr": iqr_data.get(period_id, {}),
-                "stateMap_aggregates": state_map_data.get(period_id, {}),
-                "detailedCoverage_aggregates": coverage_data.get(period_id, {}),
+def merge_shard_outputs(pathogen, profile, shard_count, project_root=None):
+    """
+    Combines the partial outputs of the `shard_count` --shard runs of one pathogen hub into public/data/<outputSubdir>.
+    Every season folder comes from the shard that processed it, and the shared files from the shard of the newest
+    season; in seasonMetadata.json, the nowcast models are those found by any shard, and each season's model
+    availability comes from the shard that processed it. The partial trees are read from
+    intermediate/<pathogen>/shards (copy them there when the shards ran on other machines), and every file is checked
+    against the hash in its shard's manifest (or raw score index). Returns whether the merge completed.
+    """
+    project_root = Path(project_root) if project_root is not None else get_project_root()
+    intermediate_dir = project_root / "data_processing_dir" / "intermediate" / pathogen
+    public_data_dir = project_root / "public" / "data" / profile["outputSubdir"]
+    print(f"----- Merging {shard_count} Shards ({profile['displayName']}) -----")
+
+    shard_dirs = [shard_output_dir(intermediate_dir, shard_index, shard_count) for shard_index in range(1, shard_count + 1)]
+    missing_dirs = [str(shard_dir) for shard_dir in shard_dirs if not (shard_dir / SHARD_INFO_FILE).exists()]
+    if missing_dirs:
+        print(f"FATAL ERROR: Missing shard outputs, run those shards first: {', '.join(missing_dirs)}")
+        return False
+
+    # Which shard each output comes from; a path written by two shards means they did not split the same seasons
+    sources = {}
+    nowcast_models = set()
+    season_availability = {}
+    for shard_dir in shard_dirs:
+        with open(shard_dir / SHARD_INFO_FILE, "r") as f:
+            shard_info = json.load(f)
+        nowcast_models.update(shard_info["nowcastModelNames"])
+        season_availability.update(shard_info["modelAvailabilityByPeriod"])
+        with open(shard_dir / OutputManifest.FILE_NAME, "r") as f:
+            shard_files = json.load(f)["files"]
+        for relative_path, entry in shard_files.items():
+            if relative_path in sources:
+                print(f"FATAL ERROR: {relative_path} was written by both {sources[relative_path][0]} and {shard_dir}")
+                return False
+            sources[relative_path] = (shard_dir, entry)
+            # Raw score shards are not in the manifest, their index lists them
+            if relative_path.endswith(f"/{RAW_SCORES_INDEX_FILE}"):
+                with open(shard_dir / relative_path, "r") as f:
+                    raw_scores_index = json.load(f)
+                season_folder = relative_path.rsplit("/", 1)[0]
+                for model, location_hashes in raw_scores_index["models"].items():
+                    for location, shard_hash in location_hashes.items():
+                        shard_path = f"{season_folder}/{raw_scores_index['path'].format(model=model, location=location)}"
+                        sources[shard_path] = (shard_dir, {"hash": shard_hash, "listed": False})
+
+    season_metadata_path = "auxiliary/seasonMetadata.json"
+    if season_metadata_path not in sources:
+        print("FATAL ERROR: No shard wrote the shared outputs (the newest season was not processed)")
+        return False
+
+    # Check every partial file before public/data is touched
+    for relative_path, (shard_dir, entry) in sources.items():
+        data = (shard_dir / relative_path).read_bytes()
+        if content_hash(data) != entry["hash"]:
+            print(f"FATAL ERROR: {shard_dir / relative_path} does not match the hash its shard recorded")
+            return False
+
+    output_manifest = OutputManifest(public_data_dir)
+    for relative_path, (shard_dir, entry) in sources.items():
+        data = (shard_dir / relative_path).read_bytes()
+        if relative_path == season_metadata_path:
+            season_metadata = json.loads(data)
+            season_metadata["nowcastModelNames"] = sorted(m for m in nowcast_models if m in season_metadata["modelNames"])
+            for model, metadata in season_metadata["modelMetadata"].items():
+                metadata["hasNowcast"] = model in season_metadata["nowcastModelNames"]
+            season_metadata["modelAvailabilityByPeriod"] = {
+                period_id: season_availability.get(period_id, availability)
+                for period_id, availability in season_metadata["modelAvailabilityByPeriod"].items()
             }
-            # Note: No raw scores for dynamic periods as per documentation
-        }
+            data = dumps_json(season_metadata)
+
+        output_path = public_data_dir / relative_path
+        output_path.parent.mkdir(exist_ok=True, parents=True)
+        output_manifest.write_bytes(output_path, data, listed=entry.get("listed", True))
+
+    # The merged seasons only keep the split raw score files their shard wrote
+    for season_folder in sorted({relative_path.split("/", 1)[0] for relative_path in sources if relative_path.startswith("season-")}):
+        shard_paths = None
+        if f"{season_folder}/{RAW_SCORES_INDEX_FILE}" in sources:
+            shard_prefix = f"{season_folder}/{RAW_SCORES_SHARDS_DIR}/"
+            shard_paths = [relative_path[len(season_folder) + 1 :] for relative_path in sources if relative_path.startswith(shard_prefix)]
+        remove_stale_raw_score_shards(public_data_dir / season_folder, output_manifest, shard_paths)
+
+    output_manifest.save()
+    print(
+        f"   - Written {OutputManifest.FILE_NAME}: {len(output_manifest.files)} files from {shard_count} shards "
+        f"({output_manifest.written_count} updated, {output_manifest.unchanged_count} unchanged)"
+    )
+    return True
+
 
-        with open(dynamic_dir / f"{period_id}.json", "w") as f:
-            json.dump(period_evaluations, f, cls=NpEncoder, separators=(",", ":"))
+def parse_season_arg(value):
+    """argparse type for --seasons: validates a season id and normalizes it to "season-YYYY-YYYY"."""
+    try:
+        season_date_range(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return f"season-{value.removeprefix('season-')}"
 
-        print(f"   - Written {period_id}.json")
 
-    print("Step 7: All JSON files written successfully!")
+def parse_shard_arg(value):
+    """argparse type for --shard: parses "K/N" into (K, N), with 1 <= K <= N."""
+    try:
+        shard_index, shard_count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{value}', expected K/N, e.g. 2/4")
+    if not 1 <= shard_index <= shard_count:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{value}', K must be between 1 and N")
+    return shard_index, shard_count
+
+
+def parse_shard_count_arg(value):
+    """argparse type for --merge-shards: a number of shards, at least 1."""
+    try:
+        shard_count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid shard count '{value}', expected a number")
+    if shard_count < 1:
+        raise argparse.ArgumentTypeError(f"Invalid shard count '{value}', at least 1 shard is needed")
+    return shard_count
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Pre-process forecast hub data into the dashboard's JSON files.")
+    parser.add_argument(
+        "--pathogens",
+        nargs="+",
+        choices=sorted(PATHOGEN_PROFILES),
+        default=["flu"],
+        help="Pathogen hubs to process; several are processed concurrently (default: flu)",
+    )
+    parser.add_argument(
+        "--compute-scores",
+        action="store_true",
+        help="Compute WIS ratio, MAPE and coverage from the predictions instead of reading the epistorm-evaluations CSVs",
+    )
+    parser.add_argument(
+        "--score-revisions",
+        action="store_true",
+        help="Also score forecasts against the ground truth as first reported, one week later, and in the latest snapshot",
+    )
+    parser.add_argument(
+        "--all-models",
+        action="store_true",
+        help="Process every team in the hub's model-output tree (see data_retrieval.sh --all-models), not only the models in the config",
+    )
+    parser.add_argument(
+        "--split-raw-scores",
+        action="store_true",
+        help="Also write each season's raw scores as one file per model and state, with an index, for the Single Model view",
+    )
+    shard_group = parser.add_mutually_exclusive_group()
+    shard_group.add_argument(
+        "--seasons",
+        "--season",
+        nargs="+",
+        type=parse_season_arg,
+        help="Only read the prediction files of these seasons (e.g. 2025-2026) and only rewrite their outputs (default: all seasons)",
+    )
+    shard_group.add_argument(
+        "--shard",
+        type=parse_shard_arg,
+        metavar="K/N",
+        help="Only process the K-th of N slices of the seasons, writing partial outputs under data_processing_dir/intermediate/<pathogen>/shards",
+    )
+    shard_group.add_argument(
+        "--merge-shards",
+        type=parse_shard_count_arg,
+        metavar="N",
+        help="Combine the partial outputs of shards 1/N to N/N into public/data, without running the pipeline",
+    )
+    stage_group = parser.add_mutually_exclusive_group()
+    stage_group.add_argument(
+        "--only",
+        nargs="+",
+        choices=list(PIPELINE_STAGES),
+        help="Only run these stages, loading the outputs of earlier stages from the cache of a previous run (when still up to date)",
+    )
+    stage_group.add_argument(
+        "--from",
+        dest="from_stage",
+        choices=list(PIPELINE_STAGES),
+        help="Run this stage and every stage after it, loading the outputs of earlier stages from the cache of a previous run (when still up to date)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    data_processing_dir = get_project_root() / "data_processing_dir"
+    profiles = {pathogen: PATHOGEN_PROFILES[pathogen] for pathogen in dict.fromkeys(args.pathogens)}
+
+    if args.merge_shards:
+        merged = [merge_shard_outputs(pathogen, profile, args.merge_shards) for pathogen, profile in profiles.items()]
+        if not all(merged):
+            sys.exit(1)
+        return
+
+    # Locations and thresholds are loaded and processed once, then handed to every pathogen run
+    try:
+        shared_inputs = load_shared_inputs(data_processing_dir, profiles)
+    except FileNotFoundError as e:
+        print(f"FATAL ERROR: A required data file was not found: {e}")
+        sys.exit(1)
+
+    stages = None
+    if args.only:
+        stages = [stage for stage in PIPELINE_STAGES if stage in args.only]
+    elif args.from_stage:
+        stage_names = list(PIPELINE_STAGES)
+        stages = stage_names[stage_names.index(args.from_stage) :]
+
+    pipeline_options = {
+        "compute_scores": args.compute_scores,
+        "score_revisions_mode": args.score_revisions,
+        "seasons": args.seasons,
+        "all_models": args.all_models,
+        "shard": args.shard,
+        "split_raw_scores": args.split_raw_scores,
+        "stages": stages,
+    }
+
+    if len(profiles) == 1:
+        pathogen, profile = next(iter(profiles.items()))
+        if not run_pathogen_pipeline(pathogen, profile, shared_inputs, **pipeline_options):
+            sys.exit(1)
+        return
+
+    print(f"Processing {len(profiles)} pathogens concurrently: {', '.join(profiles)}")
+    with ProcessPoolExecutor(max_workers=len(profiles)) as executor:
+        futures = {
+            pathogen: executor.submit(run_pathogen_pipeline, pathogen, profile, shared_inputs, **pipeline_options) for pathogen, profile in profiles.items()
+        }
+        completed = {pathogen: future.result() for pathogen, future in futures.items()}
+    for pathogen, pathogen_completed in completed.items():
+        status = "Finished" if pathogen_completed else "FAILED"
+        print(f"----- {status} {PATHOGEN_PROFILES[pathogen]['displayName']} -----")
+
+    # A failed pathogen must fail the whole invocation, so the data workflow does not publish partial outputs
+    if not all(completed.values()):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -15,6 +15,12 @@ fi
 
 echo "Loaded ${#team_names[@]} models from config: ${team_names[*]}"
 
+# With --all-models, every team in the hub's model-output tree is copied (for data_processing.py --all-models)
+if [ "$1" == "--all-models" ]; then
+    team_names=($(find "FluSight-forecast-hub/model-output" -mindepth 1 -maxdepth 1 -type d -printf "%f\n" | sort))
+    echo "Copying all ${#team_names[@]} teams of the hub"
+fi
+
 NEW_PREDICTION_DATA_COPIED=false
 NEW_SURVEILLANCE_DATA_COPIED=false
 NEW_SURVEILLANCE_ARCHIVE_DATA_COPIED=false
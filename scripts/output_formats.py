@@ -0,0 +1,28 @@
+"""
+Format tags and layouts of the files published under public/data, shared by the pipeline that writes them
+(data_processing.py) and the readers of the published files (published_data.py), without importing the pipeline.
+"""
+
+# Format tag of the columnar groundTruthData.json files
+GROUND_TRUTH_COLUMNS_FORMAT = "ground-truth-columns-v1"
+
+# Format tag and level names (in code order, as nowcastRiskLevels in the frontend) of the activityLevelsData.json files
+ACTIVITY_LEVELS_FORMAT = "activity-levels-v1"
+ACTIVITY_LEVELS = ["No Data", "Low", "Medium", "High"]
+
+# Format tag and row layout of the sparse predictionsData.json files
+SPARSE_PREDICTIONS_FORMAT = "sparse-predictions-v1"
+SPARSE_PREDICTION_FIELDS = ["referenceDate", "location", "targetDate", "horizon", "median", "PI50low", "PI50high", "PI90low", "PI90high", "PI95low", "PI95high"]
+
+# Format tag of latest.json, the first-paint slice of the default season (see build_latest_snapshot)
+LATEST_SNAPSHOT_FORMAT = "latest-snapshot-v1"
+
+# Optional per-model/per-state raw score files of a season (--split-raw-scores): the index lists the content hash
+# of every shard, and the shards (at RAW_SCORES_SHARD_PATH in the season folder) are left out of manifest.json
+RAW_SCORES_INDEX_FILE = "evaluationsRawScoresIndex.json"
+RAW_SCORES_SHARDS_FORMAT = "raw-score-shards-v1"
+RAW_SCORES_SHARD_PATH = "raw-scores/{model}/{location}.json"
+RAW_SCORES_SHARDS_DIR = "raw-scores"
+
+# Format tag of the pairwise relative WIS files, published next to each season's and dynamic period's precalculated data
+PAIRWISE_SKILL_FORMAT = "pairwise-relative-wis-v1"
@@ -0,0 +1,326 @@
+"""
+Performance regression harness for the data pre-processing pipeline.
+
+Runs the pipeline on a frozen fixture dataset, diffs every output file semantically against golden
+copies, and compares per-stage timings and peak memory against stored budgets:
+
+    python scripts/perf_harness.py freeze <fixture-dir> --seasons 2024-2025   # copy a subset of the raw data
+    python scripts/perf_harness.py update <fixture-dir>                       # (re)record golden outputs and budgets
+    python scripts/perf_harness.py check <fixture-dir>                        # exits 1 on any regression
+
+A fixture directory holds a copy of data_processing_dir and the model config, next to `golden/`
+(the published files of a reference run) and `budgets.json` (per-stage seconds and peak MB).
+With --all-models, freeze copies every team of the hub and update records a hub-scale run
+(data_processing.py --all-models); check then reruns the fixture the way its budgets were recorded.
+
+Fixtures are not committed (a one-season flu fixture is over 100 MB of hub data). CI builds one for every pull request
+that touches scripts/ (.github/workflows/perf-check.yaml): it freezes the 2024-2025 season, records the golden outputs
+and budgets with the base branch's scripts, and fails the check when the PR's scripts do not reproduce them.
+To do the same locally, fetch the raw data first (scripts/data_retrieval.sh), then freeze and record a fixture from
+a commit whose outputs you trust:
+
+    git checkout <reference commit>
+    python scripts/perf_harness.py freeze ../perf-fixture --seasons 2024-2025
+    python scripts/perf_harness.py update ../perf-fixture
+    git checkout -                                                            # back to the change to check
+    python scripts/perf_harness.py check ../perf-fixture
+
+Budgets are only meaningful on the machine that recorded them: rerun `update` when switching machines.
+"""
+
+import argparse
+import json
+import math
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import data_processing  # pyright: ignore[reportImplicitRelativeImport]
+from data_processing import PATHOGEN_PROFILES, RAW_SCORES_INDEX_FILE, OutputManifest, get_project_root, load_shared_inputs  # pyright: ignore[reportImplicitRelativeImport]
+
+GOLDEN_DIR = "golden"
+BUDGETS_FILE = "budgets.json"
+
+# Stages faster than this are dominated by noise, so their time budget gets this much absolute slack (seconds)
+DEFAULT_TIME_SLACK = 0.5
+DEFAULT_TIME_TOLERANCE = 0.5
+DEFAULT_MEMORY_TOLERANCE = 0.25
+DEFAULT_FLOAT_TOLERANCE = 1e-9
+
+# Differences listed per run before the rest are only counted
+MAX_REPORTED_DIFFERENCES = 20
+
+
+def reset_peak_memory():
+    """Resets the peak resident memory of this process (Linux only; elsewhere peaks are process-wide)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_memory_mb():
+    """Returns the peak resident memory of this process since the last reset_peak_memory(), in MB."""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 2**10
+    except OSError:
+        pass
+
+    import resource
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 2**20 if sys.platform == "darwin" else max_rss / 2**10
+
+
+def freeze_fixture(fixture_dir: Path, pathogen, seasons=None, all_models=False):
+    """
+    Copies the inputs of one pathogen run into a fixture directory: locations, thresholds, model config,
+    ground truth (with its hospital admissions snapshots), evaluation scores, and the prediction files
+    of the given seasons (all of them when None), of the configured models or, with all_models, of every team.
+    """
+    profile = PATHOGEN_PROFILES[pathogen]
+    project_root = get_project_root()
+    source_dir = project_root / "data_processing_dir"
+    raw_source_dir = source_dir / profile["rawDataDir"]
+    season_ranges = [data_processing.season_date_range(season) for season in seasons] if seasons else None
+
+    with open(project_root / profile["modelConfig"], "r") as f:
+        model_config = json.load(f)
+    model_names = [model["name"] for model in model_config["models"]]
+    if all_models:
+        model_names = data_processing.discover_hub_models(raw_source_dir / "unprocessed", model_names, profile["baselineModel"])
+    model_dirs = [f"unprocessed/{model}" for model in model_names]
+    model_dirs += [f"archive/{model}" for model in model_config.get("archiveModels", [])]
+    model_dirs.append(f"unprocessed/{profile['baselineModel']}")
+
+    files = [project_root / profile["modelConfig"], source_dir / "locations.csv", source_dir / profile["thresholds"]]
+    files += [raw_source_dir / "ground-truth" / "target-hospital-admissions.csv"]
+    files += sorted((raw_source_dir / "ground-truth" / "historical-data").glob("target-hospital-admissions_*.csv"))
+    files += sorted((raw_source_dir / "evaluations-score").glob("*.csv"))
+    for model_dir in model_dirs:
+        files += data_processing.select_prediction_files(raw_source_dir / model_dir, season_ranges)
+
+    copied_count = 0
+    for source in files:
+        if not source.exists():
+            print(f"   - Skipping missing input {source.relative_to(project_root)}")
+            continue
+        target = fixture_dir / source.relative_to(project_root)
+        target.parent.mkdir(exist_ok=True, parents=True)
+        shutil.copy2(source, target)
+        copied_count += 1
+
+    print(f"Froze {copied_count} input files for {pathogen} into {fixture_dir}")
+
+
+def run_fixture(fixture_dir: Path, pathogen, work_dir: Path, all_models=False):
+    """
+    Runs the pipeline on a fixture in `work_dir` (the fixture inputs are linked, never written to).
+    Returns the directory of the published files and the per-stage {seconds, peakMemoryMB}.
+    """
+    (work_dir / "data_processing_dir").mkdir(parents=True)
+    for entry in (fixture_dir / "data_processing_dir").iterdir():
+        (work_dir / "data_processing_dir" / entry.name).symlink_to(entry.resolve(), target_is_directory=entry.is_dir())
+    for config_file in fixture_dir.glob("model_config*.json"):
+        shutil.copy2(config_file, work_dir / config_file.name)
+
+    # Every stage is timed and its peak resident memory recorded, without changing the pipeline itself
+    stage_stats = {}
+    original_stages = dict(data_processing.PIPELINE_STAGES)
+
+    def measured(stage_name, stage):
+        def run_stage(state):
+            reset_peak_memory()
+            start = time.perf_counter()
+            outputs = stage(state)
+            stage_stats[stage_name] = {
+                "seconds": round(time.perf_counter() - start, 3),
+                "peakMemoryMB": round(peak_memory_mb(), 1),
+            }
+            return outputs
+
+        return run_stage
+
+    profile = PATHOGEN_PROFILES[pathogen]
+    try:
+        for stage_name, stage in original_stages.items():
+            data_processing.PIPELINE_STAGES[stage_name] = measured(stage_name, stage)
+        shared_inputs = load_shared_inputs(work_dir / "data_processing_dir", {pathogen: profile})
+        completed = data_processing.run_pathogen_pipeline(pathogen, profile, shared_inputs, all_models=all_models, project_root=work_dir)
+    finally:
+        data_processing.PIPELINE_STAGES.update(original_stages)
+
+    if not completed:
+        raise RuntimeError(f"The pipeline failed on fixture {fixture_dir}")
+    return work_dir / "public" / "data" / profile["outputSubdir"], stage_stats
+
+
+def compare_values(expected, actual, path, differences, float_tolerance):
+    """Recursively compares two parsed JSON values, appending a description of every difference."""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in expected.keys() - actual.keys():
+            differences.append(f"{path}/{key}: missing")
+        for key in actual.keys() - expected.keys():
+            differences.append(f"{path}/{key}: unexpected")
+        for key in expected.keys() & actual.keys():
+            compare_values(expected[key], actual[key], f"{path}/{key}", differences, float_tolerance)
+    elif isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            differences.append(f"{path}: length {len(expected)} != {len(actual)}")
+            return
+        for i, (expected_item, actual_item) in enumerate(zip(expected, actual)):
+            compare_values(expected_item, actual_item, f"{path}[{i}]", differences, float_tolerance)
+    elif isinstance(expected, float) or isinstance(actual, float):
+        both_numbers = isinstance(expected, (int, float)) and isinstance(actual, (int, float))
+        if not both_numbers or not math.isclose(expected, actual, rel_tol=float_tolerance, abs_tol=float_tolerance):
+            differences.append(f"{path}: {expected!r} != {actual!r}")
+    elif expected != actual or type(expected) is not type(actual):
+        differences.append(f"{path}: {expected!r} != {actual!r}")
+
+
+def strip_content_hashes(path, value):
+    """
+    Drops the content hashes of a parsed JSON output: they change with any byte of the file they version,
+    so they would defeat the float tolerance. The files they version are compared on their own.
+    """
+    if path.endswith(RAW_SCORES_INDEX_FILE):
+        # model -> location -> shard hash: keep which shards exist, not their hashes
+        return {**value, "models": {model: sorted(location_hashes) for model, location_hashes in value.get("models", {}).items()}}
+    if isinstance(value, dict):
+        return {key: strip_content_hashes(path, item) for key, item in value.items() if key != "hash"}
+    if isinstance(value, list):
+        return [strip_content_hashes(path, item) for item in value]
+    return value
+
+
+def compare_outputs(golden_dir: Path, output_dir: Path, float_tolerance=DEFAULT_FLOAT_TOLERANCE):
+    """
+    Diffs every published file against its golden copy: JSON semantically (without content hashes), other files
+    byte for byte. manifest.json only holds hashes and sizes, so it is skipped.
+    """
+    golden_files = {p.relative_to(golden_dir).as_posix() for p in golden_dir.rglob("*") if p.is_file()}
+    output_files = {p.relative_to(output_dir).as_posix() for p in output_dir.rglob("*") if p.is_file()}
+    golden_files.discard(OutputManifest.FILE_NAME)
+    output_files.discard(OutputManifest.FILE_NAME)
+
+    differences = [f"{path}: missing" for path in sorted(golden_files - output_files)]
+    differences += [f"{path}: unexpected file" for path in sorted(output_files - golden_files)]
+    for path in sorted(golden_files & output_files):
+        if path.endswith(".json"):
+            with open(golden_dir / path, "r") as f:
+                expected = strip_content_hashes(path, json.load(f))
+            with open(output_dir / path, "r") as f:
+                actual = strip_content_hashes(path, json.load(f))
+            compare_values(expected, actual, path, differences, float_tolerance)
+        elif (golden_dir / path).read_bytes() != (output_dir / path).read_bytes():
+            differences.append(f"{path}: contents differ")
+    return differences
+
+
+def compare_budgets(budgets, stage_stats, time_tolerance, memory_tolerance, time_slack):
+    """Returns the stages whose time or peak memory exceeds its budget by more than the tolerance."""
+    regressions = []
+    print(f"   {'stage':<12} {'seconds':>9} {'budget':>9} {'peak MB':>9} {'budget':>9}")
+    for stage_name, stats in stage_stats.items():
+        budget = budgets.get(stage_name)
+        if budget is None:
+            print(f"   {stage_name:<12} {stats['seconds']:>9.2f} {'-':>9} {stats['peakMemoryMB']:>9.1f} {'-':>9}")
+            continue
+        print(f"   {stage_name:<12} {stats['seconds']:>9.2f} {budget['seconds']:>9.2f} {stats['peakMemoryMB']:>9.1f} {budget['peakMemoryMB']:>9.1f}")
+
+        if stats["seconds"] > budget["seconds"] * (1 + time_tolerance) + time_slack:
+            regressions.append(f"{stage_name}: {stats['seconds']:.2f}s exceeds the {budget['seconds']:.2f}s budget")
+        if stats["peakMemoryMB"] > budget["peakMemoryMB"] * (1 + memory_tolerance):
+            regressions.append(f"{stage_name}: {stats['peakMemoryMB']:.1f} MB exceeds the {budget['peakMemoryMB']:.1f} MB budget")
+    return regressions
+
+
+def update_fixture(fixture_dir: Path, pathogen, all_models=False):
+    """Runs the fixture and records its outputs as golden copies and its stage measurements as budgets."""
+    with tempfile.TemporaryDirectory() as work_dir:
+        output_dir, stage_stats = run_fixture(fixture_dir, pathogen, Path(work_dir), all_models)
+        shutil.rmtree(fixture_dir / GOLDEN_DIR, ignore_errors=True)
+        shutil.copytree(output_dir, fixture_dir / GOLDEN_DIR)
+
+    with open(fixture_dir / BUDGETS_FILE, "w") as f:
+        json.dump({"version": 1, "pathogen": pathogen, "allModels": all_models, "stages": stage_stats}, f, indent=2)
+    print(f"Recorded golden outputs and budgets for {len(stage_stats)} stages in {fixture_dir}")
+
+
+def check_fixture(fixture_dir: Path, pathogen, time_tolerance, memory_tolerance, time_slack, float_tolerance):
+    """Runs the fixture and returns whether its outputs and stage measurements are within the recorded ones."""
+    budgets_path = fixture_dir / BUDGETS_FILE
+    if not budgets_path.exists():
+        print(f"No {BUDGETS_FILE} in {fixture_dir}: create the fixture with `freeze` and `update` first")
+        return False
+    with open(budgets_path, "r") as f:
+        recorded = json.load(f)
+    budgets = recorded["stages"]
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        output_dir, stage_stats = run_fixture(fixture_dir, pathogen, Path(work_dir), recorded.get("allModels", False))
+        differences = compare_outputs(fixture_dir / GOLDEN_DIR, output_dir, float_tolerance)
+
+    print("Per-stage measurements:")
+    regressions = compare_budgets(budgets, stage_stats, time_tolerance, memory_tolerance, time_slack)
+
+    if differences:
+        print(f"FAILED: {len(differences)} output differences from the golden copies")
+        for difference in differences[:MAX_REPORTED_DIFFERENCES]:
+            print(f"   - {difference}")
+        if len(differences) > MAX_REPORTED_DIFFERENCES:
+            print(f"   - ... and {len(differences) - MAX_REPORTED_DIFFERENCES} more")
+    if regressions:
+        print(f"FAILED: {len(regressions)} stage budgets exceeded")
+        for regression in regressions:
+            print(f"   - {regression}")
+    if not differences and not regressions:
+        print("PASSED: outputs match the golden copies and every stage is within budget")
+    return not differences and not regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Performance regression harness for the data pre-processing pipeline.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    freeze_parser = subparsers.add_parser("freeze", help="Copy the pipeline inputs (optionally a few seasons of predictions) into a fixture")
+    freeze_parser.add_argument("--seasons", nargs="+", help="Only copy the prediction files of these seasons (e.g. 2024-2025)")
+    freeze_parser.add_argument("--all-models", action="store_true", help="Copy the prediction files of every team, not only the configured models")
+
+    update_parser = subparsers.add_parser("update", help="Run the fixture and record its outputs and stage measurements as the reference")
+    update_parser.add_argument("--all-models", action="store_true", help="Record a hub-scale run, processing every team of the fixture")
+
+    check_parser = subparsers.add_parser("check", help="Run the fixture and fail on output differences or exceeded budgets")
+    check_parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE, help="Allowed relative slowdown per stage")
+    check_parser.add_argument("--time-slack", type=float, default=DEFAULT_TIME_SLACK, help="Allowed absolute slowdown per stage, in seconds")
+    check_parser.add_argument("--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE, help="Allowed relative peak memory increase per stage")
+    check_parser.add_argument("--float-tolerance", type=float, default=DEFAULT_FLOAT_TOLERANCE, help="Tolerance when comparing numbers in JSON outputs")
+
+    for subparser in subparsers.choices.values():
+        subparser.add_argument("fixture_dir", type=Path, help="Fixture directory")
+        subparser.add_argument("--pathogen", choices=sorted(PATHOGEN_PROFILES), default="flu", help="Pathogen hub of the fixture (default: flu)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    fixture_dir = args.fixture_dir.resolve()
+
+    if args.command == "freeze":
+        freeze_fixture(fixture_dir, args.pathogen, args.seasons, args.all_models)
+    elif args.command == "update":
+        update_fixture(fixture_dir, args.pathogen, args.all_models)
+    else:
+        passed = check_fixture(fixture_dir, args.pathogen, args.time_tolerance, args.memory_tolerance, args.time_slack, args.float_tolerance)
+        sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
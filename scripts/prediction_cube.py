@@ -0,0 +1,131 @@
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# All quantile levels published by the FluSight hub, in ascending order
+HUB_QUANTILE_LEVELS = [0.01, 0.025, 0.05, 0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.55, 0.6, 0.65, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95, 0.975, 0.99]
+
+# Quantile levels as they appear in the hub's output_type_id column (and as pivoted column names)
+HUB_QUANTILE_IDS = [str(q) for q in HUB_QUANTILE_LEVELS]
+
+HORIZONS = [0, 1, 2, 3]
+
+CUBE_VALUES_FILE = "values.npy"
+CUBE_AXES_FILE = "axes.json"
+
+
+def build_prediction_cube(preds_df: pd.DataFrame, cube_dir: Path, model_names=None):
+    """
+    Builds the on-disk quantile cube from hospitalization predictions pivoted to one row per forecast
+    (reference_date, target_end_date, location, model) and one column per hub quantile id, as in the main pipeline.
+
+    The cube is a float32 array of shape (reference date, horizon, location, model, quantile),
+    NaN where a model did not forecast, written as `values.npy` next to `axes.json` holding the
+    labels of every axis. Forecasts falling on the same cell are averaged, as pivot_table does.
+    """
+    cube_dir = Path(cube_dir)
+    cube_dir.mkdir(exist_ok=True, parents=True)
+
+    df = preds_df.reindex(columns=["reference_date", "target_end_date", "location", "model"] + HUB_QUANTILE_IDS)
+    df["reference_date"] = pd.to_datetime(df["reference_date"])
+    df["target_end_date"] = pd.to_datetime(df["target_end_date"])
+    df["horizon"] = (df["target_end_date"] - df["reference_date"]).dt.days // 7
+    df = df[df["horizon"].isin(HORIZONS)]
+    df = df.groupby(["reference_date", "horizon", "location", "model"], sort=False)[HUB_QUANTILE_IDS].mean().reset_index()
+
+    # Axis labels: every reference date in the data, every location/model that forecast at least once
+    reference_dates = pd.DatetimeIndex(np.sort(df["reference_date"].unique()))
+    locations = sorted(df["location"].unique())
+    if model_names is None:
+        models = sorted(df["model"].unique())
+    else:
+        forecasting_models = set(df["model"].unique())
+        models = [m for m in model_names if m in forecasting_models]
+
+    shape = (len(reference_dates), len(HORIZONS), len(locations), len(models), len(HUB_QUANTILE_LEVELS))
+    values = np.lib.format.open_memmap(cube_dir / CUBE_VALUES_FILE, mode="w+", dtype=np.float32, shape=shape)
+    values[:] = np.nan
+
+    df = df[df["model"].isin(models)]
+    if not df.empty:
+        date_idx = reference_dates.get_indexer(df["reference_date"])
+        horizon_idx = df["horizon"].to_numpy(dtype=np.int64) - HORIZONS[0]
+        location_idx = pd.Index(locations).get_indexer(df["location"])
+        model_idx = pd.Index(models).get_indexer(df["model"])
+        values[date_idx, horizon_idx, location_idx, model_idx] = df[HUB_QUANTILE_IDS].to_numpy(dtype=np.float32)
+
+    values.flush()
+    del values
+
+    axes = {
+        "shape": list(shape),
+        "dtype": "float32",
+        "referenceDates": [d.strftime("%Y-%m-%d") for d in reference_dates],
+        "horizons": HORIZONS,
+        "locations": locations,
+        "models": models,
+        "quantiles": HUB_QUANTILE_LEVELS,
+    }
+    with open(cube_dir / CUBE_AXES_FILE, "w") as f:
+        json.dump(axes, f, separators=(",", ":"))
+
+    return shape
+
+
+class PredictionCube:
+    """
+    Read-only, memory-mapped view of a quantile cube written by `build_prediction_cube`.
+    Slicing only pages in the requested part of the file, so any season/model/location can be
+    extracted without loading every prediction into memory.
+    """
+
+    def __init__(self, cube_dir: Path):
+        cube_dir = Path(cube_dir)
+        with open(cube_dir / CUBE_AXES_FILE, "r") as f:
+            axes = json.load(f)
+
+        self.values = np.load(cube_dir / CUBE_VALUES_FILE, mmap_mode="r")
+        self.reference_dates = pd.DatetimeIndex(pd.to_datetime(axes["referenceDates"]))
+        self.horizons = axes["horizons"]
+        self.locations = axes["locations"]
+        self.models = axes["models"]
+        self.quantiles = axes["quantiles"]
+
+    def date_range(self, start, end):
+        """Returns the slice of the reference date axis within [start, end] (inclusive)."""
+        lo = self.reference_dates.searchsorted(pd.Timestamp(start), side="left")
+        hi = self.reference_dates.searchsorted(pd.Timestamp(end), side="right")
+        return slice(lo, hi)
+
+    def select(self, start=None, end=None, model=None, location=None):
+        """
+        Returns the sub-cube for a reference date range and optionally a single model and/or location,
+        as a memory-mapped view (the model/location axes are dropped when selected).
+        """
+        dates = self.date_range(start or self.reference_dates.min(), end or self.reference_dates.max())
+        location_idx = slice(None) if location is None else self.locations.index(location)
+        model_idx = slice(None) if model is None else self.models.index(model)
+        return self.values[dates, :, location_idx, model_idx, :]
+
+    def to_frame(self, start=None, end=None, model=None, location=None):
+        """
+        Returns the selection as a wide DataFrame with one row per reference date/horizon/location/model
+        that has any forecast, and one column per quantile level.
+        """
+        dates = self.date_range(start or self.reference_dates.min(), end or self.reference_dates.max())
+        locations = self.locations if location is None else [location]
+        models = self.models if model is None else [model]
+
+        block = np.asarray(self.select(start, end, model=model, location=location))
+        block = block.reshape(dates.stop - dates.start, len(self.horizons), len(locations), len(models), len(self.quantiles))
+
+        index = pd.MultiIndex.from_product(
+            [self.reference_dates[dates], self.horizons, locations, models],
+            names=["reference_date", "horizon", "location", "model"],
+        )
+        frame = pd.DataFrame(block.reshape(len(index), len(self.quantiles)), index=index, columns=[str(q) for q in self.quantiles])
+        frame = frame.dropna(how="all").reset_index()
+        frame["target_end_date"] = frame["reference_date"] + pd.to_timedelta(frame["horizon"] * 7, unit="D")
+        return frame
+
@@ -0,0 +1,278 @@
+"""
+Readers for the season files published under public/data, for ad-hoc analysis in Python.
+
+The files are parsed incrementally: only the values of the requested model/location/metric are built,
+one season at a time, so reading one model or state across every season runs in constant memory:
+
+    from published_data import read_predictions, read_raw_scores
+
+    preds = read_predictions("public/data", model="FluSight-ensemble", location="US", start="2023-10-01")
+    wis = read_raw_scores("public/data", metric="WIS/Baseline", location="06", horizon=2)
+
+Both return long-format DataFrames with datetime64 date columns, concatenated over the selected seasons.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ijson is optional: it streams the files instead of loading each one whole.
+# Without it every season file is read with json.load (same results, more memory).
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from output_formats import SPARSE_PREDICTIONS_FORMAT  # pyright: ignore[reportImplicitRelativeImport]
+
+PREDICTIONS_FILE = "predictionsData.json"
+RAW_SCORES_FILE = "evaluationsRawScoresData.json"
+
+# The partitions that hold forecasts (pre-forecast and post-forecast are always empty)
+FORECAST_PARTITIONS = ("full-forecast", "forecast-tail")
+
+# Column names for the leading fields of a sparse prediction row, the interval fields keep their published names
+PREDICTION_COLUMNS = {"referenceDate": "reference_date", "location": "location", "targetDate": "target_end_date"}
+
+RAW_SCORE_COLUMNS = ["season", "metric", "model", "location", "horizon", "reference_date", "target_end_date", "score"]
+
+
+def list_seasons(public_data_dir):
+    """Returns the ids of the full-range seasons published in a data directory, oldest first."""
+    return sorted(path.name for path in Path(public_data_dir).glob("season-*") if path.is_dir())
+
+
+def _accepts(value, selection):
+    """Whether a key is selected: `selection` is None (anything), a single value, or a collection of values."""
+    if selection is None:
+        return True
+    if isinstance(selection, (str, int)):
+        return value == selection
+    return value in selection
+
+
+def _date_range(start, end):
+    """
+    Returns a predicate on ISO date strings for the dates within [start, end] (either bound may be None),
+    or None if there is no bound. The published dates have no time of day, so the bounds are rounded to days.
+    """
+    if start is None and end is None:
+        return None
+    start = None if start is None else pd.Timestamp(start).ceil("D").strftime("%Y-%m-%d")
+    end = None if end is None else pd.Timestamp(end).floor("D").strftime("%Y-%m-%d")
+    return lambda date: (start is None or date >= start) and (end is None or date <= end)
+
+
+def _first_scalar(obj):
+    """The first scalar in an array or object, depth first (None if there is none)."""
+    while isinstance(obj, (dict, list)):
+        if not obj:
+            return None
+        obj = next(iter(obj.values())) if isinstance(obj, dict) else obj[0]
+    return obj
+
+
+def _walk_values(obj, select, keys=()):
+    """In-memory counterpart of _stream_values, used when ijson is not installed."""
+    decision = select(keys)
+    if callable(decision):
+        if decision(_first_scalar(obj)):
+            yield keys, obj
+    elif decision:
+        yield keys, obj
+    elif decision is None:
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                yield from _walk_values(value, select, keys + (key,))
+        elif isinstance(obj, list):
+            for value in obj:
+                yield from _walk_values(value, select, keys + (None,))
+
+
+def _stream_values(path, select):
+    """
+    Parses a JSON file incrementally and yields (keys, value) for the values selected by `select`.
+    `keys` is the path of object keys from the root (None for array items). For each value, select(keys)
+    returns True to build and yield it, False to skip it, or None to descend into it. It may also return a
+    predicate on the first scalar of the value (e.g. the reference date leading a row): the value is then
+    only built if the predicate accepts it, and skipped as soon as that scalar is read otherwise.
+    """
+    if ijson is None:
+        with open(path, "r") as f:
+            yield from _walk_values(json.load(f), select)
+        return
+
+    with open(path, "rb") as f:
+        events = ijson.basic_parse(f, use_float=True)
+        # One [key of the current child] entry per open container
+        open_keys = []
+        for event, value in events:
+            if event == "map_key":
+                open_keys[-1] = value
+                continue
+            if event in ("end_map", "end_array"):
+                open_keys.pop()
+                continue
+
+            keys = tuple(open_keys)
+            decision = select(keys)
+            is_container = event in ("start_map", "start_array")
+            pending = [(event, value)]
+            if callable(decision):
+                # Read up to the first scalar, which decides whether the value is built or skipped
+                while pending[-1][0] in ("start_map", "start_array", "map_key"):
+                    pending.append(next(events))
+                accepted = decision(pending[-1][1] if pending[-1][0] not in ("end_map", "end_array") else None)
+                if not accepted:
+                    depth = sum(1 if e in ("start_map", "start_array") else -1 if e in ("end_map", "end_array") else 0 for e, _ in pending)
+                    while depth:
+                        event, _ = next(events)
+                        if event in ("start_map", "start_array"):
+                            depth += 1
+                        elif event in ("end_map", "end_array"):
+                            depth -= 1
+                    continue
+            if decision:
+                builder = ijson.ObjectBuilder()
+                depth = 0
+                for event, value in pending:
+                    builder.event(event, value)
+                    if event in ("start_map", "start_array"):
+                        depth += 1
+                    elif event in ("end_map", "end_array"):
+                        depth -= 1
+                while depth:
+                    event, value = next(events)
+                    builder.event(event, value)
+                    if event in ("start_map", "start_array"):
+                        depth += 1
+                    elif event in ("end_map", "end_array"):
+                        depth -= 1
+                yield keys, builder.value
+            elif decision is False and is_container:
+                depth = 1
+                while depth:
+                    event, _ = next(events)
+                    if event in ("start_map", "start_array"):
+                        depth += 1
+                    elif event in ("end_map", "end_array"):
+                        depth -= 1
+            elif is_container:
+                open_keys.append(None)
+
+
+def read_season_predictions(path, model=None, location=None, start=None, end=None, partitions=FORECAST_PARTITIONS):
+    """
+    Reads the forecasts of one predictionsData.json file, optionally restricted to some models/locations
+    (a name or a collection of names) and to reference dates within [start, end].
+
+    Returns one row per forecast: model, partition, reference_date, location, target_end_date, horizon,
+    median and the PI50/PI90/PI95 bounds.
+    """
+    header = {}
+    in_range = _date_range(start, end)
+    # Rows lead with their reference date's offset into the date axis, read before any row
+    accepts_row = True if in_range is None else (lambda ref_index: in_range(header["dates"][ref_index]))
+
+    def select(keys):
+        if len(keys) == 1:
+            return True if keys[0] in ("format", "fields", "dates") else (None if keys[0] == "models" else False)
+        if len(keys) == 2:
+            return None if _accepts(keys[1], model) else False
+        if len(keys) == 3:
+            return None if keys[2] == "partitions" else False
+        if len(keys) == 4:
+            return None if keys[3] in partitions else False
+        return accepts_row if len(keys) == 5 else None
+
+    models, partition_names, rows = [], [], []
+    for keys, value in _stream_values(path, select):
+        if len(keys) == 1:
+            header[keys[0]] = value
+        elif location is None or _accepts(value[1], location):
+            models.append(keys[1])
+            partition_names.append(keys[3])
+            rows.append(value)
+
+    if header.get("format") != SPARSE_PREDICTIONS_FORMAT:
+        raise ValueError(f"{path} is not a {SPARSE_PREDICTIONS_FORMAT} file")
+
+    fields = header["fields"]
+    df = pd.DataFrame(rows, columns=fields)
+    dates = pd.DatetimeIndex(pd.to_datetime(header["dates"]))
+    for field in ("referenceDate", "targetDate"):
+        df[field] = dates[df[field].to_numpy(dtype=np.int64)]
+    df = df.rename(columns=PREDICTION_COLUMNS)
+    df.insert(0, "partition", partition_names)
+    df.insert(0, "model", models)
+    return df
+
+
+def read_season_raw_scores(path, metric=None, model=None, location=None, horizon=None, start=None, end=None):
+    """
+    Reads the per-forecast scores of one evaluationsRawScoresData.json file, optionally restricted to some
+    metrics/models/locations/horizons (a value or a collection of values) and to reference dates within [start, end].
+    """
+    horizons = None if horizon is None else {str(h) for h in np.atleast_1d(horizon)}
+    selections = [metric, model, location, horizons]
+    # Score entries lead with their reference date
+    in_range = _date_range(start, end)
+    accepts_entry = True if in_range is None else in_range
+
+    def select(keys):
+        if len(keys) == 6:
+            return accepts_entry
+        if keys and keys[0] != "rawScores":
+            return False
+        return None if all(_accepts(key, selection) for key, selection in zip(keys[1:], selections)) else False
+
+    records = []
+    for keys, entry in _stream_values(path, select):
+        records.append((keys[1], keys[2], keys[3], int(keys[4]), entry["referenceDate"], entry["targetEndDate"], entry["score"]))
+
+    df = pd.DataFrame(records, columns=RAW_SCORE_COLUMNS[1:])
+    df["reference_date"] = pd.to_datetime(df["reference_date"])
+    df["target_end_date"] = pd.to_datetime(df["target_end_date"])
+    return df
+
+
+def _read_seasons(public_data_dir, file_name, read_season, seasons, **filters):
+    """Reads one file from every selected season directory and concatenates the results with a season column."""
+    public_data_dir = Path(public_data_dir)
+    season_ids = list_seasons(public_data_dir) if seasons is None else [s if s.startswith("season-") else f"season-{s}" for s in np.atleast_1d(seasons)]
+
+    frames = []
+    for season_id in season_ids:
+        path = public_data_dir / season_id / file_name
+        if not path.exists():
+            continue
+        frame = read_season(path, **filters)
+        frame.insert(0, "season", season_id)
+        frames.append(frame)
+
+    # Seasons where nothing was selected have no values to infer column dtypes from: leave them out of the concat
+    non_empty = [frame for frame in frames if len(frame)]
+    frames = non_empty or frames[:1]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def read_predictions(public_data_dir, model=None, location=None, start=None, end=None, seasons=None, partitions=FORECAST_PARTITIONS):
+    """
+    Reads forecasts across the published seasons (all of them, or `seasons` given as "2024-2025" or
+    "season-2024-2025"), see read_season_predictions for the filters and columns.
+    """
+    return _read_seasons(
+        public_data_dir, PREDICTIONS_FILE, read_season_predictions, seasons, model=model, location=location, start=start, end=end, partitions=partitions
+    )
+
+
+def read_raw_scores(public_data_dir, metric=None, model=None, location=None, horizon=None, start=None, end=None, seasons=None):
+    """
+    Reads per-forecast scores across the published seasons, see read_season_raw_scores for the filters.
+    Returns the columns of RAW_SCORE_COLUMNS.
+    """
+    return _read_seasons(
+        public_data_dir, RAW_SCORES_FILE, read_season_raw_scores, seasons, metric=metric, model=model, location=location, horizon=horizon, start=start, end=end
+    )
@@ -0,0 +1,270 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from prediction_cube import HUB_QUANTILE_IDS, HUB_QUANTILE_LEVELS  # pyright: ignore[reportImplicitRelativeImport]
+
+# Central prediction interval levels reported in coverage.csv, and the quantile pair bounding each
+COVERAGE_LEVELS = [10, 20, 30, 40, 50, 60, 70, 80, 90, 95, 98]
+
+# Ground truth vintages for revision-aware scoring: the first snapshot taken this many weeks after the
+# target week was reported (0 = as first published), or None for the latest snapshot
+REVISION_VINTAGES = {"asOf": 0, "plus1Week": 1, "final": None}
+
+# Interval whose coverage is summarized (and ranked by distance to nominal) in the revision report
+REVISION_COVERAGE_LEVEL = 95
+
+
+def coverage_bounds(level):
+    """Returns the (lower, upper) quantile ids of the central interval with the given coverage percent."""
+    alpha = 1 - level / 100
+    return str(round(alpha / 2, 4)), str(round(1 - alpha / 2, 4))
+
+
+def observed_values(preds_df: pd.DataFrame, gt_grid):
+    """
+    Looks up the observed admissions for every prediction row (by target_end_date and location)
+    in the gap-filled ground truth grid. Returns NaN where nothing was reported.
+    """
+    admissions = gt_grid["admissions"]
+    date_idx = admissions.index.get_indexer(preds_df["target_end_date"])
+    location_idx = admissions.columns.get_indexer(preds_df["location"])
+
+    observed = np.full(len(preds_df), np.nan)
+    found = (date_idx >= 0) & (location_idx >= 0)
+    observed[found] = admissions.to_numpy(dtype=float)[date_idx[found], location_idx[found]]
+    return observed
+
+
+def weighted_interval_score(quantile_values, observed, quantile_levels=HUB_QUANTILE_LEVELS):
+    """
+    Vectorized WIS for N forecasts: `quantile_values` is (N, Q) on `quantile_levels`, `observed` is (N,).
+    Uses the quantile-loss form WIS = mean over quantiles of 2 * pinball loss, which equals the
+    interval form (median + K symmetric intervals, weights alpha/2) when the levels are symmetric.
+    Rows with a missing quantile or observation are NaN.
+    """
+    tau = np.asarray(quantile_levels, dtype=float)[np.newaxis, :]
+    y = np.asarray(observed, dtype=float)[:, np.newaxis]
+    q = np.asarray(quantile_values, dtype=float)
+    pinball = ((y <= q).astype(float) - tau) * (q - y)
+    return 2 * pinball.mean(axis=1)
+
+
+def score_predictions(preds_df: pd.DataFrame, gt_grid, baseline_preds_df: pd.DataFrame = None):
+    """
+    Scores wide predictions (reference_date, target_end_date, horizon, location, model and one column
+    per hub quantile) against observed ground truth. Returns the three frames Step 6 otherwise reads from
+    the epistorm-evaluations CSVs, with the same columns:
+
+    - WIS ratio: Model, location, horizon, reference_date, wis_ratio (WIS / baseline model WIS for the
+      same location, reference date and horizon; empty when no baseline predictions are given)
+    - MAPE: Model, Location, horizon, reference_date, MAPE (absolute error of the median / observed, as a fraction)
+    - coverage: Model, location, horizon, reference_date, <level>_cov for every level in COVERAGE_LEVELS
+    """
+    baseline_observed = None
+    if baseline_preds_df is not None and not baseline_preds_df.empty:
+        baseline_observed = observed_values(baseline_preds_df, gt_grid)
+    return score_against(preds_df, observed_values(preds_df, gt_grid), baseline_preds_df, baseline_observed)
+
+
+def score_against(preds_df: pd.DataFrame, observed, baseline_preds_df: pd.DataFrame = None, baseline_observed=None):
+    """
+    Scores wide predictions against an `observed` value per row (NaN rows are not scored), returning the
+    frames described in `score_predictions`.
+    """
+    keys = ["reference_date", "location", "horizon"]
+    scored = preds_df[["model"] + keys].copy()
+    scored["reference_date"] = pd.to_datetime(scored["reference_date"]).dt.strftime("%Y-%m-%d")
+    has_observation = ~np.isnan(observed)
+
+    # WIS and ratio to the baseline
+    scored["wis"] = weighted_interval_score(preds_df.reindex(columns=HUB_QUANTILE_IDS).to_numpy(dtype=float), observed)
+    wis_df = pd.DataFrame(columns=["Model", "location", "horizon", "reference_date", "wis_ratio"])
+    if baseline_preds_df is not None and not baseline_preds_df.empty:
+        baseline = baseline_preds_df[keys].copy()
+        baseline["reference_date"] = pd.to_datetime(baseline["reference_date"]).dt.strftime("%Y-%m-%d")
+        baseline["baseline_wis"] = weighted_interval_score(
+            baseline_preds_df.reindex(columns=HUB_QUANTILE_IDS).to_numpy(dtype=float), baseline_observed
+        )
+        baseline = baseline.drop_duplicates(subset=keys)
+        wis_df = scored.merge(baseline, on=keys, how="inner")
+        wis_df["wis_ratio"] = wis_df["wis"] / wis_df["baseline_wis"]
+        wis_df = wis_df[np.isfinite(wis_df["wis_ratio"])]
+        wis_df = wis_df.rename(columns={"model": "Model"})[["Model", "location", "horizon", "reference_date", "wis_ratio"]]
+
+    # MAPE of the median (undefined when nothing was observed, the observation is zero or the median is missing)
+    median = preds_df.reindex(columns=["0.5"]).to_numpy(dtype=float)[:, 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ape = np.abs(observed - median) / observed
+    mape_df = scored.assign(MAPE=ape)[has_observation & np.isfinite(ape)]
+    mape_df = mape_df.rename(columns={"model": "Model", "location": "Location"})[["Model", "Location", "horizon", "reference_date", "MAPE"]]
+
+    # Interval coverage for every level at once (NaN when a bound was not submitted, as for WIS)
+    coverage_df = scored.rename(columns={"model": "Model"})[["Model", "location", "horizon", "reference_date"]].copy()
+    for level in COVERAGE_LEVELS:
+        bounds = preds_df.reindex(columns=list(coverage_bounds(level))).to_numpy(dtype=float)
+        covered = ((bounds[:, 0] <= observed) & (observed <= bounds[:, 1])).astype(float)
+        covered[np.isnan(bounds).any(axis=1)] = np.nan
+        coverage_df[f"{level}_cov"] = covered
+    coverage_df = coverage_df[has_observation & ~np.isnan(scored["wis"].to_numpy())]
+
+    for df in (wis_df, mape_df, coverage_df):
+        df["horizon"] = df["horizon"].astype(int)
+
+    return wis_df.reset_index(drop=True), mape_df.reset_index(drop=True), coverage_df.reset_index(drop=True)
+
+
+def load_ground_truth_snapshots(historical_gt_path: Path, locations, file_prefix="target-hospital-admissions"):
+    """
+    Stacks every ground truth snapshot (`<file_prefix>_<snapshot date>.csv`) into one array of reported
+    admissions with shape (snapshot, date, location), NaN where a snapshot has no value.
+    Returns a dict with the array and the labels of its axes, or None when there are no snapshots.
+    """
+    snapshot_dfs = []
+    for csv_file in sorted(Path(historical_gt_path).glob(f"{file_prefix}_*.csv")):
+        df = pd.read_csv(csv_file, usecols=["date", "location", "value"], dtype={"location": str})
+        df["snapshot"] = pd.Timestamp(csv_file.stem.split("_")[-1])
+        snapshot_dfs.append(df)
+    if not snapshot_dfs:
+        return None
+
+    df = pd.concat(snapshot_dfs, ignore_index=True)
+    df["location"] = df["location"].str.zfill(2)
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    df = df.dropna(subset=["date", "value"])
+    df = df[(df["value"] >= 0) & df["location"].isin(locations)]
+
+    snapshots = pd.DatetimeIndex(np.sort(df["snapshot"].unique()))
+    dates = pd.DatetimeIndex(np.sort(df["date"].unique()))
+    locations = pd.Index(locations)
+
+    values = np.full((len(snapshots), len(dates), len(locations)), np.nan)
+    values[snapshots.get_indexer(df["snapshot"]), dates.get_indexer(df["date"]), locations.get_indexer(df["location"])] = df["value"].to_numpy(dtype=float)
+    return {"values": values, "snapshots": snapshots, "dates": dates, "locations": locations}
+
+
+def vintage_observed_values(preds_df: pd.DataFrame, gt_snapshots, weeks_after=None):
+    """
+    Looks up the admissions every prediction row's target was reported with in the first snapshot taken
+    at least `weeks_after` weeks after its target week (the latest snapshot when None). NaN where that
+    snapshot does not exist yet or has no value.
+    """
+    values = gt_snapshots["values"]
+    target_dates = pd.DatetimeIndex(preds_df["target_end_date"])
+    date_idx = gt_snapshots["dates"].get_indexer(target_dates)
+    location_idx = gt_snapshots["locations"].get_indexer(preds_df["location"])
+    if weeks_after is None:
+        snapshot_idx = np.full(len(preds_df), len(gt_snapshots["snapshots"]) - 1)
+    else:
+        snapshot_idx = gt_snapshots["snapshots"].searchsorted(target_dates + pd.Timedelta(weeks=weeks_after), side="left")
+
+    observed = np.full(len(preds_df), np.nan)
+    found = (date_idx >= 0) & (location_idx >= 0) & (snapshot_idx < len(gt_snapshots["snapshots"]))
+    observed[found] = values[snapshot_idx[found], date_idx[found], location_idx[found]]
+    return observed
+
+
+def score_revisions(preds_df: pd.DataFrame, gt_snapshots, baseline_preds_df: pd.DataFrame = None, vintages=REVISION_VINTAGES):
+    """
+    Scores every forecast against each ground truth vintage in `vintages`. Only forecasts whose target is
+    reported in every vintage are scored, so differences between vintages come from data revisions alone.
+    Returns {vintage: (wis_df, mape_df, coverage_df)} with the frames described in `score_predictions`.
+    """
+    has_baseline = baseline_preds_df is not None and not baseline_preds_df.empty
+    observed = np.stack([vintage_observed_values(preds_df, gt_snapshots, weeks) for weeks in vintages.values()])
+    observed[:, np.isnan(observed).any(axis=0)] = np.nan
+    if has_baseline:
+        baseline_observed = np.stack([vintage_observed_values(baseline_preds_df, gt_snapshots, weeks) for weeks in vintages.values()])
+        baseline_observed[:, np.isnan(baseline_observed).any(axis=0)] = np.nan
+
+    return {
+        vintage: score_against(preds_df, observed[i], baseline_preds_df, baseline_observed[i] if has_baseline else None)
+        for i, vintage in enumerate(vintages)
+    }
+
+
+def summarize_revision_scores(revision_scores, model_names, start_date, end_date):
+    """
+    Summarizes revision-aware scores for forecasts with reference dates in [start_date, end_date] (ISO strings):
+    per vintage, metric and model, the mean score and the model's rank (1 = best). WIS ratio and MAPE rank
+    ascending, coverage by distance to its nominal level. Also returns, per metric, the Spearman correlation
+    of each vintage's ranking with the final one.
+    """
+    summary = {}
+    ranks = {}
+    for vintage, (wis_df, mape_df, coverage_df) in revision_scores.items():
+        metric_means = {
+            "WIS/Baseline": _mean_by_model(wis_df, "wis_ratio", start_date, end_date),
+            "MAPE": _mean_by_model(mape_df, "MAPE", start_date, end_date) * 100,
+            "Coverage": _mean_by_model(coverage_df, f"{REVISION_COVERAGE_LEVEL}_cov", start_date, end_date) * 100,
+        }
+        for metric, means in metric_means.items():
+            means = means.reindex([m for m in model_names if m in means.index])
+            if means.empty:
+                continue
+            rank_key = (means - REVISION_COVERAGE_LEVEL).abs() if metric == "Coverage" else means
+            metric_ranks = rank_key.rank(method="min").astype(int)
+            ranks.setdefault(metric, {})[vintage] = metric_ranks
+            summary.setdefault(vintage, {})[metric] = {
+                model: {"mean": float(means[model]), "rank": int(metric_ranks[model])} for model in means.index
+            }
+
+    rank_correlation = {}
+    for metric, vintage_ranks in ranks.items():
+        final_ranks = vintage_ranks.get("final")
+        if final_ranks is None:
+            continue
+        for vintage, metric_ranks in vintage_ranks.items():
+            common = metric_ranks.index.intersection(final_ranks.index)
+            if vintage == "final" or len(common) < 2:
+                continue
+            correlation = np.corrcoef(metric_ranks[common].to_numpy(dtype=float), final_ranks[common].to_numpy(dtype=float))[0, 1]
+            if np.isfinite(correlation):
+                rank_correlation.setdefault(metric, {})[vintage] = float(correlation)
+
+    return {"vintages": list(revision_scores), "summary": summary, "rankCorrelationWithFinal": rank_correlation}
+
+
+def _mean_by_model(score_df: pd.DataFrame, score_col, start_date, end_date):
+    in_range = (score_df["reference_date"] >= start_date) & (score_df["reference_date"] <= end_date)
+    return score_df.loc[in_range].groupby("Model")[score_col].mean()
+
+
+def pairwise_relative_wis(wis_ratios):
+    """
+    Pairwise relative WIS of M models over G independent groups of T forecast targets (e.g. the reference dates
+    of one state and horizon). `wis_ratios` is (G, T, M): each model's WIS divided by the baseline's WIS on the
+    same target, NaN where the model has no score. Two models' ratios on a shared target share the baseline's
+    WIS, so their quotient is the quotient of the models' WIS. Returns, as arrays over the groups:
+    - pairwise (G, M, M): geometric mean of WIS_i / WIS_j over the targets both models forecast (NaN if none)
+    - shared (G, M, M): the number of those targets
+    - relative (G, M): model i's geometric mean pairwise ratio against every model it shares targets with
+      (itself and the baseline included), divided by the baseline's, as in Cramer et al. (2022); NaN without scores
+    - ranks (G, M): rank by relative WIS within the group (1 = best, ties share the lower rank, 0 without scores)
+    All groups are computed at once with batched matrix products over the aligned targets, instead of merging the
+    targets of every pair of models.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_ratios = np.log(np.asarray(wis_ratios, dtype=float))
+    scored = np.isfinite(log_ratios)
+
+    # The baseline is one more model, with a log ratio of 0 on every target some model was scored on
+    log_ratios = np.concatenate([np.where(scored, log_ratios, 0.0), np.zeros(log_ratios.shape[:2] + (1,))], axis=2)
+    scored = np.concatenate([scored, scored.any(axis=2, keepdims=True)], axis=2).astype(float)
+
+    # shared[g, i, j] = sum_t s_ti s_tj and log_sums[g, i, j] = sum_t s_ti s_tj (l_ti - l_tj)
+    scored_t = scored.transpose(0, 2, 1)
+    shared = scored_t @ scored
+    log_sums = log_ratios.transpose(0, 2, 1) @ scored - scored_t @ log_ratios
+    has_shared = shared > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_pairwise = np.where(has_shared, log_sums / shared, np.nan)
+        log_theta = np.where(has_shared, log_pairwise, 0.0).sum(axis=2) / has_shared.sum(axis=2)
+    relative = np.exp(log_theta[:, :-1] - log_theta[:, -1:])
+
+    # Ascending ranks, computed as 1 + the number of models with a strictly lower relative WIS
+    ranked = np.isfinite(relative)
+    lower = np.where(ranked, relative, np.inf)
+    ranks = np.where(ranked, (lower[:, None, :] < lower[:, :, None]).sum(axis=2) + 1, 0)
+
+    return np.exp(log_pairwise[:, :-1, :-1]), shared[:, :-1, :-1].astype(int), relative, ranks
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_processing  # pyright: ignore[reportImplicitRelativeImport]
+
+
+def dumps_with_stdlib(monkeypatch, obj):
+    with monkeypatch.context() as patch:
+        patch.setattr(data_processing, "orjson", None)
+        return data_processing.dumps_json(obj)
+
+
+def test_dumps_json_fallback_writes_the_same_bytes_as_orjson(monkeypatch):
+    pytest.importorskip("orjson")
+    frame = pd.DataFrame(
+        {
+            "value": [1.5, np.nan, 3e-7, 1e-5, 2e16, -0.0],
+            "count": np.arange(6, dtype=np.int64),
+            "score": np.array([0.1, np.nan, 2.5, 1e13, 7e-7, np.inf], dtype=np.float32),
+            "location": ["US", "01", "é", '"quoted"', "", "06"],
+        }
+    )
+    outputs = [
+        frame.to_dict("records"),
+        frame.to_dict("list"),
+        {
+            "scores": frame["score"].to_numpy(),
+            "matrix": np.arange(6).reshape(2, 3),
+            "scalars": [np.int32(7), np.float64(np.nan), np.float32(0.1), np.bool_(True), float("inf")],
+            "keys": {1: "int", 2.5: "float", None: "none"},
+            "date": pd.Timestamp("2024-11-02"),
+        },
+    ]
+    for obj in outputs:
+        assert dumps_with_stdlib(monkeypatch, obj) == data_processing.dumps_json(obj)
+
+
+def test_dumps_json_fallback_writes_nan_as_null(monkeypatch):
+    assert dumps_with_stdlib(monkeypatch, {"a": [np.nan, 1.0, np.float32(np.nan)]}) == b'{"a":[null,1.0,null]}'
+
+
+def test_classify_activity_levels_without_thresholds_is_no_data():
+    rates = np.array([[0.5, 2.0, 4.0], [np.nan, 0.0, 4.0]])
+    medium = np.array([1.0, np.nan, 1.0])
+    high = np.array([3.0, np.nan, np.nan])
+    levels = data_processing.classify_activity_levels(rates, medium, high)
+    assert levels.tolist() == [[1, 0, 0], [0, 0, 0]]
+    assert levels.dtype == np.uint8
+
+
+def test_background_writer_writes_batches_in_order_and_records_them(tmp_path):
+    output_manifest = data_processing.OutputManifest(tmp_path)
+    cleaned = []
+    with data_processing.BackgroundWriter(output_manifest, max_pending=1) as writer:
+        for season in range(3):
+            writer.queue(
+                [(tmp_path / f"season-{season}.json", {"season": season})],
+                unlisted=[(tmp_path / f"shard-{season}.json", b"[]")],
+                cleanup=lambda season=season: cleaned.append(season),
+            )
+    assert cleaned == [0, 1, 2]
+    assert (tmp_path / "season-2.json").read_bytes() == data_processing.dumps_json({"season": 2})
+    assert sorted(output_manifest.files) == ["season-0.json", "season-1.json", "season-2.json"]
+    assert output_manifest.written_count == 6
+
+
+def test_background_writer_raises_write_errors_on_close(tmp_path):
+    writer = data_processing.BackgroundWriter(data_processing.OutputManifest(tmp_path))
+    writer.queue([(tmp_path / "missing-dir" / "file.json", {})])
+    with pytest.raises(FileNotFoundError):
+        writer.close()
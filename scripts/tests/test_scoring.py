@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from prediction_cube import HUB_QUANTILE_IDS, HUB_QUANTILE_LEVELS  # pyright: ignore[reportImplicitRelativeImport]
+from scoring import COVERAGE_LEVELS, score_predictions  # pyright: ignore[reportImplicitRelativeImport]
+
+
+def make_predictions(observed_quantile_level):
+    """One forecast for Alabama whose quantiles are 100 * level, scored against the value at `observed_quantile_level`."""
+    preds_df = pd.DataFrame(
+        {
+            "reference_date": [pd.Timestamp("2024-11-02")],
+            "target_end_date": [pd.Timestamp("2024-11-09")],
+            "horizon": [1],
+            "location": ["01"],
+            "model": ["Model-A"],
+            **{quantile_id: [100 * level] for quantile_id, level in zip(HUB_QUANTILE_IDS, HUB_QUANTILE_LEVELS)},
+        }
+    )
+    gt_grid = {"admissions": pd.DataFrame({"01": [100 * observed_quantile_level]}, index=pd.DatetimeIndex(["2024-11-09"]))}
+    return preds_df, gt_grid
+
+
+def test_coverage_of_a_complete_forecast():
+    preds_df, gt_grid = make_predictions(0.3)
+    _, mape_df, coverage_df = score_predictions(preds_df, gt_grid)
+
+    assert mape_df["MAPE"].tolist() == [2 / 3]
+    # The observation is the 0.3 quantile: inside the central intervals of 40% and more
+    coverage = coverage_df.iloc[0]
+    assert [coverage[f"{level}_cov"] for level in COVERAGE_LEVELS] == [0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+
+def test_missing_quantile_column_is_not_scored():
+    preds_df, gt_grid = make_predictions(0.3)
+    preds_df = preds_df.drop(columns=["0.025", "0.975"])
+
+    wis_df, mape_df, coverage_df = score_predictions(preds_df, gt_grid)
+
+    # Like WIS, coverage treats the missing quantiles as NaN: the forecast is left out instead of raising KeyError
+    assert wis_df.empty
+    assert coverage_df.empty
+    assert mape_df["MAPE"].tolist() == [2 / 3]
@@ -97,8 +97,13 @@ const SeasonOverviewContent: React.FC = () => {
 const SingleModelContent = () => {
   const { loadingStates, currentSeasonId } = useDataContext();
   const { loadSingleModelData } = useEvaluationsData();
-  const { evaluationsSingleModelViewSelectedStateName, evaluationSingleModelViewScoresOption, evaluationsSingleModelViewSeasonId } =
-    useAppSelector((state) => state.evaluationsSingleModelSettings);
+  const {
+    evaluationsSingleModelViewSelectedStateName,
+    evaluationsSingleModelViewSelectedStateCode,
+    evaluationsSingleModelViewModel,
+    evaluationSingleModelViewScoresOption,
+    evaluationsSingleModelViewSeasonId,
+  } = useAppSelector((state) => state.evaluationsSingleModelSettings);
   const hasLoadedRef = useRef(false);
 
   useEffect(() => {
@@ -109,17 +114,17 @@ const SingleModelContent = () => {
       const seasonToLoad = evaluationsSingleModelViewSeasonId || currentSeasonId;
       if (seasonToLoad) {
         console.log(`Loading Single Model raw scores for season: ${seasonToLoad}`);
-        loadSingleModelData(seasonToLoad);
+        loadSingleModelData(seasonToLoad, evaluationsSingleModelViewModel, evaluationsSingleModelViewSelectedStateCode);
       }
     }
-  }, [evaluationsSingleModelViewSeasonId, currentSeasonId, loadSingleModelData]);
+  }, [evaluationsSingleModelViewSeasonId, currentSeasonId, evaluationsSingleModelViewModel, evaluationsSingleModelViewSelectedStateCode, loadSingleModelData]);
 
-  // Also load raw scores when season changes
+  // Also load raw scores when the season, model or state changes (seasons with split raw score files load one model and state at a time)
   useEffect(() => {
     if (hasLoadedRef.current && evaluationsSingleModelViewSeasonId) {
-      loadSingleModelData(evaluationsSingleModelViewSeasonId);
+      loadSingleModelData(evaluationsSingleModelViewSeasonId, evaluationsSingleModelViewModel, evaluationsSingleModelViewSelectedStateCode);
     }
-  }, [evaluationsSingleModelViewSeasonId, loadSingleModelData]);
+  }, [evaluationsSingleModelViewSeasonId, evaluationsSingleModelViewModel, evaluationsSingleModelViewSelectedStateCode, loadSingleModelData]);
 
   if (loadingStates.groundTruth || loadingStates.predictions) {
     return (
@@ -1,5 +1,7 @@
 import { useAppSelector } from "@/store/hooks";
 import {
+  selectForecastActivityLevels,
+  selectGroundTruthActivityLevel,
   selectGroundTruthInRange, // Use the single model selector
   selectLocationData,
   selectPredictionsForModelAndWeek,
@@ -159,11 +161,23 @@ const NowcastStateThermo: React.FC = () => {
   const predictionsData = useAppSelector((state) =>
     selectPredictionsForModelAndWeek(state, userSelectedRiskLevelModel, USStateNum, userSelectedWeek)
   );
+  // Activity levels classified by the pipeline (the thermometer still places its lines from the values)
+  const groundTruthActivityLevel = useAppSelector((state) => selectGroundTruthActivityLevel(state, relativeLastWeek, USStateNum));
+  const predictedActivityLevels = useAppSelector((state) =>
+    selectForecastActivityLevels(state, userSelectedRiskLevelModel, USStateNum, userSelectedWeek, userSelectedWeek)
+  );
 
   const [riskColor, setRiskColor] = useState("#7cd8c9"); // Default to low risk color
   const [currentRiskLevel, setCurrentRiskLevel] = useState("Low");
   const [previousRiskLevel, setPreviousRiskLevel] = useState("Low");
 
+  // The map is filled with the forecast's precomputed activity level, also published for states without thresholds (No Data)
+  useEffect(() => {
+    if (predictedActivityLevels?.median) {
+      setRiskColor(nowcastRiskColors[nowcastRiskLevels.indexOf(predictedActivityLevels.median)]);
+    }
+  }, [predictedActivityLevels]);
+
   // Main UseEffect for listening to change in resized dimension, or user-selected different weeks, trigger drawing of the mini state map
   useEffect(() => {
     const drawMap = async () => {
@@ -316,12 +330,14 @@ const NowcastStateThermo: React.FC = () => {
     const groundTruthPosition = calculateLinePosition(groundTruthValue);
     const predictedPosition = calculateLinePosition(predictedValue);
 
-    // Update risk levels
-    setPreviousRiskLevel(groundTruthPosition.riskLevel.charAt(0).toUpperCase() + groundTruthPosition.riskLevel.slice(1));
-    setCurrentRiskLevel(predictedPosition.riskLevel.charAt(0).toUpperCase() + predictedPosition.riskLevel.slice(1));
+    // Update risk levels, precomputed when the season's activity levels are loaded
+    const previousRiskLevel = groundTruthActivityLevel ?? groundTruthPosition.riskLevel;
+    const currentRiskLevel = predictedActivityLevels?.median ?? predictedPosition.riskLevel;
+    setPreviousRiskLevel(previousRiskLevel.charAt(0).toUpperCase() + previousRiskLevel.slice(1));
+    setCurrentRiskLevel(currentRiskLevel.charAt(0).toUpperCase() + currentRiskLevel.slice(1));
 
     // Update risk color for the map
-    setRiskColor(nowcastRiskColors[nowcastRiskLevels.indexOf(predictedPosition.riskLevel)]);
+    setRiskColor(nowcastRiskColors[nowcastRiskLevels.indexOf(currentRiskLevel)]);
 
     // Helper functions for tooltip
     const formatNumber = (num: number | null) => {
@@ -472,6 +488,8 @@ const NowcastStateThermo: React.FC = () => {
     predictionsData,
     locationData,
     thresholdsData,
+    groundTruthActivityLevel,
+    predictedActivityLevels,
     relativeLastWeek,
     containerRef,
   ]);
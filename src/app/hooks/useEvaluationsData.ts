@@ -3,6 +3,7 @@ import { useDataContext } from "@/providers/DataProvider";
 import {
   addPrecalculatedData,
   addRawScores,
+  addRawScoreShard,
   clearEvaluationJsonData
 } from "@/store/data-slices/domains/evaluationDataSlice";
 import { useAppDispatch, useAppSelector } from "@/store/hooks";
@@ -10,7 +11,9 @@ import {
   fetchAuxiliaryData,
   fetchDynamicTimePeriodData,
   fetchSeasonEvaluationData,
-  fetchSeasonRawScores
+  fetchSeasonRawScores,
+  fetchSeasonRawScoresIndex,
+  fetchSeasonRawScoresShard
 } from "@/utils/dataLoader";
 import { useCallback, useRef, useState } from "react";
 
@@ -19,13 +22,13 @@ interface UseEvaluationsDataReturn {
   isLoaded: boolean;
   error: string | null;
   loadData: () => Promise<void>;
-  loadSingleModelData: (seasonId: string) => Promise<void>;
+  loadSingleModelData: (seasonId: string, model?: string, stateNum?: string) => Promise<void>;
 }
 
 export const useEvaluationsData = (): UseEvaluationsDataReturn => {
   const dispatch = useAppDispatch();
   const { updateLoadingState, currentSeasonId } = useDataContext();
-  const { isJsonDataLoaded, loadedPeriods, loadedRawScoreSeasons } = useAppSelector((state) => state.evaluationData);
+  const { isJsonDataLoaded, loadedPeriods, loadedRawScoreSeasons, loadedRawScoreShards } = useAppSelector((state) => state.evaluationData);
   
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -140,8 +143,8 @@ export const useEvaluationsData = (): UseEvaluationsDataReturn => {
     }
   }, [dispatch, isLoading, loadedPeriods, updateLoadingState, loadBackgroundSeasonEvaluations]);
 
-  // Load Single Model data (raw scores)
-  const loadSingleModelData = useCallback(async (seasonId: string) => {
+  // Load Single Model data (raw scores): only the given model and state when the season has split raw score files
+  const loadSingleModelData = useCallback(async (seasonId: string, model?: string, stateNum?: string) => {
     // Check if already loaded
     if (loadedRawScoreSeasons.includes(seasonId)) {
       console.log(`Raw scores for ${seasonId} already loaded`);
@@ -149,6 +152,25 @@ export const useEvaluationsData = (): UseEvaluationsDataReturn => {
     }
     
     try {
+      if (model && stateNum) {
+        const rawScoresIndex = await fetchSeasonRawScoresIndex(seasonId);
+        if (rawScoresIndex) {
+          if (loadedRawScoreShards.includes(`${seasonId}/${model}/${stateNum}`)) return;
+
+          console.log(`Loading raw scores of ${model} / ${stateNum} for season: ${seasonId}`);
+          const shardData = await fetchSeasonRawScoresShard(seasonId, rawScoresIndex, model, stateNum);
+          if (shardData) {
+            dispatch(addRawScoreShard({
+              seasonId,
+              model,
+              stateNum,
+              data: shardData,
+            }));
+          }
+          return;
+        }
+      }
+
       console.log(`Loading raw scores for season: ${seasonId}`);
       
       const rawScoresData = await fetchSeasonRawScores(
@@ -189,7 +211,7 @@ export const useEvaluationsData = (): UseEvaluationsDataReturn => {
     } catch (error) {
       console.error(`Failed to load raw scores for ${seasonId}:`, error);
     }
-  }, [dispatch, loadedRawScoreSeasons, currentSeasonId]);
+  }, [dispatch, loadedRawScoreSeasons, loadedRawScoreShards, currentSeasonId]);
 
   return {
     isLoading,
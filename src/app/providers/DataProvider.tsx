@@ -1,7 +1,7 @@
 "use client";
 
 import { setAuxiliaryJsonData } from "@/store/data-slices/domains/auxiliaryDataSlice";
-import { addSeasonData } from "@/store/data-slices/domains/coreDataSlice";
+import { addLatestSnapshot, addSeasonData } from "@/store/data-slices/domains/coreDataSlice";
 import { updateEvaluationSeasonOverviewTimeRangeOptions } from "@/store/data-slices/settings/SettingsSliceEvaluationSeasonOverview";
 import {
   updateEvaluationSingleModelViewDateEnd,
@@ -23,7 +23,7 @@ import { useAppDispatch } from "@/store/hooks";
 import { LoadingStates } from "@/types/app";
 import { EvaluationSeasonOverviewTimeRangeOption } from "@/types/domains/evaluations";
 import { SeasonOption } from "@/types/domains/forecasting";
-import { determineCurrentSeasonId, fetchAuxiliaryData, fetchSeasonData } from "@/utils/dataLoader";
+import { determineCurrentSeasonId, fetchAuxiliaryData, fetchLatestSnapshot, fetchSeasonData } from "@/utils/dataLoader";
 import { loadUSMapData } from "@/utils/mapDataLoader";
 import { parseISO } from "date-fns";
 import React, { createContext, useCallback, useContext, useEffect, useRef, useState } from "react";
@@ -96,7 +96,7 @@ export const DataProvider: React.FC<{ children: React.ReactNode }> = ({ children
 
           for (const season of previousSeasons) {
             try {
-              const seasonData = await fetchSeasonData(season.seasonId, ["groundTruthData", "predictionsData", "nowcastTrendsData"]);
+              const seasonData = await fetchSeasonData(season.seasonId, ["groundTruthData", "predictionsData", "nowcastTrendsData", "activityLevelsData"]);
 
               dispatch(
                 addSeasonData({
@@ -254,12 +254,22 @@ export const DataProvider: React.FC<{ children: React.ReactNode }> = ({ children
       updateLoadingState("seasonOptions", false);
 
       // Step 4: Load current season data AND us states map data in parallel
-      const seasonDataPromise = fetchSeasonData(detectedSeasonId, ["groundTruthData", "predictionsData", "nowcastTrendsData"]);
-
-      const seasonData = await seasonDataPromise;
+      const seasonDataPromise = fetchSeasonData(detectedSeasonId, ["groundTruthData", "predictionsData", "nowcastTrendsData", "activityLevelsData"]);
 
       loadMapData();
 
+      // The latest snapshot is much smaller than the season files: draw it first, the season data replaces it
+      const latestSnapshot = await fetchLatestSnapshot();
+      if (latestSnapshot?.seasonId === detectedSeasonId) {
+        dispatch(addLatestSnapshot(latestSnapshot));
+        updateLoadingState("groundTruth", false);
+        updateLoadingState("predictions", false);
+        updateLoadingState("nowcastTrends", false);
+        console.log("Latest snapshot loaded");
+      }
+
+      const seasonData = await seasonDataPromise;
+
       dispatch(
         addSeasonData({
           seasonId: detectedSeasonId,
@@ -1,5 +1,5 @@
 import { createSlice, PayloadAction } from "@reduxjs/toolkit";
-import { GroundTruthData, PredictionData, NowcastTrendsData } from "@/types/domains/forecasting";
+import { ActivityLevelsData, GroundTruthData, PredictionData, NowcastTrendsData } from "@/types/domains/forecasting";
 
 interface CoreDataState {
   isLoaded: boolean;
@@ -9,6 +9,7 @@ interface CoreDataState {
     groundTruthData: GroundTruthData;
     predictionData: PredictionData;
     nowcastTrends: NowcastTrendsData;
+    activityLevels: ActivityLevelsData;
   };
 }
 
@@ -20,6 +21,7 @@ const initialState: CoreDataState = {
     groundTruthData: {},
     predictionData: {},
     nowcastTrends: {},
+    activityLevels: {},
   },
 };
 
@@ -32,6 +34,7 @@ const coreDataSlice = createSlice({
         groundTruthData: action.payload.mainData?.groundTruthData || {},
         predictionData: action.payload.mainData?.predictionData || {},
         nowcastTrends: action.payload.mainData?.nowcastTrends || {},
+        activityLevels: action.payload.mainData?.activityLevels || {},
       };
       state.isLoaded = true;
     },
@@ -43,9 +46,10 @@ const coreDataSlice = createSlice({
         groundTruthData?: any;
         predictionsData?: any;
         nowcastTrendsData?: any;
+        activityLevelsData?: any;
       }>
     ) => {
-      const { seasonId, groundTruthData, predictionsData, nowcastTrendsData } = action.payload;
+      const { seasonId, groundTruthData, predictionsData, nowcastTrendsData, activityLevelsData } = action.payload;
 
       // Add ground truth data for this season
       if (groundTruthData) {
@@ -57,6 +61,11 @@ const coreDataSlice = createSlice({
         state.mainData.predictionData[seasonId] = predictionsData;
       }
 
+      // Add activity levels for this season
+      if (activityLevelsData) {
+        state.mainData.activityLevels[seasonId] = activityLevelsData;
+      }
+
       // Merge nowcast trends (they're keyed by model, not season)
       if (nowcastTrendsData) {
         Object.entries(nowcastTrendsData).forEach(([modelName, modelData]) => {
@@ -77,11 +86,40 @@ const coreDataSlice = createSlice({
         state.isLoaded = true;
       }
     },
+    // First-paint data of a season (latest.json), only kept until the season's full files are loaded
+    addLatestSnapshot: (
+      state,
+      action: PayloadAction<{
+        seasonId: string;
+        groundTruthData?: any;
+        predictionsData?: any;
+        nowcastTrendsData?: any;
+      }>
+    ) => {
+      const { seasonId, groundTruthData, predictionsData, nowcastTrendsData } = action.payload;
+      if (state.loadedSeasons.includes(seasonId)) return;
+
+      if (groundTruthData) {
+        state.mainData.groundTruthData[seasonId] = groundTruthData;
+      }
+      if (predictionsData) {
+        state.mainData.predictionData[seasonId] = predictionsData;
+      }
+      if (nowcastTrendsData) {
+        Object.entries(nowcastTrendsData).forEach(([modelName, modelData]) => {
+          if (!state.mainData.nowcastTrends[modelName]) {
+            state.mainData.nowcastTrends[modelName] = {};
+          }
+          Object.assign(state.mainData.nowcastTrends[modelName], modelData);
+        });
+      }
+    },
     clearCoreData: (state) => {
       state.mainData = {
         groundTruthData: {},
         predictionData: {},
         nowcastTrends: {},
+        activityLevels: {},
       };
       state.loadedSeasons = [];
       state.isLoaded = false;
@@ -89,5 +127,5 @@ const coreDataSlice = createSlice({
   },
 });
 
-export const { setCoreJsonData, addSeasonData, clearCoreData } = coreDataSlice.actions;
+export const { setCoreJsonData, addSeasonData, addLatestSnapshot, clearCoreData } = coreDataSlice.actions;
 export default coreDataSlice.reducer;
@@ -7,6 +7,7 @@ interface EvaluationDataState {
   isJsonDataLoaded: boolean;
   loadedPeriods: string[]; // Track which periods/seasons have been loaded
   loadedRawScoreSeasons: string[]; // Track which seasons have raw scores loaded
+  loadedRawScoreShards: string[]; // Track which "seasonId/model/stateNum" raw score files have been loaded (split seasons)
 
   // Pre-calculated evaluation data
   precalculated: AppDataEvaluationsPrecalculated;
@@ -17,8 +18,10 @@ const initialState: EvaluationDataState = {
   isJsonDataLoaded: false,
   loadedPeriods: [],
   loadedRawScoreSeasons: [],
+  loadedRawScoreShards: [],
   precalculated: {
     iqr: {},
+    iqrStateAverages: {},
     stateMap_aggregates: {},
     detailedCoverage_aggregates: {},
   },
@@ -46,6 +49,11 @@ const evaluationDataSlice = createSlice({
         if (data.precalculated.iqr) {
           state.precalculated.iqr[periodId] = data.precalculated.iqr[periodId] || data.precalculated.iqr;
         }
+
+        // Merge the shared per-state averages table behind the IQR boxes
+        if (data.precalculated.iqrStateAverages) {
+          state.precalculated.iqrStateAverages[periodId] = data.precalculated.iqrStateAverages;
+        }
         
         // Merge state map aggregates
         if (data.precalculated.stateMap_aggregates) {
@@ -86,20 +94,43 @@ const evaluationDataSlice = createSlice({
         state.loadedRawScoreSeasons.push(seasonId);
       }
     },
+    // Add the raw scores of one model and state, from a season's split raw score files
+    addRawScoreShard: (state, action: PayloadAction<{
+      seasonId: string;
+      model: string;
+      stateNum: string;
+      data: any;
+    }>) => {
+      const { seasonId, model, stateNum, data } = action.payload;
+      const seasonScores = state.rawScores[seasonId] || (state.rawScores[seasonId] = {});
+
+      Object.entries(data.rawScores || {}).forEach(([metric, horizons]: [string, any]) => {
+        const metricScores = seasonScores[metric] || (seasonScores[metric] = {});
+        const modelScores = metricScores[model] || (metricScores[model] = {});
+        modelScores[stateNum] = horizons;
+      });
+
+      const shardKey = `${seasonId}/${model}/${stateNum}`;
+      if (!state.loadedRawScoreShards.includes(shardKey)) {
+        state.loadedRawScoreShards.push(shardKey);
+      }
+    },
     clearEvaluationJsonData: (state) => {
       state.precalculated = {
         iqr: {},
+        iqrStateAverages: {},
         stateMap_aggregates: {},
         detailedCoverage_aggregates: {},
       };
       state.rawScores = {};
       state.loadedPeriods = [];
       state.loadedRawScoreSeasons = [];
+      state.loadedRawScoreShards = [];
       state.isJsonDataLoaded = false;
     },
   },
 });
 
-export const { setEvaluationJsonData, addPrecalculatedData, addRawScores, clearEvaluationJsonData } = evaluationDataSlice.actions;
+export const { setEvaluationJsonData, addPrecalculatedData, addRawScores, addRawScoreShard, clearEvaluationJsonData } = evaluationDataSlice.actions;
 
 export default evaluationDataSlice.reducer;
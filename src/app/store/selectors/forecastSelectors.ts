@@ -3,6 +3,8 @@
 import { createSelector } from "@reduxjs/toolkit";
 import { RootState } from "../index";
 import { StateThresholds, SurveillanceSingleWeekDataPoint } from "@/types/domains/forecasting";
+import { groundTruthSeriesInRange } from "@/utils/groundTruth";
+import { forecastActivityLevels, groundTruthActivityLevel } from "@/utils/activityLevels";
 
 // Selector for thresholds - handles dictionary format
 // TODO: Get rid of this after changing the component to use Dictionary instead for faster access, less find() operations
@@ -111,24 +113,8 @@ export const selectGroundTruthInRange = createSelector(
       const seasonData = groundTruthData[seasonId];
       if (!seasonData) continue;
 
-      // Iterate through all reference dates in this season
-      Object.entries(seasonData).forEach(([dateISO, statesData]) => {
-        const date = new Date(dateISO);
-
-        // Check if date is within our range
-        if (date >= startDate && date <= endDate) {
-          const stateData = statesData[stateNum];
-          if (stateData) {
-            groundTruthPoints.push({
-              date,
-              stateNum,
-              stateName: "", // Would need location data for full name, skip for now
-              admissions: stateData.admissions,
-              weeklyRate: stateData.weeklyRate,
-            });
-          }
-        }
-      });
+      // Slice this state's series within our range
+      groundTruthPoints.push(...groundTruthSeriesInRange(seasonData, stateNum, startDate, endDate));
     }
 
     // Sort by date and remove duplicates
@@ -229,24 +215,8 @@ export const selectExtendedGroundTruthInRange = createSelector(
       const seasonData = groundTruthData[seasonId];
       if (!seasonData) continue;
 
-      // Iterate through all reference dates in this season
-      Object.entries(seasonData).forEach(([dateISO, statesData]) => {
-        const date = new Date(dateISO);
-
-        // Check if date is within our extended range
-        if (date >= startDate && date <= extendedEndDate) {
-          const stateData = (statesData as any)[stateNum];
-          if (stateData) {
-            groundTruthPoints.push({
-              date,
-              stateNum,
-              stateName: "", // Would need location data for full name, skip for now
-              admissions: stateData.admissions,
-              weeklyRate: stateData.weeklyRate,
-            });
-          }
-        }
-      });
+      // Slice this state's series within our extended range
+      groundTruthPoints.push(...groundTruthSeriesInRange(seasonData, stateNum, startDate, extendedEndDate));
     }
 
     // Sort by date and remove duplicates
@@ -420,6 +390,44 @@ export const selectPredictionsForModelAndWeek = createSelector(
   }
 );
 
+// Selector for the precomputed activity level of a state's ground truth on a date
+export const selectGroundTruthActivityLevel = createSelector(
+  [
+    (state: RootState) => state.coreData.mainData?.activityLevels,
+    (state: RootState) => state.auxiliaryData.metadata,
+    (state: RootState, date: Date) => date,
+    (state: RootState, date: Date, stateNum: string) => stateNum,
+  ],
+  (activityLevels, metadata, date, stateNum) => {
+    const seasonId = findSeasonForDate(metadata?.fullRangeSeasons || [], date);
+    if (!activityLevels || !seasonId) return null;
+    return groundTruthActivityLevel(activityLevels[seasonId], date.toISOString().split("T")[0], stateNum);
+  }
+);
+
+// Selector for the precomputed activity levels (median and interval bounds) of one forecast
+export const selectForecastActivityLevels = createSelector(
+  [
+    (state: RootState) => state.coreData.mainData?.activityLevels,
+    (state: RootState) => state.auxiliaryData.metadata,
+    (state: RootState, modelName: string) => modelName,
+    (state: RootState, modelName: string, stateNum: string) => stateNum,
+    (state: RootState, modelName: string, stateNum: string, referenceDate: Date) => referenceDate,
+    (state: RootState, modelName: string, stateNum: string, referenceDate: Date, targetDate: Date) => targetDate,
+  ],
+  (activityLevels, metadata, modelName, stateNum, referenceDate, targetDate) => {
+    const seasonId = findSeasonForDate(metadata?.fullRangeSeasons || [], referenceDate);
+    if (!activityLevels || !seasonId) return null;
+    return forecastActivityLevels(
+      activityLevels[seasonId],
+      modelName,
+      referenceDate.toISOString().split("T")[0],
+      stateNum,
+      targetDate.toISOString().split("T")[0]
+    );
+  }
+);
+
 // Helper functions
 function findRelevantSeasons(fullRangeSeasons: any[], startDate: Date, endDate: Date): string[] {
   const relevantSeasons: string[] = [];
@@ -2,6 +2,8 @@
 import { createSelector } from "@reduxjs/toolkit";
 import { RootState } from "../index";
 import { addWeeks } from "date-fns";
+import { SeasonGroundTruthColumns } from "@/types/domains/forecasting";
+import { groundTruthOnDate } from "@/utils/groundTruth";
 
 // Selector for core data loading status
 export const selectIsCoreDataLoaded = (state: RootState) => state.coreData.isLoaded;
@@ -193,7 +195,7 @@ export const selectSingleModelScoreDataFromJSON = createSelector(
 // Fixed function to combine full-forecast partition with needed forecast-tail weeks
 function combinePartitionsForStateAndHorizon(
   partitions: any,
-  groundTruth: any,
+  groundTruth: SeasonGroundTruthColumns | undefined,
   stateCode: string,
   horizon: number,
   displayStartDate: Date,
@@ -236,7 +238,7 @@ function combinePartitionsForStateAndHorizon(
       };
 
       // Add ground truth from centralized collection if available
-      const groundTruthData = groundTruth[referenceDateISO]?.[stateCode];
+      const groundTruthData = groundTruthOnDate(groundTruth, referenceDateISO, stateCode);
       if (groundTruthData && groundTruthData.admissions >= 0) {
         dataPoint.groundTruth = {
           admissions: groundTruthData.admissions,
@@ -55,7 +55,18 @@ export interface BoxplotStats {
   max: number;
   mean: number;
   count: number;
-  source_scores: number[];
+}
+
+// Per-state averages behind the IQR boxes of one period, stored once instead of inside every BoxplotStats:
+// values[metric][model][i][j] is the average of horizon combination horizonKeys[i] in state states[j] (null if no data)
+export interface IqrStateAveragesTable {
+  states: string[];
+  horizonKeys: string[];
+  values: {
+    [metric: string]: {
+      [model: string]: (number | null)[][];
+    };
+  };
 }
 
 export interface AppDataEvaluationsPrecalculated {
@@ -68,6 +79,9 @@ export interface AppDataEvaluationsPrecalculated {
       };
     };
   };
+  iqrStateAverages: {
+    [seasonId: string]: IqrStateAveragesTable;
+  };
   stateMap_aggregates: {
     [seasonId: string]: {
       [metric: string]: {
@@ -110,3 +124,26 @@ export interface AppDataEvaluationsSingleModelRawScores {
     };
   };
 }
+
+// Index of a season's per-model/per-state raw score files (evaluationsRawScoresIndex.json, format "raw-score-shards-v1",
+// only published with --split-raw-scores). Each file is at `path` (with {model} and {location} filled in) in the season
+// folder, holds { rawScores: metric -> horizon -> scores } and is versioned by its hash here, not by manifest.json.
+export interface RawScoresShardIndex {
+  format: "raw-score-shards-v1";
+  path: string;
+  models: { [model: string]: { [stateNum: string]: string } };
+}
+
+// Pairwise relative WIS of one season (evaluationsPairwiseData.json) or dynamic period
+// (dynamic-time-periods/<period>-pairwise.json), format "pairwise-relative-wis-v1". Every list follows `models`.
+// pairwise[i][j] is the geometric mean of WIS_i / WIS_j over the sharedTargets[i][j] forecasts both models made;
+// relativeWis is each model's mean pairwise ratio scaled by the baseline's, and ranks order it (1 = best, 0 = no scores).
+export interface PairwiseSkillData {
+  format: "pairwise-relative-wis-v1";
+  baselineModel: string;
+  models: string[];
+  relativeWis: { [stateNum: string]: { [horizon: number]: (number | null)[] } };
+  ranks: { [stateNum: string]: { [horizon: number]: number[] } };
+  pairwise: { [stateNum: string]: { [horizon: number]: (number | null)[][] } };
+  sharedTargets: { [stateNum: string]: { [horizon: number]: number[][] } };
+}
@@ -42,13 +42,39 @@ export interface StateThresholdsDict {
 
 // Following interfaces are for Redux Data Slice to validate fetched JSON data
 export interface GroundTruthData {
-  [seasonId: string]: {
-    [referenceDateISO: string]: {
-      [stateNum: string]: { admissions: number; weeklyRate: number };
-    };
+  [seasonId: string]: SeasonGroundTruthColumns;
+}
+
+// Columnar ground truth of one season (groundTruthData.json, format "ground-truth-columns-v1"):
+// a weekly date axis, and per-location arrays aligned with it. Where `missing` is 1 nothing was
+// reported, and the arrays hold the placeholders admissions -1 / weeklyRate 0.
+export interface SeasonGroundTruthColumns {
+  format: "ground-truth-columns-v1";
+  dates: string[];
+  admissions: { [stateNum: string]: number[] };
+  weeklyRate: { [stateNum: string]: number[] };
+  missing: { [stateNum: string]: number[] };
+}
+
+// Activity levels of one season (activityLevelsData.json, format "activity-levels-v1"), classified by the pipeline
+// against thresholdsData.json. Each level string holds one digit per value, an index into `levels`
+// (the order of nowcastRiskLevels). Forecast rows are [referenceDate, location, targetDate, levels], with both
+// dates as offsets into `forecasts.dates` and one digit per entry of `forecasts.fields` (median and interval bounds).
+export interface SeasonActivityLevels {
+  format: "activity-levels-v1";
+  levels: string[];
+  groundTruth: { dates: string[]; levels: { [stateNum: string]: string } };
+  forecasts: {
+    fields: string[];
+    dates: string[];
+    models: { [modelName: ModelName]: [number, string, number, string][] };
   };
 }
 
+export interface ActivityLevelsData {
+  [seasonId: string]: SeasonActivityLevels;
+}
+
 export interface ModelPredictionData {
   firstPredRefDate?: string;
   lastPredRefDate?: string;
@@ -71,6 +97,37 @@ export interface PredictionData {
   };
 }
 
+// Sparse predictionsData.json as published (format "sparse-predictions-v1"), expanded into PredictionData on load.
+// Each partition row is [referenceDate, location, targetDate, horizon, median, PI50low, PI50high, PI90low, PI90high, PI95low, PI95high],
+// with both dates as offsets into `dates`; only reference dates/locations with forecasts have rows.
+export type SparsePredictionRow = [number, string, number, number, number, number, number, number, number, number, number];
+
+export interface SparsePredictionsFile {
+  format: "sparse-predictions-v1";
+  fields: string[];
+  dates: string[];
+  firstPredRefDate?: string;
+  lastPredRefDate?: string;
+  lastPredTargetDate?: string;
+  models: {
+    [modelName: ModelName]: Omit<ModelPredictionData, "partitions"> & {
+      partitions: { [partitionName in keyof ModelPredictionData["partitions"]]: SparsePredictionRow[] };
+    };
+  };
+}
+
+// First-paint slice of the default season (latest.json, format "latest-snapshot-v1"): each model's forecasts from its
+// latest reference date and its nowcasts on its latest date, up to `selectedDate`, and the season's ground truth.
+// The full season files replace it once they are loaded.
+export interface LatestSnapshotFile {
+  format: "latest-snapshot-v1";
+  seasonId: string;
+  selectedDate: string;
+  predictionsData: SparsePredictionsFile;
+  groundTruthData: SeasonGroundTruthColumns;
+  nowcastTrendsData: NowcastTrendsData;
+}
+
 export interface TimeSeriesPartition {
   [referenceDateISO: string]: {
     [stateNum: string]: {
@@ -0,0 +1,52 @@
+import { SeasonActivityLevels } from "@/types/domains/forecasting";
+
+// Per season: forecast level strings keyed by model, reference date, location and target date (built on first lookup)
+const forecastLevelIndexes = new WeakMap<SeasonActivityLevels, Map<string, string>>();
+
+function forecastLevelIndex(season: SeasonActivityLevels): Map<string, string> {
+  let index = forecastLevelIndexes.get(season);
+  if (!index) {
+    index = new Map();
+    const { dates, models } = season.forecasts;
+    for (const [modelName, rows] of Object.entries(models)) {
+      for (const [refIndex, stateNum, targetIndex, levels] of rows) {
+        index.set(`${modelName}|${dates[refIndex]}|${stateNum}|${dates[targetIndex]}`, levels);
+      }
+    }
+    forecastLevelIndexes.set(season, index);
+  }
+  return index;
+}
+
+/**
+ * Returns the activity level of one state's ground truth on a date of the season, or null if the date is not on the season's axis
+ */
+export function groundTruthActivityLevel(season: SeasonActivityLevels | undefined, dateISO: string, stateNum: string): string | null {
+  const levels = season?.groundTruth?.levels?.[stateNum];
+  if (!season || !levels) return null;
+
+  const index = season.groundTruth.dates.indexOf(dateISO);
+  return index < 0 ? null : season.levels[Number(levels[index])];
+}
+
+/**
+ * Returns the activity levels of one forecast by field (median, PI50low, ...), or null if the model has no such forecast
+ */
+export function forecastActivityLevels(
+  season: SeasonActivityLevels | undefined,
+  modelName: string,
+  referenceDateISO: string,
+  stateNum: string,
+  targetDateISO: string
+): { [field: string]: string } | null {
+  if (!season?.forecasts) return null;
+
+  const levels = forecastLevelIndex(season).get(`${modelName}|${referenceDateISO}|${stateNum}|${targetDateISO}`);
+  if (levels === undefined) return null;
+
+  const byField: { [field: string]: string } = {};
+  season.forecasts.fields.forEach((field, i) => {
+    byField[field] = season.levels[Number(levels[i])];
+  });
+  return byField;
+}
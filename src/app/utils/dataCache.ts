@@ -0,0 +1,83 @@
+/**
+ * Persistent (IndexedDB) cache for the published JSON data files.
+ * Entries are keyed by file path and validated against the content hash from manifest.json,
+ * so a returning visitor only downloads the files that changed since their last visit.
+ */
+
+const DB_NAME = "epistorm-data-cache";
+const DB_VERSION = 1;
+const STORE_NAME = "files";
+
+interface CachedFile {
+  path: string;
+  hash: string;
+  data: any;
+}
+
+let dbPromise: Promise<IDBDatabase | null> | null = null;
+
+function openDatabase(): Promise<IDBDatabase | null> {
+  if (dbPromise) return dbPromise;
+
+  dbPromise = new Promise((resolve) => {
+    if (typeof indexedDB === "undefined") {
+      resolve(null);
+      return;
+    }
+
+    try {
+      const request = indexedDB.open(DB_NAME, DB_VERSION);
+      request.onupgradeneeded = () => {
+        if (!request.result.objectStoreNames.contains(STORE_NAME)) {
+          request.result.createObjectStore(STORE_NAME, { keyPath: "path" });
+        }
+      };
+      request.onsuccess = () => resolve(request.result);
+      request.onerror = () => {
+        console.warn("IndexedDB unavailable, data will not be persisted:", request.error);
+        resolve(null);
+      };
+    } catch (error) {
+      console.warn("IndexedDB unavailable, data will not be persisted:", error);
+      resolve(null);
+    }
+  });
+
+  return dbPromise;
+}
+
+/**
+ * Returns the cached data for a file if it was stored with the given content hash
+ */
+export async function getCachedFile(path: string, hash: string): Promise<any | null> {
+  const db = await openDatabase();
+  if (!db) return null;
+
+  return new Promise((resolve) => {
+    try {
+      const request = db.transaction(STORE_NAME, "readonly").objectStore(STORE_NAME).get(path);
+      request.onsuccess = () => {
+        const entry = request.result as CachedFile | undefined;
+        resolve(entry && entry.hash === hash ? entry.data : null);
+      };
+      request.onerror = () => resolve(null);
+    } catch {
+      resolve(null);
+    }
+  });
+}
+
+/**
+ * Stores a file's data with its content hash, replacing any older version
+ */
+export async function putCachedFile(path: string, hash: string, data: any): Promise<void> {
+  const db = await openDatabase();
+  if (!db) return;
+
+  try {
+    const entry: CachedFile = { path, hash, data };
+    db.transaction(STORE_NAME, "readwrite").objectStore(STORE_NAME).put(entry);
+  } catch (error) {
+    console.warn(`Failed to persist ${path} to IndexedDB:`, error);
+  }
+}
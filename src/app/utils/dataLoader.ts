@@ -3,12 +3,73 @@
  * Implements the strategy outlined in DataLoadingOptimizationStrategy.md
  */
 
+import { getCachedFile, putCachedFile } from "@/utils/dataCache";
+import { RawScoresShardIndex } from "@/types/domains/evaluations";
+import { toGroundTruthColumns } from "@/utils/groundTruth";
+import { LatestSnapshotFile, ModelPredictionData, PredictionData, SparsePredictionsFile, TimeSeriesPartition } from "@/types/domains/forecasting";
+
 // Cache for auxiliary data to prevent re-fetching
 let auxiliaryDataCache: any = null;
 
 // Cache for loaded season data
 const seasonDataCache: Map<string, any> = new Map();
 
+// Content hashes of all published data files, keyed by path relative to /data (see manifest.json)
+let manifestPromise: Promise<Record<string, string> | null> | null = null;
+
+/**
+ * Fetch the data manifest (always revalidated, it is the only file that is not content-addressed)
+ */
+export function fetchManifest(): Promise<Record<string, string> | null> {
+  if (manifestPromise) return manifestPromise;
+
+  manifestPromise = fetch("/data/manifest.json", { cache: "no-cache" })
+    .then((res) => (res.ok ? res.json() : null))
+    .then((manifest) => {
+      if (!manifest?.files) return null;
+      const hashes: Record<string, string> = {};
+      Object.entries(manifest.files).forEach(([path, entry]: [string, any]) => {
+        hashes[path] = entry.hash;
+      });
+      return hashes;
+    })
+    .catch((error) => {
+      console.warn("Failed to fetch data manifest, falling back to unversioned requests:", error);
+      return null;
+    });
+
+  return manifestPromise;
+}
+
+/**
+ * Fetch and parse one published data file (path relative to /data).
+ * When the manifest lists the file, the request is versioned by its content hash (so the browser/CDN
+ * can cache it as immutable) and the parsed result is persisted in IndexedDB for later visits.
+ * Files left out of the manifest can pass the hash recorded for them elsewhere (see fetchSeasonRawScoresShard).
+ * Returns null if the file does not exist.
+ */
+export async function fetchDataFile(path: string, versionHash?: string): Promise<any | null> {
+  const hash = versionHash ?? (await fetchManifest())?.[path];
+
+  if (hash) {
+    const cached = await getCachedFile(path, hash);
+    if (cached !== null) {
+      return cached;
+    }
+  }
+
+  const res = await fetch(hash ? `/data/${path}?v=${hash}` : `/data/${path}`);
+  if (!res.ok) {
+    return null;
+  }
+
+  const data = await res.json();
+  if (hash) {
+    putCachedFile(path, hash, data);
+  }
+  return data;
+}
+
 /**
  * Fetch auxiliary data with caching
  */
@@ -21,18 +82,16 @@ export async function fetchAuxiliaryData() {
   console.log("Fetching auxiliary data...");
 
   try {
-    const [locationsRes, thresholdsRes, metadataRes] = await Promise.all([
-      fetch("/data/auxiliary/locationsData.json"),
-      fetch("/data/auxiliary/thresholdsData.json"),
-      fetch("/data/auxiliary/seasonMetadata.json"),
+    const [locations, thresholds, metadata] = await Promise.all([
+      fetchDataFile("auxiliary/locationsData.json"),
+      fetchDataFile("auxiliary/thresholdsData.json"),
+      fetchDataFile("auxiliary/seasonMetadata.json"),
     ]);
 
-    if (!locationsRes.ok || !thresholdsRes.ok || !metadataRes.ok) {
+    if (locations === null || thresholds === null || metadata === null) {
       throw new Error("Failed to fetch auxiliary data");
     }
 
-    const [locations, thresholds, metadata] = await Promise.all([locationsRes.json(), thresholdsRes.json(), metadataRes.json()]);
-
     console.log("Season metadata peek:", metadata);
 
     auxiliaryDataCache = {
@@ -48,6 +107,45 @@ export async function fetchAuxiliaryData() {
   }
 }
 
+/**
+ * Expand a sparse predictionsData.json into the nested shape the selectors read
+ * (partition -> reference date -> location -> predictions by target date).
+ * Only reference dates/locations that have forecasts get an entry.
+ * Files published before the sparse format already have the nested shape and are returned as they are.
+ */
+export function decodeSparsePredictions(sparse: SparsePredictionsFile | PredictionData[string]): PredictionData[string] {
+  if ((sparse as SparsePredictionsFile).format !== "sparse-predictions-v1") {
+    return sparse as PredictionData[string];
+  }
+
+  const { dates, models, firstPredRefDate, lastPredRefDate, lastPredTargetDate } = sparse as SparsePredictionsFile;
+  const decoded: any = { firstPredRefDate, lastPredRefDate, lastPredTargetDate };
+
+  Object.entries(models).forEach(([modelName, model]) => {
+    const partitions: any = {};
+
+    Object.entries(model.partitions).forEach(([partitionName, rows]) => {
+      const partition: TimeSeriesPartition = {};
+      rows.forEach(([refIndex, stateNum, targetIndex, horizon, median, pi50Low, pi50High, pi90Low, pi90High, pi95Low, pi95High]) => {
+        const statesOnDate = partition[dates[refIndex]] || (partition[dates[refIndex]] = {});
+        const stateEntry = statesOnDate[stateNum] || (statesOnDate[stateNum] = { predictions: {} });
+        stateEntry.predictions![dates[targetIndex]] = {
+          horizon,
+          median,
+          PI50: { low: pi50Low, high: pi50High },
+          PI90: { low: pi90Low, high: pi90High },
+          PI95: { low: pi95Low, high: pi95High },
+        };
+      });
+      partitions[partitionName] = partition;
+    });
+
+    decoded[modelName] = { ...model, partitions } as ModelPredictionData;
+  });
+
+  return decoded;
+}
+
 /**
  * Fetch data for a specific season
  * @param seasonId - The season identifier (e.g., "season-2024-2025")
@@ -67,13 +165,12 @@ export async function fetchSeasonData(seasonId: string, dataTypes: string[] = ["
 
   try {
     const fetchPromises = dataTypes.map((dataType) =>
-      fetch(`/data/${folderName}/${dataType}.json`)
-        .then((res) => {
-          if (!res.ok) {
+      fetchDataFile(`${folderName}/${dataType}.json`)
+        .then((data) => {
+          if (data === null) {
             console.warn(`Failed to fetch ${dataType} for ${seasonId}`);
-            return null;
           }
-          return res.json();
+          return data;
         })
         .catch((err) => {
           console.warn(`Error fetching ${dataType} for ${seasonId}:`, err);
@@ -86,7 +183,13 @@ export async function fetchSeasonData(seasonId: string, dataTypes: string[] = ["
     const seasonData = {};
     dataTypes.forEach((dataType, index) => {
       if (results[index] !== null) {
-        seasonData[dataType] = results[index];
+        if (dataType === "predictionsData") {
+          seasonData[dataType] = decodeSparsePredictions(results[index]);
+        } else if (dataType === "groundTruthData") {
+          seasonData[dataType] = toGroundTruthColumns(results[index]);
+        } else {
+          seasonData[dataType] = results[index];
+        }
       }
     });
 
@@ -101,6 +204,29 @@ export async function fetchSeasonData(seasonId: string, dataTypes: string[] = ["
   }
 }
 
+/**
+ * Fetch the latest snapshot (latest.json), the small slice of the default season drawn before its full files arrive.
+ * Returns it in the shape of fetchSeasonData (predictions decoded), or null if it is not published.
+ */
+export async function fetchLatestSnapshot() {
+  try {
+    const snapshot: LatestSnapshotFile | null = await fetchDataFile("latest.json");
+    if (snapshot === null) {
+      return null;
+    }
+
+    return {
+      seasonId: snapshot.seasonId,
+      groundTruthData: snapshot.groundTruthData,
+      predictionsData: decodeSparsePredictions(snapshot.predictionsData),
+      nowcastTrendsData: snapshot.nowcastTrendsData,
+    };
+  } catch (error) {
+    console.warn("Failed to fetch latest snapshot:", error);
+    return null;
+  }
+}
+
 /**
  * Fetch evaluation precalculated data for a specific season
  */
@@ -116,14 +242,13 @@ export async function fetchSeasonEvaluationData(seasonId: string, isCurrentSeaso
   console.log(`Fetching evaluation data for ${folderName}...`);
 
   try {
-    const response = await fetch(`/data/${folderName}/evaluationsPrecalculatedData.json`);
+    const data = await fetchDataFile(`${folderName}/evaluationsPrecalculatedData.json`);
 
-    if (!response.ok) {
+    if (data === null) {
       console.warn(`No evaluation data found for ${seasonId}`);
       return null;
     }
 
-    const data = await response.json();
     seasonDataCache.set(cacheKey, data);
     return data;
   } catch (error) {
@@ -147,14 +272,13 @@ export async function fetchSeasonRawScores(seasonId: string) {
   console.log(`Fetching raw scores for ${folderName}...`);
 
   try {
-    const response = await fetch(`/data/${folderName}/evaluationsRawScoresData.json`);
+    const data = await fetchDataFile(`${folderName}/evaluationsRawScoresData.json`);
 
-    if (!response.ok) {
+    if (data === null) {
       console.warn(`No raw scores found for ${seasonId}`);
       return null;
     }
 
-    const data = await response.json();
     seasonDataCache.set(cacheKey, data);
     return data;
   } catch (error) {
@@ -163,6 +287,53 @@ export async function fetchSeasonRawScores(seasonId: string) {
   }
 }
 
+/**
+ * Fetch the index of a season's per-model/per-state raw score files, or null if the season was published without them.
+ * Only an index listed in the current manifest is trusted: a file left over from an earlier run is ignored.
+ */
+export async function fetchSeasonRawScoresIndex(seasonId: string): Promise<RawScoresShardIndex | null> {
+  const cacheKey = `${seasonId}-rawScoresIndex`;
+
+  if (seasonDataCache.has(cacheKey)) {
+    return seasonDataCache.get(cacheKey);
+  }
+
+  try {
+    const path = `${seasonId}/evaluationsRawScoresIndex.json`;
+    const hash = (await fetchManifest())?.[path];
+    if (!hash) {
+      seasonDataCache.set(cacheKey, null);
+      return null;
+    }
+
+    const index = await fetchDataFile(path, hash);
+    seasonDataCache.set(cacheKey, index);
+    return index;
+  } catch (error) {
+    console.warn(`Error fetching raw scores index for ${seasonId}:`, error);
+    return null;
+  }
+}
+
+/**
+ * Fetch the raw scores of one model and state from a season's split files ({ rawScores: metric -> horizon -> scores }),
+ * or null if the model has no scores for that state
+ */
+export async function fetchSeasonRawScoresShard(seasonId: string, index: RawScoresShardIndex, model: string, stateNum: string) {
+  const hash = index.models[model]?.[stateNum];
+  if (!hash) {
+    return null;
+  }
+
+  const path = index.path.replace("{model}", model).replace("{location}", stateNum);
+  try {
+    return await fetchDataFile(`${seasonId}/${path}`, hash);
+  } catch (error) {
+    console.error(`Error fetching raw scores of ${model} / ${stateNum} for ${seasonId}:`, error);
+    return null;
+  }
+}
+
 /**
  * Fetch dynamic time period evaluation data
  */
@@ -177,13 +348,12 @@ export async function fetchDynamicTimePeriodData(periodId: string) {
   console.log(`Fetching dynamic time period data for ${periodId}...`);
 
   try {
-    const response = await fetch(`/data/dynamic-time-periods/${periodId}.json`);
+    const data = await fetchDataFile(`dynamic-time-periods/${periodId}.json`);
 
-    if (!response.ok) {
+    if (data === null) {
       throw new Error(`Failed to fetch dynamic period ${periodId}`);
     }
 
-    const data = await response.json();
     seasonDataCache.set(cacheKey, data);
     return data;
   } catch (error) {
@@ -206,13 +376,12 @@ export async function fetchHistoricalGroundTruthData() {
   console.log("Fetching historical ground truth data...");
 
   try {
-    const response = await fetch("/data/historical-ground-truth-data/historical-ground-truth-data.json");
+    const data = await fetchDataFile("historical-ground-truth-data/historical-ground-truth-data.json");
 
-    if (!response.ok) {
+    if (data === null) {
       throw new Error("Failed to fetch historical ground truth data");
     }
 
-    const data = await response.json();
     seasonDataCache.set(cacheKey, data);
     return data;
   } catch (error) {
@@ -0,0 +1,102 @@
+import { SeasonGroundTruthColumns, SurveillanceSingleWeekDataPoint } from "@/types/domains/forecasting";
+
+// groundTruthData.json as published before the columnar format: date -> location -> values
+type NestedSeasonGroundTruth = {
+  [dateISO: string]: { [stateNum: string]: { admissions: number; weeklyRate: number } };
+};
+
+/**
+ * Returns a season's ground truth in the columnar format. Files published before it (nested by date, then location)
+ * are converted: dates without any entry are dropped, and a location that was not reported on a date, or only
+ * reported with the admissions placeholder (-1), is marked missing with the placeholders admissions -1 / weeklyRate 0.
+ */
+export function toGroundTruthColumns(season: SeasonGroundTruthColumns | NestedSeasonGroundTruth): SeasonGroundTruthColumns {
+  if ((season as SeasonGroundTruthColumns).format === "ground-truth-columns-v1") {
+    return season as SeasonGroundTruthColumns;
+  }
+
+  const nested = season as NestedSeasonGroundTruth;
+  const dates = Object.keys(nested)
+    .filter((dateISO) => Object.keys(nested[dateISO]).length > 0)
+    .sort();
+  const stateNums = Array.from(new Set(dates.flatMap((dateISO) => Object.keys(nested[dateISO]))));
+
+  const columns: SeasonGroundTruthColumns = { format: "ground-truth-columns-v1", dates, admissions: {}, weeklyRate: {}, missing: {} };
+  stateNums.forEach((stateNum) => {
+    const admissions: number[] = [];
+    const weeklyRate: number[] = [];
+    const missing: number[] = [];
+    dates.forEach((dateISO) => {
+      const entry = nested[dateISO][stateNum];
+      const reported = entry !== undefined && entry.admissions >= 0;
+      admissions.push(reported ? entry.admissions : -1);
+      weeklyRate.push(reported ? entry.weeklyRate : 0);
+      missing.push(reported ? 0 : 1);
+    });
+    columns.admissions[stateNum] = admissions;
+    columns.weeklyRate[stateNum] = weeklyRate;
+    columns.missing[stateNum] = missing;
+  });
+  return columns;
+}
+
+/**
+ * Returns the index of the first date on a season's (sorted) date axis that is not before `date`
+ */
+function lowerBound(dates: string[], date: Date): number {
+  let lo = 0;
+  let hi = dates.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (new Date(dates[mid]) < date) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  return lo;
+}
+
+/**
+ * Slices one state's ground truth series between two dates (inclusive), straight from the season's columns
+ */
+export function groundTruthSeriesInRange(
+  season: SeasonGroundTruthColumns | undefined,
+  stateNum: string,
+  startDate: Date,
+  endDate: Date
+): SurveillanceSingleWeekDataPoint[] {
+  const admissions = season?.admissions?.[stateNum];
+  if (!season || !admissions) return [];
+
+  const weeklyRate = season.weeklyRate[stateNum];
+  const points: SurveillanceSingleWeekDataPoint[] = [];
+  for (let i = lowerBound(season.dates, startDate); i < season.dates.length; i++) {
+    const date = new Date(season.dates[i]);
+    if (date > endDate) break;
+    points.push({
+      date,
+      stateNum,
+      stateName: "", // Would need location data for full name, skip for now
+      admissions: admissions[i],
+      weeklyRate: weeklyRate[i],
+    });
+  }
+  return points;
+}
+
+/**
+ * Returns one state's ground truth on a date of the season, or null if the date is not on the season's axis
+ */
+export function groundTruthOnDate(
+  season: SeasonGroundTruthColumns | undefined,
+  dateISO: string,
+  stateNum: string
+): { admissions: number; weeklyRate: number } | null {
+  const admissions = season?.admissions?.[stateNum];
+  if (!season || !admissions) return null;
+
+  const index = season.dates.indexOf(dateISO);
+  if (index < 0) return null;
+  return { admissions: admissions[index], weeklyRate: season.weeklyRate[stateNum][index] };
+}